@@ -0,0 +1 @@
+"""Benchmarks of CLint."""
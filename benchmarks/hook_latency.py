@@ -0,0 +1,283 @@
+"""Benchmark of the latency added by the git 'commit-msg' hook."""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from clint import __version__
+from clint.hook_handler import HookHandler
+
+MESSAGE = "feat(hook): measure the latency of the git hook"
+PERCENTILES = (50, 95, 99)
+VARIANTS = {
+    "clint": HookHandler.COMMAND,
+    "clint-hook": "clint-hook $1",
+    "daemon": "clint-hook $1",
+}
+DAEMON_VARIANTS = {"daemon"}
+DAEMON_TIMEOUT = 10.0
+
+
+def percentile(samples: List[float], rank: int) -> float:
+    """
+    Get a percentile of samples, by the nearest rank method.
+
+    Parameters
+    ----------
+    samples: list of float
+        Measured values.
+    rank: int
+        Percentile, from 0 to 100.
+
+    Returns
+    -------
+    float
+        Smallest sample greater than or equal to the given percent of samples.
+    """
+    ordered = sorted(samples)
+    index = max(0, -(-rank * len(ordered) // 100) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+@contextmanager
+def repository() -> Iterator[Dict[str, str]]:
+    """
+    Create a throwaway git repository, isolated from the user git configuration.
+
+    Yields
+    ------
+    dict
+        Environment of the git commands run in the repository, which is the
+        current working directory until the context exits. Its daemon socket
+        does not exist, so hook clients validate in process.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="clint-hook-") as path:
+        env = dict(
+            os.environ,
+            HOME=path,
+            GIT_CONFIG_NOSYSTEM="1",
+            GIT_AUTHOR_NAME="CLint",
+            GIT_AUTHOR_EMAIL="clint@example.com",
+            GIT_COMMITTER_NAME="CLint",
+            GIT_COMMITTER_EMAIL="clint@example.com",
+            CLINT_SOCKET=os.path.join(path, "clint.sock"),
+            CLINT_CACHE_DIR=os.path.join(path, "cache"),
+        )
+        env["PATH"] = os.pathsep.join(
+            [os.path.dirname(sys.executable), env.get("PATH", "")]
+        )
+        repo = os.path.join(path, "repo")
+        subprocess.run(["git", "init", "-q", repo], env=env, check=True)
+        os.chdir(repo)
+        try:
+            yield env
+        finally:
+            os.chdir(cwd)
+
+
+@contextmanager
+def daemon(env: Dict[str, str]) -> Iterator[Dict[str, str]]:
+    """
+    Run the validation daemon next to the socket of the environment.
+
+    Parameters
+    ----------
+    env: dict
+        Environment of the repository.
+
+    Yields
+    ------
+    dict
+        Environment of the repository, with the socket of the running daemon.
+    """
+    socket_path = os.path.join(os.path.dirname(env["CLINT_SOCKET"]), "daemon.sock")
+    with subprocess.Popen(
+        ["clint", "daemon", "--socket", socket_path],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    ) as process:
+        try:
+            deadline = time.monotonic() + DAEMON_TIMEOUT
+            while not os.path.exists(socket_path):
+                if process.poll() is not None or time.monotonic() > deadline:
+                    raise RuntimeError("The validation daemon did not start.")
+                time.sleep(0.05)
+            yield dict(env, CLINT_SOCKET=socket_path)
+        finally:
+            process.terminate()
+
+
+def install(command: Optional[str]) -> None:
+    """
+    Install the hook of the repository in the current working directory.
+
+    Parameters
+    ----------
+    command: str, optional
+        Command of the hook. The plain hook is installed by the hook handler,
+        and no hook is installed if not defined.
+    """
+    handler = HookHandler()
+    if handler.hook_filepath.is_file():
+        os.remove(handler.hook_filepath)
+    if command == HookHandler.COMMAND:
+        handler.enable()
+    elif command is not None:
+        with open(handler.hook_filepath, mode="w", encoding="utf8") as hook_file:
+            hook_file.write(f"#!/bin/sh\n{command}\n")
+        os.chmod(handler.hook_filepath, 0o755)
+
+
+def commit(env: Dict[str, str]) -> float:
+    """
+    Time one commit in the repository of the current working directory.
+
+    Parameters
+    ----------
+    env: dict
+        Environment of the repository.
+
+    Returns
+    -------
+    float
+        Seconds of the `git commit` run.
+
+    Raises
+    ------
+    RuntimeError
+        If the commit fails, with the output of git and the hook.
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        ["git", "commit", "-q", "--allow-empty", "-m", MESSAGE],
+        env=env,
+        check=False,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    seconds = time.perf_counter() - start
+    if process.returncode:
+        raise RuntimeError(process.stdout.decode("utf8", errors="replace"))
+    return seconds
+
+
+def sample(
+    env: Dict[str, str], runs: int, envs: Dict[str, Dict[str, str]]
+) -> Dict[str, List[float]]:
+    """
+    Time the commits without hook and with every variant, after one warm up.
+
+    Parameters
+    ----------
+    env: dict
+        Environment of the repository.
+    runs: int
+        Number of timed commits of every variant.
+    envs: dict
+        Environment of the repository by name of the hook variants.
+
+    Returns
+    -------
+    dict
+        Seconds of every commit by variant name, and without hook by `none`.
+    """
+    envs = {"none": env, **envs}
+    samples: Dict[str, List[float]] = {name: [] for name in envs}
+    for run_number in range(runs + 1):
+        for name, variant_env in envs.items():
+            install(VARIANTS.get(name))
+            seconds = commit(variant_env)
+            if run_number:
+                samples[name].append(seconds)
+    return samples
+
+
+def run(runs: int, variants: List[str]) -> Dict[str, Any]:
+    """
+    Run the benchmark of every hook variant.
+
+    Commits without hook and with every variant are interleaved, so the drift
+    of the machine affects all of them alike. The added latency of every commit
+    with hook is measured against the median commit without hook.
+
+    Parameters
+    ----------
+    runs: int
+        Number of timed commits of every variant.
+    variants: list of str
+        Names of the hook variants.
+
+    Returns
+    -------
+    dict
+        Benchmark environment, median commit without hook, and percentiles of
+        the added latency by variant name, in milliseconds.
+    """
+    with repository() as env:
+        for executable in {VARIANTS[variant].split()[0] for variant in variants}:
+            if shutil.which(executable, path=env["PATH"]) is None:
+                raise RuntimeError(f"'{executable}' is not installed.")
+        envs = {variant: env for variant in variants if variant not in DAEMON_VARIANTS}
+        if DAEMON_VARIANTS.intersection(variants):
+            with daemon(env) as daemon_env:
+                envs.update(
+                    {variant: daemon_env for variant in DAEMON_VARIANTS & set(variants)}
+                )
+                samples = sample(env, runs, envs)
+        else:
+            samples = sample(env, runs, envs)
+    baseline = percentile(samples.pop("none"), 50)
+    results = {
+        variant: {
+            f"p{rank}": round(
+                1000 * percentile([seconds - baseline for seconds in values], rank), 2
+            )
+            for rank in PERCENTILES
+        }
+        for variant, values in samples.items()
+    }
+    return {
+        "clint": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": runs,
+        "baseline_ms": round(1000 * baseline, 2),
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark, printing the added latency of every hook variant."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=50, help="Commits by variant.")
+    parser.add_argument(
+        "--variant",
+        dest="variants",
+        action="append",
+        choices=sorted(VARIANTS),
+        help="Hook variant to measure, every one if not defined.",
+    )
+    parser.add_argument("--output", help="JSON file of the results.")
+    args = parser.parse_args()
+    report = run(args.runs, args.variants or list(VARIANTS))
+    print(f"git commit without hook: {report['baseline_ms']:.1f} ms")
+    for variant, latencies in report["results"].items():
+        print(
+            f"{variant}: "
+            + ", ".join(f"{rank} +{value:.1f} ms" for rank, value in latencies.items())
+        )
+    if args.output:
+        with open(args.output, mode="w", encoding="utf8") as file:
+            file.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark of the memory used by parsed commits."""
+import argparse
+import gc
+import random
+import tracemalloc
+from typing import List
+
+from faker import Faker
+
+from clint.validator import Commit, Subject
+
+
+def corpus(size: int, seed: int = 0) -> List[str]:
+    """
+    Get a corpus of conventional commit messages.
+
+    Parameters
+    ----------
+    size: int
+        Number of messages.
+    seed: int
+        Seed of the random generators, for reproducible corpora.
+
+    Returns
+    -------
+    list of str
+        Commit messages, with bodies and footers in some of them.
+    """
+    faker = Faker()
+    faker.seed_instance(seed)
+    rand = random.Random(seed)
+    types = sorted(Subject.VALID_COMMIT_TYPES)
+    scopes = [faker.word() for _ in range(20)]
+    messages = []
+    for _ in range(size):
+        scope = f"({rand.choice(scopes)})" if rand.random() < 0.5 else ""
+        description = faker.sentence().rstrip(".").lower()
+        message = f"{rand.choice(types)}{scope}: {description}"
+        if rand.random() < 0.5:
+            message += f"\n\n{faker.paragraph()}"
+        if rand.random() < 0.3:
+            message += f"\n\nRefs #{rand.randint(1, 9999)}"
+        messages.append(message)
+    return messages
+
+
+def bytes_per_commit(messages: List[str]) -> float:
+    """
+    Get the mean memory used by a parsed commit, without its message.
+
+    Parameters
+    ----------
+    messages: list of str
+        Commit messages.
+
+    Returns
+    -------
+    float
+        Mean of traced bytes per parsed commit.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    commits = [Commit.generate(msg=message) for message in messages]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / len(commits)
+
+
+def main() -> None:
+    """Run the benchmark, printing the bytes per parsed commit."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000, help="Corpus size.")
+    parser.add_argument("--seed", type=int, default=0, help="Corpus seed.")
+    args = parser.parse_args()
+    messages = corpus(args.size, args.seed)
+    print(f"{bytes_per_commit(messages):.1f} bytes per parsed commit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""Benchmark of the validation throughput over synthetic corpora."""
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from faker import Faker
+
+from clint import __version__
+from clint.validator import Subject, validate, validate_many
+
+from .memory import corpus
+
+CORPORA = ("valid", "long_bodies", "many_footers", "adversarial", "non_ascii")
+MODES = ("single", "batch", "parallel")
+NON_ASCII_LOCALES = ["es_ES", "de_DE", "ru_RU", "el_GR"]
+ADVERSARIAL_SUBJECTS = [
+    lambda size: "a" * size + "!?",
+    lambda size: "feat(" + "a" * size + "!",
+    lambda size: "feat:" + " " * size + "?",
+    lambda size: "feat: " + "a " * (size // 2) + "?",
+]
+
+
+def corpora(size: int, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Get the corpora of commit messages of the benchmark.
+
+    Parameters
+    ----------
+    size: int
+        Number of messages of every corpus.
+    seed: int
+        Seed of the random generators, for reproducible corpora.
+
+    Returns
+    -------
+    dict
+        Commit messages by corpus name: valid messages, long bodies, many
+        footers, adversarial subjects and non ASCII text.
+    """
+    faker = Faker()
+    faker.seed_instance(seed)
+    rand = random.Random(seed)
+    types = sorted(Subject.VALID_COMMIT_TYPES)
+    long_bodies = [
+        f"{rand.choice(types)}: {faker.sentence().rstrip('.').lower()}\n\n"
+        + "\n\n".join(faker.paragraph(nb_sentences=20) for _ in range(10))
+        for _ in range(size)
+    ]
+    many_footers = [
+        f"{rand.choice(types)}: {faker.sentence().rstrip('.').lower()}\n\n"
+        + f"{faker.paragraph()}\n\n"
+        + "\n".join(
+            f"{faker.word().capitalize()}-by: {faker.name()}" for _ in range(50)
+        )
+        for _ in range(size)
+    ]
+    adversarial = [
+        rand.choice(ADVERSARIAL_SUBJECTS)(rand.randint(100, 1000)) for _ in range(size)
+    ]
+    localized = Faker(NON_ASCII_LOCALES)
+    localized.seed_instance(seed)
+    non_ascii = [
+        f"{rand.choice(types)}({localized.word()}): "
+        + f"{localized.sentence().rstrip('.').lower()}\n\n{localized.paragraph()}"
+        for _ in range(size)
+    ]
+    return {
+        "valid": corpus(size, seed),
+        "long_bodies": long_bodies,
+        "many_footers": many_footers,
+        "adversarial": adversarial,
+        "non_ascii": non_ascii,
+    }
+
+
+def runner(mode: str, jobs: int) -> Callable[[List[str]], Any]:
+    """
+    Get the function that validates a corpus in a mode.
+
+    Parameters
+    ----------
+    mode: str
+        One message at a time (single), in one process (batch), or in worker
+        processes (parallel).
+    jobs: int
+        Number of worker processes of the parallel mode. Zero or less means one
+        per CPU.
+
+    Returns
+    -------
+    callable
+        Function that validates every message of a corpus.
+    """
+    if mode == "single":
+        return lambda messages: [validate(message=message) for message in messages]
+    if mode == "batch":
+        return lambda messages: list(validate_many(iter(messages)))
+    return lambda messages: list(validate_many(iter(messages), jobs=jobs))
+
+
+def measure(
+    function: Callable[[List[str]], Any], messages: List[str], repeat: int
+) -> Dict[str, float]:
+    """
+    Measure the throughput and peak memory of a validation function.
+
+    Parameters
+    ----------
+    function: callable
+        Function that validates every message of a corpus.
+    messages: list of str
+        Corpus of commit messages.
+    repeat: int
+        Number of timed runs, the fastest one is kept.
+
+    Returns
+    -------
+    dict
+        Messages per second of the fastest run, and peak traced bytes of one more
+        run, only in this process.
+    """
+    function(messages)
+    seconds = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(messages)
+        seconds.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function(messages)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "messages_per_second": len(messages) / min(seconds),
+        "peak_bytes": peak,
+    }
+
+
+def run(size: int, seed: int, repeat: int, jobs: int) -> Dict[str, Any]:
+    """
+    Run the benchmark over every corpus and mode.
+
+    Parameters
+    ----------
+    size: int
+        Number of messages of every corpus.
+    seed: int
+        Seed of the corpora.
+    repeat: int
+        Number of timed runs of every measure.
+    jobs: int
+        Number of worker processes of the parallel mode.
+
+    Returns
+    -------
+    dict
+        Benchmark environment, and measures by corpus and mode name.
+    """
+    results = {}
+    for name, messages in corpora(size, seed).items():
+        for mode in MODES:
+            results[f"{name}/{mode}"] = measure(runner(mode, jobs), messages, repeat)
+            print(
+                f"{name}/{mode}: "
+                + f"{results[f'{name}/{mode}']['messages_per_second']:.0f} msg/s, "
+                + f"{results[f'{name}/{mode}']['peak_bytes'] / 1024:.0f} KiB peak",
+                file=sys.stderr,
+            )
+    return {
+        "clint": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "size": size,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float
+) -> List[str]:
+    """
+    Compare the measures of a benchmark run with the ones of a baseline run.
+
+    Parameters
+    ----------
+    baseline: dict
+        Baseline run, as saved by the run command.
+    current: dict
+        Current run, as saved by the run command.
+    tolerance: float
+        Relative change allowed before a measure is a regression.
+
+    Returns
+    -------
+    list of str
+        Description of every regression: less messages per second, or more
+        peak memory, than allowed.
+    """
+    regressions = []
+    for name, measures in sorted(current["results"].items()):
+        expected = baseline["results"].get(name)
+        if expected is None:
+            continue
+        throughput = measures["messages_per_second"] / expected["messages_per_second"]
+        if throughput < 1 - tolerance:
+            regressions.append(
+                f"{name}: {1 - throughput:.1%} less messages per second."
+            )
+        memory = measures["peak_bytes"] / max(expected["peak_bytes"], 1)
+        if memory > 1 + tolerance:
+            regressions.append(f"{name}: {memory - 1:.1%} more peak memory.")
+    return regressions
+
+
+def main() -> None:
+    """Run the benchmark, or compare a run with a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmark.")
+    run_parser.add_argument("--size", type=int, default=1000, help="Corpus size.")
+    run_parser.add_argument("--seed", type=int, default=0, help="Corpus seed.")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Timed runs.")
+    run_parser.add_argument(
+        "--jobs", type=int, default=0, help="Parallel mode processes, 0 per CPU."
+    )
+    run_parser.add_argument("--output", help="JSON file of the results.")
+    compare_parser = commands.add_parser(
+        "compare", help="Compare a run with a baseline run."
+    )
+    compare_parser.add_argument("baseline", help="JSON file of the baseline run.")
+    compare_parser.add_argument("current", help="JSON file of the current run.")
+    compare_parser.add_argument(
+        "--tolerance", type=float, default=0.1, help="Allowed relative change."
+    )
+    args = parser.parse_args()
+    if args.command == "run":
+        report = json.dumps(run(args.size, args.seed, args.repeat, args.jobs), indent=2)
+        if args.output:
+            with open(args.output, mode="w", encoding="utf8") as file:
+                file.write(report + "\n")
+        else:
+            print(report)
+        return
+    with open(args.baseline, mode="r", encoding="utf8") as file:
+        baseline = json.load(file)
+    with open(args.current, mode="r", encoding="utf8") as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.tolerance)
+    for regression in regressions:
+        print(regression)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
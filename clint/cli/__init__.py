@@ -1,3 +1,16 @@
 """Command line interface classes."""
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .command import Command
+if TYPE_CHECKING:
+    from .command import Command
+    from .fast import FastPath
+
+LAZY_ATTRIBUTES = {"Command": ".command", "FastPath": ".fast"}
+
+
+def __getattr__(name: str):
+    """Import command line classes on first use, so click is loaded on demand."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
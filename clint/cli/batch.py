@@ -0,0 +1,77 @@
+"""Batch records reader for the command line interface."""
+import json
+from typing import Iterator, NamedTuple, Optional, TextIO, Union
+
+
+class BatchRecord(NamedTuple):
+    """Commit message record read from a batch stream."""
+
+    id: str
+    message: Optional[Union[str, bytes]]
+    error: Optional[str] = None
+
+
+class BatchReader:  # pylint: disable=too-few-public-methods
+    """Class that reads commit message records from a stream."""
+
+    FORMATS = ("nul", "ndjson")
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, stream: TextIO, input_format: str = "nul"):
+        self.stream = stream
+        self.input_format = input_format
+
+    def __iter__(self) -> Iterator[BatchRecord]:
+        """Iterate over the records of the stream."""
+        if self.input_format == "ndjson":
+            return self._read_ndjson()
+        return self._read_nul()
+
+    def _read_nul(self) -> Iterator[BatchRecord]:
+        """
+        Read NUL delimited messages, identified by their position.
+
+        Messages are read as bytes from the underlying binary stream, if any, so
+        the validator decodes them and checks their encoding.
+        """
+        stream = getattr(self.stream, "buffer", self.stream)
+        index = 0
+        parts = []
+        chunk = stream.read(self.CHUNK_SIZE)
+        empty = chunk[:0]
+        separator = "\0" if isinstance(chunk, str) else b"\0"
+        while chunk:
+            *messages, tail = chunk.split(separator)
+            if messages:
+                messages[0] = empty.join(parts) + messages[0]
+                parts.clear()
+            for message in messages:
+                index += 1
+                yield BatchRecord(id=str(index), message=message)
+            parts.append(tail)
+            chunk = stream.read(self.CHUNK_SIZE)
+        message = empty.join(parts)
+        if message.strip():
+            yield BatchRecord(id=str(index + 1), message=message)
+
+    def _read_ndjson(self) -> Iterator[BatchRecord]:
+        """Read JSON objects with 'id' and 'message' keys, one per line."""
+        for index, line in enumerate(self.stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                message = record["message"]
+            except (ValueError, TypeError, KeyError) as exc:
+                yield BatchRecord(
+                    id=str(index), message=None, error=f"Invalid record: {exc}"
+                )
+                continue
+            if not isinstance(message, str):
+                yield BatchRecord(
+                    id=str(record.get("id", index)),
+                    message=None,
+                    error="Invalid record: 'message' is not a string.",
+                )
+                continue
+            yield BatchRecord(id=str(record.get("id", index)), message=message)
@@ -1,66 +1,432 @@
 """CLint command line interface."""
+import json
 import logging
 import sys
-from typing import TextIO
+from typing import Iterable, Optional, TextIO, Tuple, Union
 
 import click
 
 from .. import __version__
-from ..result import Result
+from ..history import HistoryException, HistoryStats, Ledger
+from ..report import REPORTERS, Reporter, TextReporter
+from ..result import Result, Stats
+from ..trace import Tracer
+from ..validator import BatchSummary, ResultCache, rules_digest
+from .batch import BatchReader
+from .group import DefaultGroup
+from .message import MessageReader
 from .runner import Runner
 
 
 class Command:
     """Command class for CLI arguments parsing."""
 
+    STATS_FORMATS = ("table", "json")
+
     @staticmethod
     # pylint: disable=unused-argument
-    def get_message(ctx: click.Context, param: click.Parameter, value: str) -> str:
-        """Get the commit message, from parameter value or from stdin stream."""
-        stdin = click.get_text_stream("stdin")
-        if not value and not stdin.isatty():
-            return stdin.read().strip()
+    def get_message(
+        ctx: click.Context, param: click.Parameter, value: str
+    ) -> Optional[Union[str, MessageReader]]:
+        """Get the commit message, from parameter value or a reader of stdin stream."""
+        stdin = click.get_text_stream("stdin", errors="surrogateescape")
+        if not value and not ctx.params.get("batch") and not stdin.isatty():
+            reader = MessageReader(stream=stdin, strip=True)
+            return None if reader.is_empty() else reader
         return value
 
     @staticmethod
-    @click.command()
+    @click.group(
+        cls=DefaultGroup,
+        default_command="validate",
+        subcommand_metavar="[MESSAGE] | COMMAND [ARGS]...",
+    )
+    @click.version_option(__version__)
+    def entrypoint():
+        """CLint: A Conventional Commits Linter for your shell."""
+
+    @staticmethod
+    @click.command("validate")
     @click.argument(
         "message", callback=get_message.__func__, type=click.STRING, required=False
     )
     @click.option(
         "-f",
         "--file",
-        type=click.File(),
+        type=click.File(errors="surrogateescape"),
         help="File path containing the commit message.",
     )
+    @click.option(
+        "--batch",
+        is_flag=True,
+        is_eager=True,
+        help="Validate many records, from stdin or from file.",
+    )
+    @click.option(
+        "--input-format",
+        type=click.Choice(BatchReader.FORMATS),
+        default=BatchReader.FORMATS[0],
+        show_default=True,
+        help="Format of the records in batch mode.",
+    )
+    @click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=0),
+        default=1,
+        show_default=True,
+        help="Worker processes for batch mode, 0 for one per CPU.",
+    )
+    @click.option(
+        "--unordered",
+        is_flag=True,
+        help="Show batch results as soon as they are ready, not in input order.",
+    )
+    @click.option(
+        "--reporter",
+        type=click.Choice(tuple(REPORTERS)),
+        default=TextReporter.NAME,
+        show_default=True,
+        help="Format of the results, only in batch mode.",
+    )
+    @click.option(
+        "--cache",
+        "cache_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="SQLite file to share memoized results between runs and processes.",
+    )
+    @click.option(
+        "--fail-fast",
+        is_flag=True,
+        help="Stop every validation at its first error.",
+    )
+    @click.option(
+        "--stats",
+        is_flag=True,
+        help="Show the calls, findings and time of the parsing and of every rule, "
+        + "on stderr. Results reused from the cache are not counted.",
+    )
+    @click.option(
+        "--stats-format",
+        type=click.Choice(STATS_FORMATS),
+        default=STATS_FORMATS[0],
+        show_default=True,
+        help="Format of the stats.",
+    )
+    @click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Trace-event JSON file to write the spans of reading, validating, "
+        + "caching and writing, per process.",
+    )
     @click.option(
         "--enable-hook/--disable-hook",
         default=None,
         help="Enable/Disable CLint as a handler for git 'commit-msg' hook.",
     )
     @click.version_option(__version__)
-    def entrypoint(
-        message: click.STRING,
+    def validate(
+        message: Union[str, MessageReader],
         file: TextIO,
+        batch: click.BOOL,
+        input_format: click.STRING,
+        jobs: click.INT,
+        unordered: click.BOOL,
+        reporter: click.STRING,
+        cache_path: click.STRING,
+        fail_fast: click.BOOL,
+        stats: click.BOOL,
+        stats_format: click.STRING,
+        trace_path: click.STRING,
         enable_hook: click.BOOL,
-    ):
-        """CLint: A Conventional Commits Linter for your shell."""
+    ):  # pylint: disable=too-many-arguments,too-many-locals
+        """Validate a commit message (default command)."""
         result: Result = None
         logging.info("enable_hook: %s", enable_hook)
+        if reporter != TextReporter.NAME and not batch:
+            raise click.UsageError("--reporter is only available in batch mode.")
+        Command.exit_on_config_error()
+        if stats:
+            Runner.measure()
+        if trace_path:
+            Runner.start_trace(trace_path)
+        if batch:
+            stream = file or click.get_text_stream("stdin")
+            records = BatchReader(stream=stream, input_format=input_format)
+            cache = ResultCache(path=cache_path)
+            summary = Command.show_batch_results(
+                Runner.validate_batch(
+                    records,
+                    jobs=jobs,
+                    ordered=not unordered,
+                    cache=cache,
+                    fail_fast=fail_fast,
+                    stats=stats,
+                    trace=bool(trace_path),
+                ),
+                reporter=Command.get_reporter(name=reporter),
+            )
+            cache.close()
+            Runner.stop_trace()
+            if stats:
+                Command.show_stats(stats=summary.stats, stats_format=stats_format)
+            sys.exit(summary.return_code)
         if enable_hook is None:
-            if message:
-                result = Runner.validate(message=message)
+            if isinstance(message, MessageReader):
+                result = Runner.validate_stream(reader=message, fail_fast=fail_fast)
+            elif message:
+                result = Runner.validate(message=message, fail_fast=fail_fast)
             elif file:
-                result = Runner.validate(message=file.read())
+                result = Runner.validate_stream(
+                    reader=MessageReader(stream=file), fail_fast=fail_fast
+                )
             else:
                 result = Runner.help()
         else:
             result = Runner.change_hook_handler(is_enabling=enable_hook)
         Command.show_result(result=result)
+        Runner.stop_trace()
+        if stats:
+            Command.show_stats(stats=result.stats, stats_format=stats_format)
         sys.exit(result.return_code)
 
     @staticmethod
-    def show_result(result: Result):
-        """Print result values to the user."""
-        for action, message in result.actions.items():
-            click.echo(f"{action}: {message}")
+    @click.command("log")
+    @click.argument("rev_range", default="HEAD", type=click.STRING)
+    @click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=0),
+        default=1,
+        show_default=True,
+        help="Worker processes, 0 for one per CPU.",
+    )
+    @click.option(
+        "--unordered",
+        is_flag=True,
+        help="Show results as soon as they are ready, not in git log order.",
+    )
+    @click.option(
+        "--reporter",
+        type=click.Choice(tuple(REPORTERS)),
+        default=TextReporter.NAME,
+        show_default=True,
+        help="Format of the results. Only the text one skips compliant commits.",
+    )
+    @click.option(
+        "--ledger",
+        "use_ledger",
+        is_flag=True,
+        help="Skip commits already validated with the same rules, and record "
+        + "the compliant ones in the git directory.",
+    )
+    @click.option(
+        "--cache",
+        "cache_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="SQLite file to share memoized results between runs and processes.",
+    )
+    @click.option(
+        "--fail-fast",
+        is_flag=True,
+        help="Stop every validation at its first error.",
+    )
+    @click.option(
+        "--stats",
+        is_flag=True,
+        help="Show the calls, findings and time of the parsing and of every rule, "
+        + "on stderr. Results reused from the cache are not counted.",
+    )
+    @click.option(
+        "--stats-format",
+        type=click.Choice(STATS_FORMATS),
+        default=STATS_FORMATS[0],
+        show_default=True,
+        help="Format of the stats.",
+    )
+    @click.option(
+        "--trace",
+        "trace_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Trace-event JSON file to write the spans of reading, validating, "
+        + "caching and writing, per process.",
+    )
+    def log(
+        rev_range: click.STRING,
+        jobs: click.INT,
+        unordered: click.BOOL,
+        reporter: click.STRING,
+        use_ledger: click.BOOL,
+        cache_path: click.STRING,
+        fail_fast: click.BOOL,
+        stats: click.BOOL,
+        stats_format: click.STRING,
+        trace_path: click.STRING,
+    ):  # pylint: disable=too-many-arguments,too-many-locals
+        """Validate every commit message in a git revision range."""
+        Command.exit_on_config_error()
+        if stats:
+            Runner.measure()
+        if trace_path:
+            Runner.start_trace(trace_path)
+        ledger = Ledger(digest=rules_digest()) if use_ledger else None
+        cache = ResultCache(path=cache_path)
+        try:
+            summary = Command.show_batch_results(
+                Runner.validate_log(
+                    rev_range=rev_range,
+                    jobs=jobs,
+                    ordered=not unordered,
+                    ledger=ledger,
+                    cache=cache,
+                    fail_fast=fail_fast,
+                    stats=stats,
+                    trace=bool(trace_path),
+                ),
+                reporter=Command.get_reporter(name=reporter, only_failures=True),
+            )
+        except HistoryException as exc:
+            result = Runner.history_error(exc)
+            Command.show_result(result=result, err=reporter != TextReporter.NAME)
+            sys.exit(result.return_code)
+        finally:
+            cache.close()
+            Runner.stop_trace()
+        skipped = f", {ledger.hits} skipped" if ledger is not None else ""
+        click.echo(
+            f"{summary.total} commits validated, {summary.failed} failed{skipped}.",
+            err=reporter != TextReporter.NAME,
+        )
+        if stats:
+            Command.show_stats(stats=summary.stats, stats_format=stats_format)
+        sys.exit(summary.return_code)
+
+    @staticmethod
+    @click.command("stats")
+    @click.argument("rev_range", default="HEAD", type=click.STRING)
+    @click.option(
+        "-j",
+        "--jobs",
+        type=click.IntRange(min=0),
+        default=1,
+        show_default=True,
+        help="Worker processes, 0 for one per CPU.",
+    )
+    @click.option(
+        "--bucket",
+        type=click.Choice(HistoryStats.BUCKETS),
+        default="month",
+        show_default=True,
+        help="Time buckets of the compliance rate, by commit date in UTC.",
+    )
+    @click.option(
+        "--top",
+        type=click.IntRange(min=1),
+        default=10,
+        show_default=True,
+        help="Number of types, scopes, failing actions and authors to show.",
+    )
+    @click.option(
+        "--format",
+        "output_format",
+        type=click.Choice(STATS_FORMATS),
+        default=STATS_FORMATS[0],
+        show_default=True,
+        help="Format of the statistics.",
+    )
+    def stats(
+        rev_range: click.STRING,
+        jobs: click.INT,
+        bucket: click.STRING,
+        top: click.INT,
+        output_format: click.STRING,
+    ):
+        """Show statistics of the commit messages in a git revision range."""
+        Command.exit_on_config_error()
+        history, result = Runner.history_stats(
+            rev_range=rev_range, jobs=jobs, bucket=bucket, top=top
+        )
+        if result.return_code:
+            Command.show_result(result=result)
+            sys.exit(result.return_code)
+        if output_format == "json":
+            click.echo(json.dumps(history.to_dict()))
+        else:
+            click.echo("\n".join(history.tables()))
+        sys.exit(result.return_code)
+
+    @staticmethod
+    @click.command("daemon")
+    @click.option(
+        "--socket",
+        "socket_path",
+        type=click.Path(dir_okay=False),
+        default=None,
+        help="Unix domain socket path. Defaults to a per user socket.",
+    )
+    def daemon(socket_path: click.STRING):
+        """Keep validators warm behind a Unix domain socket for git hooks."""
+        result = Runner.serve_daemon(socket_path=socket_path)
+        Command.show_result(result=result)
+        sys.exit(result.return_code)
+
+    @staticmethod
+    def exit_on_config_error():
+        """Apply the project configuration, exiting if it is not valid."""
+        result = Runner.load_config()
+        if result is not None:
+            Command.show_result(result=result)
+            sys.exit(result.return_code)
+
+    @staticmethod
+    def show_result(result: Result, err: bool = False):
+        """Print result values to the user, on stderr if err is set."""
+        for diagnostic in result.diagnostics():
+            click.echo(f"{diagnostic.action}: {diagnostic.message}", err=err)
+
+    @staticmethod
+    def show_stats(stats: Optional[Stats], stats_format: str):
+        """Print the stats of the validations to the user, on stderr."""
+        stats = stats or Stats()
+        if stats_format == "json":
+            click.echo(json.dumps(stats.to_dict()), err=True)
+        else:
+            for line in stats.table():
+                click.echo(line, err=True)
+
+    @staticmethod
+    def get_reporter(name: str, only_failures: bool = False) -> Reporter:
+        """Get the reporter of batch results to stdout, by its name."""
+        stream = click.get_text_stream("stdout")
+        if name == TextReporter.NAME:
+            return TextReporter(stream=stream, only_failures=only_failures)
+        return REPORTERS[name](stream=stream)
+
+    @staticmethod
+    def show_batch_results(
+        results: Iterable[Tuple[str, Result]], reporter: Reporter
+    ) -> BatchSummary:
+        """Report batch result values to the user, as soon as they are available."""
+        summary = BatchSummary()
+        reporter.start()
+        try:
+            for record_id, result in results:
+                start = Tracer.clock()
+                reporter.add(record_id, summary.add(result))
+                Tracer.span("write", "output", start)
+        finally:
+            # Write the results reported before an error of the input.
+            reporter.flush()
+        reporter.finish(summary)
+        return summary
+
+
+Command.entrypoint.add_command(Command.validate)
+Command.entrypoint.add_command(Command.log)
+Command.entrypoint.add_command(Command.stats)
+Command.entrypoint.add_command(Command.daemon)
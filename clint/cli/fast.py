@@ -0,0 +1,71 @@
+"""Lean command line entry point for git 'commit-msg' hook invocations."""
+import os
+import sys
+from typing import List, Optional
+
+
+class FastPath:
+    """Class that validates hook invocations without loading click."""
+
+    FILE_OPTIONS = ("-f", "--file")
+    MAX_SIZE = 1024 * 1024
+
+    @staticmethod
+    def is_hook_invocation(args: List[str]) -> bool:
+        """
+        Indicate if the arguments are the ones used by the git hook.
+
+        Parameters
+        ----------
+        args: list of str
+            Command line arguments, without the program name.
+
+        Returns
+        -------
+        bool:
+            True for exactly one file option followed by a file path.
+        """
+        return len(args) == 2 and args[0] in FastPath.FILE_OPTIONS and args[1] != "-"
+
+    @staticmethod
+    def read(path: str) -> Optional[str]:
+        """
+        Get the commit message of a hook file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the commit message file.
+
+        Returns
+        -------
+        str, optional
+            Commit message, with the bytes that are not valid UTF-8 escaped as
+            surrogates. None if the file cannot be read, or is larger than
+            `MAX_SIZE` bytes, to be streamed by the command instead.
+        """
+        try:
+            if os.path.getsize(path) > FastPath.MAX_SIZE:
+                return None
+            with open(
+                path, mode="r", encoding="utf8", errors="surrogateescape"
+            ) as file:
+                return file.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def main(argv: Optional[List[str]] = None) -> None:
+        """CLint: A Conventional Commits Linter for your shell."""
+        args = sys.argv[1:] if argv is None else argv
+        message = FastPath.read(args[1]) if FastPath.is_hook_invocation(args) else None
+        if message is not None:
+            from ..daemon.client import (  # pylint: disable=import-outside-toplevel
+                Client,
+            )
+
+            Client.exit_with(Client().validate(message=message))
+        from .command import Command  # pylint: disable=import-outside-toplevel
+
+        # pylint: disable=no-value-for-parameter,unexpected-keyword-arg
+        Command.entrypoint(args=args)
@@ -0,0 +1,25 @@
+"""Click group with a default command."""
+from typing import List
+
+import click
+
+
+class DefaultGroup(click.Group):
+    """Group of commands that falls back to a default command."""
+
+    def __init__(self, *args, default_command: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.default_command = default_command
+
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        """Parse arguments, using the default command if none was given."""
+        group_options = [opt for param in self.get_params(ctx) for opt in param.opts]
+        if not args or (args[0] not in self.commands and args[0] not in group_options):
+            args = [self.default_command, *args]
+        return super().parse_args(ctx, args)
+
+    def format_options(self, ctx: click.Context, formatter: click.HelpFormatter):
+        """Write the default command options and the available commands."""
+        command = self.get_command(ctx, self.default_command)
+        command.format_options(ctx, formatter)
+        self.format_commands(ctx, formatter)
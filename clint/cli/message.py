@@ -0,0 +1,68 @@
+"""Commit message reader for the command line interface."""
+import re
+from functools import partial
+from itertools import islice
+from typing import Iterator, List, Optional, TextIO
+
+from ..validator.scanner import Scanner
+
+SURROGATE_ESCAPES = re.compile("[\udc80-\udcff]")
+
+
+class MessageReader:
+    """
+    Class that reads one commit message from a stream, in chunks.
+
+    Streams are expected to be decoded with the `surrogateescape` error handler,
+    so messages that are not valid UTF-8 keep their bytes. Messages up to
+    `WHOLE_SIZE` characters can be read whole, to be validated as bytes. Larger
+    ones are never read whole, so the validation memory is bounded by their
+    longest paragraph, and their invalid bytes are replaced. Stripped messages
+    lose their leading and trailing whitespaces, like messages given as argument
+    do.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    WHOLE_SIZE = 1024 * 1024
+
+    def __init__(self, stream: TextIO, strip: bool = False):
+        chunks = iter(partial(stream.read, self.CHUNK_SIZE), "")
+        self._chunks = Scanner.strip_chunks(chunks) if strip else chunks
+        self._head: List[str] = []
+
+    def is_empty(self) -> bool:
+        """Indicate if the message is empty, reading its first chunk if needed."""
+        if not self._head:
+            self._head = list(islice(self._chunks, 1))
+        return not self._head
+
+    def read_whole(self) -> Optional[bytes]:
+        """
+        Read the whole message, if it is not larger than `WHOLE_SIZE` characters.
+
+        Returns
+        -------
+        bytes, optional
+            Raw message, with the bytes that are not valid UTF-8. None if the
+            message is larger, to be iterated in chunks instead.
+        """
+        size = sum(len(chunk) for chunk in self._head)
+        for chunk in self._chunks:
+            self._head.append(chunk)
+            size += len(chunk)
+            if size > self.WHOLE_SIZE:
+                return None
+        return "".join(self._head).encode("utf8", errors="surrogateescape")
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the chunks of the message, replacing invalid bytes."""
+        head, self._head = self._head, []
+        for chunk in head:
+            yield self._replace(chunk)
+        for chunk in self._chunks:
+            yield self._replace(chunk)
+
+    @staticmethod
+    def _replace(chunk: str) -> str:
+        """Replace the escaped bytes of a chunk, as decoding raw messages does."""
+        return chunk if chunk.isascii() else SURROGATE_ESCAPES.sub("\ufffd", chunk)
@@ -1,9 +1,25 @@
 """CLint runner."""
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple
+
 import click
 
 from .. import validator
+from ..config import Config, ConfigException
+from ..daemon import Daemon, DaemonException
+from ..history import (
+    CommitFacts,
+    GitLog,
+    HistoryException,
+    HistoryStats,
+    Ledger,
+    LogEntry,
+)
 from ..hook_handler import HookException, HookHandler
 from ..result import Result
+from ..trace import Tracer
+from .batch import BatchRecord
+from .message import MessageReader
 
 
 class Runner:
@@ -13,27 +29,200 @@ class Runner:
     def help() -> Result:
         """Show default help message."""
         ctx = click.get_current_context()
-        click.echo(ctx.get_help())
+        click.echo(ctx.find_root().get_help())
         return Result(operation="Help", base_error_code=0)
 
     @staticmethod
-    def validate(message: str) -> Result:
-        """Validate commit message."""
+    def load_config() -> Optional[Result]:
+        """Apply the project configuration, getting the result of its errors."""
         try:
-            commit = validator.Commit.generate(msg=message)
-            result = commit.validate()
-        except validator.GenerationException as exc:
-            return Result(
+            Config.load()
+        except ConfigException as exc:
+            return Config.result(exc)
+        return None
+
+    @staticmethod
+    def measure(enabled: bool = True) -> None:
+        """Start or stop counting the parsing and the rules of every validation."""
+        validator.RuleRegistry.time(enabled=enabled)
+
+    @staticmethod
+    def start_trace(path: str) -> None:
+        """Start recording the spans of the validations into a trace-event file."""
+        Tracer.start(path)
+
+    @staticmethod
+    def stop_trace() -> None:
+        """Stop recording the spans of the validations, closing the file if any."""
+        Tracer.stop()
+
+    @staticmethod
+    def init_worker(stats: bool = False, trace: bool = False) -> None:
+        """Prepare a worker process, applying the project configuration."""
+        Config.load()
+        if stats:
+            Runner.measure()
+        if trace:
+            Tracer.enable(process_name="clint worker")
+
+    @staticmethod
+    def validate(message: str, fail_fast: bool = False) -> Result:
+        """Validate commit message."""
+        return validator.validate(message=message, fail_fast=fail_fast)
+
+    @staticmethod
+    def validate_stream(reader: MessageReader, fail_fast: bool = False) -> Result:
+        """Validate commit message read as bytes, or in chunks if too large."""
+        data = reader.read_whole()
+        if data is not None:
+            return validator.validate(message=data, fail_fast=fail_fast)
+        return validator.validate_stream(chunks=reader, fail_fast=fail_fast)
+
+    @staticmethod
+    def validate_message(
+        message: str,
+        cache: Optional[validator.ResultCache] = None,
+        fail_fast: bool = False,
+    ) -> Result:
+        """Validate commit message, through the cache if defined."""
+        if cache is None:
+            return validator.validate(message=message, fail_fast=fail_fast)
+        return cache.validate(message=message, fail_fast=fail_fast)
+
+    @staticmethod
+    def validate_record(
+        record: BatchRecord,
+        cache: Optional[validator.ResultCache] = None,
+        fail_fast: bool = False,
+    ) -> Tuple[str, Result]:
+        """Validate a commit message record."""
+        if record.error is not None:
+            return record.id, Result(
                 operation=validator.OPERATION_NAME,
                 base_error_code=validator.OPERATION_BASE_ERROR_CODE,
-            ).add_action(action="generation", message=str(exc), is_error=True)
-        except validator.ValidationException as exc:
+            ).add_action(action="record", message=record.error, is_error=True)
+        return record.id, Runner.validate_message(
+            message=record.message, cache=cache, fail_fast=fail_fast
+        )
+
+    @staticmethod
+    def validate_entry(
+        entry: LogEntry,
+        cache: Optional[validator.ResultCache] = None,
+        fail_fast: bool = False,
+    ) -> Tuple[str, Result]:
+        """Validate a commit read from the git history."""
+        return entry.sha, Runner.validate_message(
+            message=entry.message, cache=cache, fail_fast=fail_fast
+        )
+
+    @staticmethod
+    def validate_batch(  # pylint: disable=too-many-arguments
+        records: Iterable[BatchRecord],
+        jobs: int = 1,
+        ordered: bool = True,
+        cache: Optional[validator.ResultCache] = None,
+        fail_fast: bool = False,
+        stats: bool = False,
+        trace: bool = False,
+    ) -> Iterator[Tuple[str, Result]]:
+        """Validate a batch of commit message records, lazily."""
+        pool = validator.ParallelValidator(
+            jobs=jobs,
+            ordered=ordered,
+            initializer=partial(Runner.init_worker, stats, trace),
+        )
+        if trace:
+            records = Tracer.iterate(records, "read", "input")
+        function = partial(Runner.validate_record, cache=cache, fail_fast=fail_fast)
+        yield from pool.map(function, records)
+
+    @staticmethod
+    def validate_log(  # pylint: disable=too-many-arguments
+        rev_range: str,
+        jobs: int = 1,
+        ordered: bool = True,
+        ledger: Optional[Ledger] = None,
+        cache: Optional[validator.ResultCache] = None,
+        fail_fast: bool = False,
+        stats: bool = False,
+        trace: bool = False,
+    ) -> Iterator[Tuple[str, Result]]:
+        """
+        Validate the commit messages of a git revision range, lazily.
+
+        Commits found in the ledger are skipped, and compliant commits are added.
+        Git errors are raised as HistoryException once the results read before
+        them are yielded, to be reported with the history_error method.
+        """
+        pool = validator.ParallelValidator(
+            jobs=jobs,
+            ordered=ordered,
+            initializer=partial(Runner.init_worker, stats, trace),
+        )
+        try:
+            entries = iter(GitLog(rev_range=rev_range))
+            if ledger is not None:
+                ledger.open()
+                entries = (entry for entry in entries if entry.sha not in ledger)
+            function = partial(Runner.validate_entry, cache=cache, fail_fast=fail_fast)
+            for sha, result in pool.map(function, entries):
+                if ledger is not None and not result.return_code:
+                    ledger.add(sha)
+                yield sha, result
+        finally:
+            if ledger is not None:
+                ledger.close()
+
+    @staticmethod
+    def history_stats(
+        rev_range: str, jobs: int = 1, bucket: str = "month", top: int = 10
+    ) -> Tuple[HistoryStats, Result]:
+        """Aggregate the statistics of a git revision range, in a single pass."""
+        history = HistoryStats(bucket=bucket, top=top)
+        result = Result(
+            operation=GitLog.OPERATION_NAME,
+            base_error_code=validator.OPERATION_BASE_ERROR_CODE,
+        )
+        pool = validator.ParallelValidator(
+            jobs=jobs, ordered=False, initializer=Runner.init_worker
+        )
+        try:
+            for facts in pool.map(
+                CommitFacts.of, GitLog(rev_range=rev_range, details=True)
+            ):
+                history.add(facts)
+        except HistoryException as exc:
+            result = Runner.history_error(exc)
+        return history, result
+
+    @staticmethod
+    def history_error(exc: HistoryException) -> Result:
+        """Get the result of a git error, failing the whole history."""
+        return Result(
+            operation=GitLog.OPERATION_NAME,
+            base_error_code=validator.OPERATION_BASE_ERROR_CODE,
+        ).add_action(action="log", message=str(exc), is_error=True)
+
+    @staticmethod
+    def serve_daemon(socket_path: Optional[str] = None) -> Result:
+        """Serve validations through a Unix domain socket until interrupted."""
+        daemon = Daemon(socket_path=socket_path)
+        try:
+            daemon.serve()
+        except DaemonException as exception:
             return Result(
-                operation=validator.OPERATION_NAME,
-                base_error_code=validator.OPERATION_BASE_ERROR_CODE,
-            ).add_action(action="validation", message=str(exc), is_error=True)
-        else:
-            return result
+                operation=Daemon.OPERATION_NAME,
+                base_error_code=Daemon.OPERATION_BASE_ERROR_CODE,
+            ).add_action(action="daemon", message=str(exception), is_error=True)
+        return Result(
+            operation=Daemon.OPERATION_NAME,
+            base_error_code=Daemon.OPERATION_BASE_ERROR_CODE,
+        ).add_action(
+            action="daemon",
+            message=f"Daemon stopped at {daemon.socket_path}",
+            is_error=False,
+        )
 
     @staticmethod
     def change_hook_handler(is_enabling: bool) -> Result:
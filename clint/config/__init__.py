@@ -0,0 +1,4 @@
+"""Project configuration classes."""
+
+from .config import Config
+from .exceptions import ConfigException
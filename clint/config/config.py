@@ -0,0 +1,351 @@
+"""Project configuration from pyproject.toml or .clint.toml files."""
+import hashlib
+import marshal
+import os
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from ..result import Result
+from ..validator import Commit, RuleException, RuleRegistry, cache_directory
+from .exceptions import ConfigException
+
+Settings = Dict[str, Any]
+Stamp = Tuple[int, int]
+PYPROJECT_FILENAME = "pyproject.toml"
+# Lines that may define the clint table: `[tool.clint]`, `[tool.clint.*]` and
+# `tool.clint.*` keys, or a `[tool]` table or `tool` key, which may hold it.
+CLINT_TABLE = re.compile(
+    r'^[ \t]*\[*[ \t]*"?tool"?[ \t]*(?:\.[ \t]*"?clint\b|\]|=)', re.MULTILINE
+)
+
+
+class Config:
+    """
+    Class that finds, parses and applies the project configuration.
+
+    The configuration is the `[tool.clint]` table of a pyproject.toml file, or
+    the whole .clint.toml file, from the nearest directory up from the working
+    directory. Parsed files are cached by path, modification time and size, in
+    memory and in the directory of the compiled rules, so hooks do not parse
+    TOML on every commit, and long running processes reload only changed files.
+    """
+
+    OPERATION_NAME = "Config"
+    OPERATION_BASE_ERROR_CODE = 240
+    FILENAMES = (".clint.toml", PYPROJECT_FILENAME)
+    CACHE_FILENAME = "config-{digest}.bin"
+    LISTS = ("types", "scopes", "enable", "disable", "plugins")
+    NUMBERS = ("max-subject-length", "max-length")
+    TABLES = ("rules",)
+    _parsed: Dict[str, Tuple[Stamp, Optional[Settings]]] = {}
+    _applied: Optional[Tuple[str, Stamp]] = None
+    _baseline: Optional[Tuple[Dict[str, Any], Optional[int]]] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load(directory: Optional[str] = None) -> Optional[str]:
+        """
+        Find the project configuration and apply it, if it changed.
+
+        Parameters
+        ----------
+        directory: str, optional
+            Directory to start the search from. The working directory if not
+            defined.
+
+        Returns
+        -------
+        str, optional
+            Path of the applied configuration file. None if there is none.
+
+        Raises
+        ------
+        ConfigException
+            If the configuration file is not valid.
+        """
+        with Config._lock:
+            found = Config.find(directory)
+            key = None if found is None else found[:2]
+            if key != Config._applied:
+                if found is not None or Config._baseline is not None:
+                    Config._applied = None
+                    Config.apply({} if found is None else found[2])
+                Config._applied = key
+        return None if found is None else found[0]
+
+    @staticmethod
+    def find(
+        directory: Optional[str] = None,
+    ) -> Optional[Tuple[str, Stamp, Settings]]:
+        """
+        Find the nearest configuration file, up from a directory.
+
+        Parameters
+        ----------
+        directory: str, optional
+            Directory to start the search from. The working directory if not
+            defined.
+
+        Returns
+        -------
+        tuple, optional
+            Path, modification stamp and settings of the configuration file.
+            None if there is none.
+
+        Raises
+        ------
+        ConfigException
+            If the configuration file is not valid.
+        """
+        current = os.path.abspath(directory or os.getcwd())
+        while True:
+            for filename in Config.FILENAMES:
+                path = os.path.join(current, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                settings = Config.read(path, stamp)
+                if settings is not None:
+                    return path, stamp, settings
+            parent = os.path.dirname(current)
+            if parent == current:
+                return None
+            current = parent
+
+    @staticmethod
+    def read(path: str, stamp: Stamp) -> Optional[Settings]:
+        """
+        Get the settings of a configuration file, parsing it only if it changed.
+
+        Parameters
+        ----------
+        path: str
+            Path of the configuration file.
+        stamp: tuple of int
+            Modification time, in nanoseconds, and size of the file.
+
+        Returns
+        -------
+        dict, optional
+            Settings of the file. None for pyproject.toml files without a
+            `[tool.clint]` table.
+
+        Raises
+        ------
+        ConfigException
+            If the configuration file is not valid.
+        """
+        parsed = Config._parsed.get(path)
+        if parsed is None or parsed[0] != stamp:
+            cache_path = os.path.join(
+                cache_directory(),
+                Config.CACHE_FILENAME.format(
+                    digest=hashlib.sha256(path.encode("utf8")).hexdigest()[:32]
+                ),
+            )
+            parsed = Config._load_cache(cache_path, path)
+            if parsed is None or parsed[0] != stamp:
+                parsed = (stamp, Config.parse(path))
+                Config._save_cache(cache_path, path, parsed)
+            Config._parsed[path] = parsed
+        return parsed[1]
+
+    @staticmethod
+    def _load_cache(
+        cache_path: str, path: str
+    ) -> Optional[Tuple[Stamp, Optional[Settings]]]:
+        """Get the cached settings of a configuration file, if available."""
+        try:
+            with open(cache_path, mode="rb") as file:
+                cached_path, stamp, settings = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if cached_path != path:
+            return None
+        return tuple(stamp), settings
+
+    @staticmethod
+    def _save_cache(
+        cache_path: str, path: str, parsed: Tuple[Stamp, Optional[Settings]]
+    ) -> None:
+        """Cache the settings of a configuration file, if possible."""
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            data = marshal.dumps((path, *parsed))
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, mode="wb") as file:
+                file.write(data)
+            os.replace(temp_path, cache_path)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def parse(path: str) -> Optional[Settings]:
+        """
+        Parse and check the settings of a configuration file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the configuration file.
+
+        Returns
+        -------
+        dict, optional
+            Settings of the file. None for pyproject.toml files without a
+            `[tool.clint]` table, which are not parsed if they do not mention it.
+
+        Raises
+        ------
+        ConfigException
+            If the file cannot be read, or its settings are not valid.
+        """
+        try:
+            with open(path, mode="r", encoding="utf8") as file:
+                text = file.read()
+        except (OSError, ValueError) as exc:
+            raise ConfigException(f"Unable to read '{path}': {exc}") from exc
+        is_pyproject = os.path.basename(path) == PYPROJECT_FILENAME
+        if is_pyproject and not CLINT_TABLE.search(text):
+            return None
+        # pylint: disable=import-outside-toplevel
+        try:
+            import tomllib as toml  # type: ignore
+        except ImportError:
+            try:
+                import tomli as toml  # type: ignore
+            except ImportError:
+                try:
+                    import toml  # type: ignore
+                except ImportError as exc:
+                    raise ConfigException(
+                        f"Reading '{path}' needs Python 3.11+ or the tomli package."
+                    ) from exc
+        try:
+            data = toml.loads(text)
+        except ValueError as exc:
+            raise ConfigException(f"Unable to read '{path}': {exc}") from exc
+        if is_pyproject:
+            data = data.get("tool", {}).get("clint")
+            if data is None:
+                return None
+        Config.check(data, path)
+        return data
+
+    @staticmethod
+    def check(settings: Settings, path: str) -> None:
+        """
+        Check the keys and types of the settings of a configuration file.
+
+        Parameters
+        ----------
+        settings: dict
+            Settings of the file.
+        path: str
+            Path of the configuration file, for the error messages.
+
+        Raises
+        ------
+        ConfigException
+            If any key is unknown, or any value has a wrong type.
+        """
+        for key, value in settings.items():
+            if key in Config.LISTS:
+                valid = isinstance(value, list) and all(
+                    isinstance(item, str) for item in value
+                )
+                kind = "a list of strings"
+            elif key in Config.NUMBERS:
+                valid = isinstance(value, int) and not isinstance(value, bool)
+                valid = valid and value > 0
+                kind = "a positive integer"
+            elif key in Config.TABLES:
+                valid = isinstance(value, dict) and all(
+                    isinstance(item, dict) for item in value.values()
+                )
+                kind = "a table of tables"
+            else:
+                raise ConfigException(f"Key '{key}' in '{path}' is not valid.")
+            if not valid:
+                raise ConfigException(f"Key '{key}' in '{path}' must be {kind}.")
+
+    @staticmethod
+    def apply(settings: Settings) -> None:
+        """
+        Apply settings over the rules, from the state before any configuration.
+
+        Parameters
+        ----------
+        settings: dict
+            Checked settings of a configuration file.
+
+        Raises
+        ------
+        ConfigException
+            If a plugin cannot be imported, or a rule is not registered. The
+            rules are left as before any configuration.
+        """
+        try:
+            if Config._baseline is None:
+                Config._baseline = (RuleRegistry.snapshot(), Commit.MAX_LENGTH)
+            else:
+                Config.restore()
+            RuleRegistry.load_plugins(settings.get("plugins", ()))
+            if "types" in settings:
+                types = tuple(sorted(set(settings["types"])))
+                RuleRegistry.configure("subject.type_valid", types=types)
+            if "scopes" in settings:
+                scopes = tuple(sorted(set(settings["scopes"])))
+                RuleRegistry.configure("subject.scope_valid", scopes=scopes)
+                RuleRegistry.enable("subject.scope_valid")
+            if "max-subject-length" in settings:
+                max_length = settings["max-subject-length"]
+                RuleRegistry.configure("subject.subject_length", max_length=max_length)
+                RuleRegistry.enable("subject.subject_length")
+            if "max-length" in settings:
+                Commit.MAX_LENGTH = settings["max-length"]
+            for name, options in settings.get("rules", {}).items():
+                RuleRegistry.configure(
+                    name,
+                    **{
+                        key: tuple(value) if isinstance(value, list) else value
+                        for key, value in options.items()
+                    },
+                )
+            for name in settings.get("enable", ()):
+                RuleRegistry.enable(name)
+            for name in settings.get("disable", ()):
+                RuleRegistry.disable(name)
+        except RuleException as exc:
+            Config.restore()
+            raise ConfigException(str(exc)) from exc
+
+    @staticmethod
+    def restore() -> None:
+        """Restore the rules to their state before any configuration, if any."""
+        if Config._baseline is not None:
+            RuleRegistry.restore(Config._baseline[0])
+            Commit.MAX_LENGTH = Config._baseline[1]
+
+    @staticmethod
+    def result(exc: ConfigException) -> Result:
+        """
+        Get the result of a configuration error.
+
+        Parameters
+        ----------
+        exc: ConfigException
+            Configuration error.
+
+        Returns
+        -------
+        Result:
+            Result with the error as its only action.
+        """
+        return Result(
+            operation=Config.OPERATION_NAME,
+            base_error_code=Config.OPERATION_BASE_ERROR_CODE,
+        ).add_action(action="config", message=str(exc), is_error=True)
@@ -0,0 +1,6 @@
+"""Exceptions for config package."""
+from clint.exceptions import ClintException
+
+
+class ConfigException(ClintException):
+    """Generic config exception."""
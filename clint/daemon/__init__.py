@@ -0,0 +1,18 @@
+"""Validation daemon classes."""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from .client import Client
+from .exceptions import DaemonException
+
+if TYPE_CHECKING:
+    from .server import Daemon
+
+LAZY_ATTRIBUTES = {"Daemon": ".server"}
+
+
+def __getattr__(name: str):
+    """Import the daemon server on first use, so hook clients stay light."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
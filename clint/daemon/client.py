@@ -0,0 +1,133 @@
+"""Client for the validation daemon, with in-process fallback."""
+import json
+import os
+import socket
+import sys
+from typing import List, Optional
+
+from ..result import Result
+
+
+class Client:
+    """Class that sends commit messages to the validation daemon."""
+
+    TIMEOUT = 2.0
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or Client.default_socket_path()
+
+    @staticmethod
+    def default_socket_path() -> str:
+        """
+        Get the default path of the daemon socket.
+
+        Returns
+        -------
+        str:
+            CLINT_SOCKET environment variable if defined. Otherwise, a per user
+            socket in the runtime directory or in the temporary directory.
+        """
+        if os.environ.get("CLINT_SOCKET"):
+            return os.environ["CLINT_SOCKET"]
+        if os.environ.get("XDG_RUNTIME_DIR"):
+            return os.path.join(os.environ["XDG_RUNTIME_DIR"], "clint.sock")
+        import tempfile  # pylint: disable=import-outside-toplevel
+
+        uid = os.getuid() if hasattr(os, "getuid") else 0
+        return os.path.join(tempfile.gettempdir(), f"clint-{uid}.sock")
+
+    def request(self, message: str) -> Optional[Result]:
+        """
+        Validate a commit message in the daemon.
+
+        The daemon finds the configuration from the working directory of this
+        process, as the in-process validation does.
+
+        Parameters
+        ----------
+        message: str
+            Commit message, with the bytes that are not valid UTF-8 escaped as
+            surrogates.
+
+        Returns
+        -------
+        Result, optional
+            Result of the validation. None if the daemon is not available or
+            does not validate the message, such as when it is too large.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+        data = message.encode("utf8", errors="surrogateescape")
+        header = {"size": len(data), "cwd": os.getcwd()}
+        header_line = json.dumps(header).encode("utf8") + b"\n"
+        chunks = []
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.settimeout(self.TIMEOUT)
+                conn.connect(self.socket_path)
+                conn.sendall(header_line + data)
+                conn.shutdown(socket.SHUT_WR)
+                chunk = conn.recv(self.BUFFER_SIZE)
+                while chunk:
+                    chunks.append(chunk)
+                    chunk = conn.recv(self.BUFFER_SIZE)
+        except OSError:
+            return None
+        try:
+            reply = json.loads(b"".join(chunks))
+            return None if "error" in reply else Result.from_dict(reply)
+        except (ValueError, TypeError, KeyError):
+            return None
+
+    def validate(self, message: str) -> Result:
+        """
+        Validate a commit message in the daemon, or in this process as fallback.
+
+        Parameters
+        ----------
+        message: str
+            Commit message, with the bytes that are not valid UTF-8 escaped as
+            surrogates. It is validated as bytes, as the daemon does.
+
+        Returns
+        -------
+        Result:
+            Result of the validation.
+        """
+        result = self.request(message=message)
+        if result is None:
+            # pylint: disable=import-outside-toplevel
+            from .. import validator
+            from ..config import Config, ConfigException
+
+            try:
+                Config.load()
+            except ConfigException as exc:
+                return Config.result(exc)
+            result = validator.validate(
+                message=message.encode("utf8", errors="surrogateescape")
+            )
+        return result
+
+    @staticmethod
+    def exit_with(result: Result) -> None:
+        """Print result values to the user and exit with the result return code."""
+        sys.stdout.write(
+            "".join(
+                f"{diagnostic.action}: {diagnostic.message}\n"
+                for diagnostic in result.diagnostics()
+            )
+        )
+        sys.exit(result.return_code)
+
+    @staticmethod
+    def main(argv: Optional[List[str]] = None) -> None:
+        """Validate the commit message file given by git 'commit-msg' hook."""
+        args = sys.argv[1:] if argv is None else argv
+        if len(args) != 1:
+            sys.stderr.write("usage: clint-hook FILE\n")
+            sys.exit(2)
+        with open(args[0], mode="r", encoding="utf8", errors="surrogateescape") as file:
+            message = file.read()
+        Client.exit_with(Client().validate(message=message))
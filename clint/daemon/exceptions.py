@@ -0,0 +1,6 @@
+"""Exceptions for daemon package."""
+from clint.exceptions import ClintException
+
+
+class DaemonException(ClintException):
+    """Generic daemon exception."""
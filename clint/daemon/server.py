@@ -0,0 +1,148 @@
+"""Validation daemon over a Unix domain socket."""
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+from typing import Any, Dict, Optional
+
+from .. import validator
+from ..config import Config, ConfigException
+from .client import Client
+from .exceptions import DaemonException
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handler that validates one commit message per connection.
+
+    Requests are a JSON header line, with the size of the message in bytes and
+    the working directory of the client, followed by the message. The message is
+    validated with the configuration found from that directory, as the one of
+    the daemon may belong to another project. Replies are the JSON result of the
+    validation, or a JSON object with an error, for requests that are not
+    validated, such as messages larger than `MAX_REQUEST_SIZE`. Requests are
+    read concurrently, but validated one at a time, as the configuration of
+    every request changes the rules of the whole process.
+    """
+
+    MAX_HEADER_SIZE = 64 * 1024
+    MAX_REQUEST_SIZE = 16 * 1024 * 1024
+    _lock = threading.Lock()
+
+    def handle(self) -> None:
+        """Read the header and the message, and reply."""
+        try:
+            header = json.loads(self.rfile.readline(self.MAX_HEADER_SIZE))
+            size = int(header["size"])
+            directory = header["cwd"]
+        except (ValueError, TypeError, KeyError):
+            self.reply({"error": "Invalid request header."})
+            return
+        if not isinstance(directory, str):
+            self.reply({"error": "Invalid request header."})
+            return
+        if not 0 <= size <= self.MAX_REQUEST_SIZE:
+            self.reply(
+                {"error": f"Message size must be up to {self.MAX_REQUEST_SIZE} bytes."}
+            )
+            return
+        data = self.rfile.read(size)
+        if len(data) != size:
+            self.reply({"error": "Incomplete message."})
+            return
+        with RequestHandler._lock:
+            try:
+                Config.load(directory=directory)
+            except ConfigException as exc:
+                result = Config.result(exc)
+            else:
+                result = validator.validate(message=data)
+        self.reply(result.to_dict())
+
+    def reply(self, data: Dict[str, Any]) -> None:
+        """
+        Write the reply to the client.
+
+        Parameters
+        ----------
+        data: dict
+            Serializable reply, as a result or an error.
+        """
+        self.wfile.write(json.dumps(data).encode("utf8"))
+
+
+class Daemon:
+    """Class that keeps the validators warm behind a Unix domain socket."""
+
+    OPERATION_NAME = "Daemon"
+    OPERATION_BASE_ERROR_CODE = 220
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or Client.default_socket_path()
+        self.server: Optional[socketserver.BaseServer] = None
+
+    def _remove_stale_socket(self) -> None:
+        """
+        Remove the socket file if no daemon is listening on it.
+
+        Raises
+        ------
+        DaemonException
+            If another daemon is listening on the socket.
+        """
+        if not os.path.exists(self.socket_path):
+            return
+        if Client(socket_path=self.socket_path).request(message="") is not None:
+            raise DaemonException(f"Daemon already running at {self.socket_path}")
+        os.remove(self.socket_path)
+
+    def bind(self) -> socketserver.BaseServer:
+        """
+        Create the server listening on the socket, only for the current user.
+
+        Returns
+        -------
+        socketserver.BaseServer
+            Server ready to serve requests.
+
+        Raises
+        ------
+        DaemonException
+            If Unix domain sockets are not supported or the socket is in use.
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            raise DaemonException("Unix domain sockets are not supported.")
+        self._remove_stale_socket()
+        previous_umask = os.umask(0o177)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(
+                self.socket_path, RequestHandler
+            )
+        except OSError as exc:
+            raise DaemonException(f"Unable to listen at {self.socket_path}") from exc
+        finally:
+            os.umask(previous_umask)
+        return self.server
+
+    def serve(self) -> None:
+        """
+        Serve requests until the process is interrupted or terminated.
+
+        Raises
+        ------
+        DaemonException
+            If the daemon cannot listen on the socket.
+        """
+        server = self.bind()
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
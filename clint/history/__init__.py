@@ -0,0 +1,6 @@
+"""Git history classes."""
+
+from .analytics import CommitFacts, HistoryStats, SpaceSaving
+from .exceptions import HistoryException
+from .ledger import Ledger
+from .log import GitLog, LogEntry
@@ -0,0 +1,341 @@
+"""Aggregate statistics of a git history, in a single streaming pass."""
+import heapq
+from datetime import datetime, timezone
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+from ..validator import ParseFailure, ValidationException, parse_and_check
+from .log import LogEntry
+
+BREAKING_TOKENS = ("BREAKING CHANGE", "BREAKING-CHANGE")
+DAY_SECONDS = 24 * 60 * 60
+
+
+class SpaceSaving:
+    """
+    Class that counts the most frequent keys of a stream, in bounded memory.
+
+    Implements the Space-Saving algorithm: at most `capacity` keys are counted,
+    and a new key replaces the least counted one, taking its count as error.
+    Counts are exact while there are no more distinct keys than the capacity,
+    and overestimated by at most their error otherwise. The least counted key is
+    found through a heap of one entry per key, whose counts are only updated when
+    they reach its top.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._counters: Dict[str, List[int]] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, key: str, count: int = 1) -> None:
+        """
+        Count the occurrences of a key.
+
+        Parameters
+        ----------
+        key: str
+            Key to count.
+        count: int
+            Number of occurrences.
+        """
+        counter = self._counters.get(key)
+        if counter is not None:
+            counter[0] += count
+            return
+        if len(self._counters) < self.capacity:
+            self._counters[key] = [count, 0]
+        else:
+            minimum = self._pop_minimum()
+            self._counters[key] = [minimum + count, minimum]
+        heapq.heappush(self._heap, (self._counters[key][0], key))
+
+    def _pop_minimum(self) -> int:
+        """Remove the least counted key, getting its count."""
+        while True:
+            count, key = self._heap[0]
+            current = self._counters[key][0]
+            if current == count:
+                heapq.heappop(self._heap)
+                del self._counters[key]
+                return count
+            heapq.heapreplace(self._heap, (current, key))
+
+    def __len__(self) -> int:
+        """Get the number of counted keys."""
+        return len(self._counters)
+
+    def top(self, size: int) -> List[Tuple[str, int, int]]:
+        """
+        Get the most counted keys.
+
+        Parameters
+        ----------
+        size: int
+            Maximum number of keys.
+
+        Returns
+        -------
+        list of tuple
+            Key, count and maximum overestimation of the count, the most counted
+            first, and by key on equal counts.
+        """
+        return [
+            (key, count, error)
+            for key, (count, error) in heapq.nsmallest(
+                size, self._counters.items(), key=lambda item: (-item[1][0], item[0])
+            )
+        ]
+
+
+class CommitFacts(NamedTuple):
+    """Facts of a commit counted by the history statistics."""
+
+    timestamp: int
+    author: str
+    parsed: bool
+    type: str
+    scope: str
+    breaking: bool
+    actions: Tuple[str, ...]
+
+    @staticmethod
+    def of(entry: LogEntry) -> "CommitFacts":
+        """
+        Get the facts of a commit, parsing and validating its message once.
+
+        Parameters
+        ----------
+        entry: LogEntry
+            Commit read from the git history, with its details.
+
+        Returns
+        -------
+        CommitFacts
+            Commit time, author, type, scope without parentheses, breaking flag,
+            and the distinct actions of its errors, empty if compliant.
+        """
+        try:
+            parsed, result = parse_and_check(entry.message)
+        except ValidationException:
+            return CommitFacts(
+                entry.timestamp, entry.author, False, "", "", False, ("validation",)
+            )
+        actions = tuple(
+            dict.fromkeys(
+                diagnostic.action
+                for diagnostic in result.diagnostics()
+                if diagnostic.is_error
+            )
+        )
+        if isinstance(parsed, ParseFailure):
+            return CommitFacts(
+                entry.timestamp, entry.author, False, "", "", False, actions
+            )
+        subject = parsed.subject
+        breaking = bool(subject.breaking) or any(
+            footer.token in BREAKING_TOKENS
+            for paragraph in parsed.paragraphs
+            for footer in paragraph.footers
+        )
+        return CommitFacts(
+            timestamp=entry.timestamp,
+            author=entry.author,
+            parsed=True,
+            type=subject.type,
+            scope=subject.scope[1:-1].strip(),
+            breaking=breaking,
+            actions=actions,
+        )
+
+
+class HistoryStats:  # pylint: disable=too-many-instance-attributes
+    """
+    Class that aggregates the facts of the commits of a git history.
+
+    Commits are counted by type and scope, as breaking changes, by compliance
+    in time buckets of their commit date (UTC), and, when not compliant, by
+    failing action and by author. Facts are added one at a time and not kept,
+    so the memory is bounded by the capacity of the counters and the number of
+    time buckets, whatever the number of commits.
+    """
+
+    BUCKETS = ("day", "week", "month", "year")
+    CAPACITY = 1000
+
+    def __init__(self, bucket: str = "month", top: int = 10):
+        self.bucket = bucket
+        self.top = top
+        self.total = 0
+        self.compliant = 0
+        self.unparsed = 0
+        self.breaking = 0
+        self.types = SpaceSaving(self.CAPACITY)
+        self.scopes = SpaceSaving(self.CAPACITY)
+        self.actions = SpaceSaving(self.CAPACITY)
+        self.authors = SpaceSaving(self.CAPACITY)
+        self._buckets: Dict[str, List[int]] = {}
+        self._days: Dict[int, str] = {}
+
+    def bucket_of(self, timestamp: int) -> str:
+        """
+        Get the time bucket of a commit.
+
+        Parameters
+        ----------
+        timestamp: int
+            Commit time, in seconds since the epoch.
+
+        Returns
+        -------
+        str
+            Date, ISO week, month or year of the commit time, in UTC. Buckets
+            are computed once per day.
+        """
+        day = timestamp // DAY_SECONDS
+        bucket = self._days.get(day)
+        if bucket is None:
+            date = datetime.fromtimestamp(day * DAY_SECONDS, tz=timezone.utc)
+            if self.bucket == "day":
+                bucket = date.strftime("%Y-%m-%d")
+            elif self.bucket == "week":
+                year, week, _ = date.isocalendar()
+                bucket = f"{year}-W{week:02d}"
+            elif self.bucket == "month":
+                bucket = date.strftime("%Y-%m")
+            else:
+                bucket = date.strftime("%Y")
+            self._days[day] = bucket
+        return bucket
+
+    def add(self, facts: CommitFacts) -> None:
+        """
+        Count the facts of a commit.
+
+        Parameters
+        ----------
+        facts: CommitFacts
+            Facts of the commit.
+        """
+        self.total += 1
+        compliant = not facts.actions
+        bucket = self._buckets.setdefault(self.bucket_of(facts.timestamp), [0, 0])
+        bucket[0] += 1
+        if compliant:
+            self.compliant += 1
+            bucket[1] += 1
+        else:
+            for action in facts.actions:
+                self.actions.add(action)
+            self.authors.add(facts.author)
+        if not facts.parsed:
+            self.unparsed += 1
+            return
+        self.types.add(facts.type)
+        if facts.scope:
+            self.scopes.add(facts.scope)
+        if facts.breaking:
+            self.breaking += 1
+
+    @staticmethod
+    def rate(count: int, total: int) -> float:
+        """Get the rate of a count, zero if there is nothing to count."""
+        return count / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a serializable representation of the statistics.
+
+        Returns
+        -------
+        dict:
+            Totals and rates, the top counts of types, scopes, failing actions and
+            failing authors, with their maximum overestimation, and the
+            compliance of every time bucket, in time order.
+        """
+
+        def top(counter: SpaceSaving) -> List[Dict[str, Any]]:
+            return [
+                {"name": key, "count": count, "error": error}
+                for key, count, error in counter.top(self.top)
+            ]
+
+        return {
+            "commits": self.total,
+            "compliant": self.compliant,
+            "compliance_rate": self.rate(self.compliant, self.total),
+            "unparsed": self.unparsed,
+            "breaking": self.breaking,
+            "breaking_rate": self.rate(self.breaking, self.total - self.unparsed),
+            "types": top(self.types),
+            "scopes": top(self.scopes),
+            "buckets": [
+                {
+                    "bucket": bucket,
+                    "commits": total,
+                    "compliant": compliant,
+                    "compliance_rate": self.rate(compliant, total),
+                }
+                for bucket, (total, compliant) in sorted(self._buckets.items())
+            ],
+            "actions": top(self.actions),
+            "authors": top(self.authors),
+        }
+
+    def tables(self) -> List[str]:
+        """
+        Get the statistics as the lines of text tables, separated by empty lines.
+
+        Returns
+        -------
+        list of str:
+            Totals, top types, scopes, failing actions and failing authors, and
+            the compliance of every time bucket. Rates of types and scopes are
+            shares of the parsed commits.
+        """
+        parsed = self.total - self.unparsed
+        lines = align(
+            [
+                ("commits", str(self.total), ""),
+                ("compliant", str(self.compliant), percent(self.compliant, self.total)),
+                ("unparsed", str(self.unparsed), percent(self.unparsed, self.total)),
+                ("breaking", str(self.breaking), percent(self.breaking, parsed)),
+            ]
+        )
+        for name, counter, total in (
+            ("type", self.types, parsed),
+            ("scope", self.scopes, parsed),
+            ("action", self.actions, self.total - self.compliant),
+            ("author", self.authors, self.total - self.compliant),
+        ):
+            rows = [
+                (key, str(count), percent(count, total))
+                for key, count, _ in counter.top(self.top)
+            ]
+            if rows:
+                lines += [""] + align([(name, "commits", "share")] + rows)
+        if self._buckets:
+            lines += [""] + align(
+                [(self.bucket, "commits", "compliant", "rate")]
+                + [
+                    (bucket, str(total), str(compliant), percent(compliant, total))
+                    for bucket, (total, compliant) in sorted(self._buckets.items())
+                ]
+            )
+        return lines
+
+
+def percent(count: int, total: int) -> str:
+    """Get the rate of a count as a percentage."""
+    return f"{HistoryStats.rate(count, total):.1%}"
+
+
+def align(rows: Sequence[Sequence[str]]) -> List[str]:
+    """Get the rows as text lines, with the first column left aligned."""
+    widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return [
+        "  ".join(
+            [row[0].ljust(widths[0])]
+            + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+        ).rstrip()
+        for row in rows
+    ]
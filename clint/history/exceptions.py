@@ -0,0 +1,6 @@
+"""Exceptions for history package."""
+from clint.exceptions import ClintException
+
+
+class HistoryException(ClintException):
+    """Generic history exception."""
@@ -0,0 +1,263 @@
+"""Ledger of commits already validated under a rules digest."""
+import contextlib
+import glob
+import mmap
+import os
+import struct
+import tempfile
+from typing import BinaryIO, Optional
+
+from .exceptions import HistoryException
+from .log import GitLog
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore  # pylint: disable=invalid-name
+
+
+class Ledger:  # pylint: disable=too-many-instance-attributes
+    """
+    Class that stores validated commit SHAs in a memory mapped hash table.
+
+    The table lives in a single file per rules digest, with a fixed size header
+    followed by slots of binary SHAs, using open addressing and linear probing.
+    Ledgers of other digests are removed on open, so changing the rules
+    invalidates every commit validated before. An open ledger holds an exclusive
+    lock on a file of its directory, where supported, so processes validating
+    the same repository wait for each other instead of writing the same files.
+    """
+
+    MAGIC = b"CLNTLDG1"
+    HEADER = struct.Struct("<8sQQ")
+    KEY_SIZE = 20
+    EMPTY_KEY = bytes(KEY_SIZE)
+    INITIAL_CAPACITY = 1 << 14
+    MAX_LOAD_FACTOR = 0.5
+    FILENAME = "ledger-{digest}.bin"
+    LOCK_FILENAME = "ledger.lock"
+    TEMP_PREFIX = "ledger-"
+    TEMP_SUFFIX = ".tmp"
+
+    def __init__(self, digest: str, directory: Optional[str] = None):
+        """
+        Initialize the class attributes.
+
+        Parameters
+        ----------
+        digest: str
+            Digest of the active validation rules.
+        directory: str, optional
+            Directory of the ledger files. `clint` inside the git directory of the
+            current repository if not defined.
+        """
+        self.digest = digest
+        self.directory = directory
+        self.path = ""
+        self.capacity = 0
+        self.count = 0
+        self.hits = 0
+        self._file = None
+        self._lock_file: Optional[BinaryIO] = None
+        self._map: Optional[mmap.mmap] = None
+
+    def __enter__(self) -> "Ledger":
+        """Open the ledger."""
+        return self.open()
+
+    def __exit__(self, *args) -> None:
+        """Close the ledger."""
+        self.close()
+
+    def open(self) -> "Ledger":
+        """
+        Open the ledger file, creating it and removing outdated ledgers if needed.
+
+        Waits for other processes with the ledger directory open.
+
+        Returns
+        -------
+        Ledger
+            Self object, ready to use.
+
+        Raises
+        ------
+        HistoryException
+            If the ledger file cannot be created or opened.
+        """
+        if self.directory is None:
+            self.directory = os.path.join(GitLog.git_dir(), "clint")
+        self.path = os.path.join(
+            self.directory, self.FILENAME.format(digest=self.digest[:32])
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._lock()
+            for pattern in (
+                self.FILENAME.format(digest="*"),
+                f"{self.TEMP_PREFIX}*{self.TEMP_SUFFIX}",
+            ):
+                for path in glob.glob(os.path.join(self.directory, pattern)):
+                    if path != self.path:
+                        os.remove(path)
+            if not self._is_valid_file():
+                with open(self.path, mode="wb") as file:
+                    self._create(file, self.INITIAL_CAPACITY)
+            self._map_file()
+        except OSError as exc:
+            self.close()
+            raise HistoryException(f"Unable to open ledger: {exc}") from exc
+        return self
+
+    def close(self) -> None:
+        """Close the ledger file, and release the lock of its directory."""
+        self._unmap_file()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+    def _lock(self) -> None:
+        """Take the lock of the ledger directory, waiting until it is released."""
+        self._lock_file = open(  # pylint: disable=consider-using-with
+            os.path.join(self.directory, self.LOCK_FILENAME), mode="ab"
+        )
+        if fcntl is not None:
+            fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+
+    def _is_valid_file(self) -> bool:
+        """Indicate if the ledger file exists and has a valid header and size."""
+        if not os.path.isfile(self.path):
+            return False
+        with open(self.path, mode="rb") as file:
+            header = file.read(self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            return False
+        magic, capacity, count = self.HEADER.unpack(header)
+        return (
+            magic == self.MAGIC
+            and capacity > 0
+            and capacity & (capacity - 1) == 0
+            and count < capacity
+            and os.path.getsize(self.path) == self._file_size(capacity)
+        )
+
+    def _file_size(self, capacity: int) -> int:
+        """Get the size of a ledger file with the given capacity."""
+        return self.HEADER.size + capacity * self.KEY_SIZE
+
+    def _create(self, file: BinaryIO, capacity: int) -> None:
+        """Write an empty ledger with the given capacity to a new file."""
+        file.write(self.HEADER.pack(self.MAGIC, capacity, 0))
+        file.truncate(self._file_size(capacity))
+        file.flush()
+
+    def _map_file(self) -> None:
+        """Map the ledger file in memory, reading its header."""
+        self._file = open(self.path, mode="r+b")  # pylint: disable=consider-using-with
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        _, self.capacity, self.count = self.HEADER.unpack_from(self._map, 0)
+
+    def _unmap_file(self) -> None:
+        """Unmap and close the ledger file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _key(self, sha: str) -> bytes:
+        """Get the binary key of a hexadecimal SHA."""
+        return bytes.fromhex(sha)[: self.KEY_SIZE].ljust(self.KEY_SIZE, b"\0")
+
+    def _find(self, key: bytes, table=None, capacity: int = 0) -> int:
+        """Get the offset of the slot of a key, or of the empty slot for it."""
+        table = self._map if table is None else table
+        mask = (capacity or self.capacity) - 1
+        index = int.from_bytes(key[:8], "little") & mask
+        while True:
+            offset = self.HEADER.size + index * self.KEY_SIZE
+            slot = table[offset : offset + self.KEY_SIZE]
+            if slot in (key, self.EMPTY_KEY):
+                return offset
+            index = (index + 1) & mask
+
+    def __contains__(self, sha: str) -> bool:
+        """Indicate if a commit SHA was already validated, counting the hits."""
+        key = self._key(sha)
+        offset = self._find(key)
+        found = self._map[offset : offset + self.KEY_SIZE] == key
+        if found:
+            self.hits += 1
+        return found
+
+    def add(self, sha: str) -> None:
+        """
+        Register a commit SHA as validated.
+
+        Parameters
+        ----------
+        sha: str
+            Hexadecimal SHA of the commit.
+
+        Raises
+        ------
+        HistoryException
+            If the table cannot grow to hold the SHA.
+        """
+        key = self._key(sha)
+        if key == self.EMPTY_KEY:
+            return
+        offset = self._find(key)
+        if self._map[offset : offset + self.KEY_SIZE] == key:
+            return
+        if (self.count + 1) > self.capacity * self.MAX_LOAD_FACTOR:
+            self._grow()
+            offset = self._find(key)
+        self._map[offset : offset + self.KEY_SIZE] = key
+        self.count += 1
+        self.HEADER.pack_into(self._map, 0, self.MAGIC, self.capacity, self.count)
+
+    def _grow(self) -> None:
+        """
+        Double the capacity of the table, rehashing every key in a new file.
+
+        The new file is a unique temporary file of the ledger directory, which
+        replaces the ledger file once complete.
+
+        Raises
+        ------
+        HistoryException
+            If the new file cannot be written or mapped, leaving the ledger
+            closed if the previous file was unmapped.
+        """
+        capacity = self.capacity * 2
+        temp_path = None
+        try:
+            descriptor, temp_path = tempfile.mkstemp(
+                suffix=self.TEMP_SUFFIX, prefix=self.TEMP_PREFIX, dir=self.directory
+            )
+            with os.fdopen(descriptor, mode="w+b") as file:
+                self._create(file, capacity)
+                with mmap.mmap(file.fileno(), 0) as table:
+                    count = self._copy_keys(table, capacity)
+                    self.HEADER.pack_into(table, 0, self.MAGIC, capacity, count)
+            self._unmap_file()
+            os.replace(temp_path, self.path)
+            self._map_file()
+        except OSError as exc:
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
+            raise HistoryException(f"Unable to grow ledger: {exc}") from exc
+
+    def _copy_keys(self, table: mmap.mmap, capacity: int) -> int:
+        """Insert every key of the ledger in a larger table, counting them."""
+        count = 0
+        for offset in range(self.HEADER.size, len(self._map), self.KEY_SIZE):
+            key = self._map[offset : offset + self.KEY_SIZE]
+            if key != self.EMPTY_KEY:
+                new_offset = self._find(key, table=table, capacity=capacity)
+                table[new_offset : new_offset + self.KEY_SIZE] = key
+                count += 1
+        return count
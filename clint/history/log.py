@@ -0,0 +1,139 @@
+"""Git history reader."""
+import subprocess
+import tempfile
+from typing import Iterator, List, NamedTuple, Optional
+
+from ..trace import Tracer
+from .exceptions import HistoryException
+
+
+class LogEntry(NamedTuple):
+    """Commit read from the git history, with its details if read."""
+
+    sha: str
+    message: bytes
+    timestamp: int = 0
+    author: str = ""
+
+
+class GitLog:
+    """Class that streams the commits of a git revision range."""
+
+    OPERATION_NAME = "History"
+    CHUNK_SIZE = 64 * 1024
+    FORMAT = "--format=%H%x00%B"
+    DETAILS_FORMAT = "--format=%H%x00%ct%x00%ae%x00%B"
+
+    def __init__(
+        self, rev_range: str, cwd: Optional[str] = None, details: bool = False
+    ):
+        self.rev_range = rev_range
+        self.cwd = cwd
+        self.details = details
+
+    @staticmethod
+    def git_dir(cwd: Optional[str] = None) -> str:
+        """
+        Get the git directory of a repository.
+
+        Parameters
+        ----------
+        cwd: str, optional
+            Directory inside the repository. The current directory if not defined.
+
+        Returns
+        -------
+        str:
+            Absolute path of the git directory.
+
+        Raises
+        ------
+        HistoryException
+            If git cannot be executed or the directory is not inside a repository.
+        """
+        try:
+            process = subprocess.run(
+                ["git", "rev-parse", "--absolute-git-dir"],
+                cwd=cwd,
+                capture_output=True,
+                check=False,
+            )
+        except OSError as exc:
+            raise HistoryException(f"Unable to execute git: {exc}") from exc
+        if process.returncode != 0:
+            raise HistoryException(process.stderr.decode("utf8", "replace").strip())
+        return process.stdout.decode("utf8").strip()
+
+    @property
+    def command(self) -> List[str]:
+        """Get the git command that prints the history."""
+        log_format = self.DETAILS_FORMAT if self.details else self.FORMAT
+        return ["git", "log", "-z", log_format, self.rev_range, "--"]
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        """
+        Iterate over the commits of the revision range, from a single subprocess.
+
+        Yields
+        ------
+        LogEntry
+            Commit SHA and raw message, in git log order, with the commit time
+            and author email if details are read. Messages are decoded by the
+            validator, which checks their encoding.
+
+        Raises
+        ------
+        HistoryException
+            If git cannot be executed or if it ends with an error.
+        """
+        # Errors go to a file, as a full stderr pipe would block git before the
+        # end of stdout.
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                process = subprocess.Popen(  # pylint: disable=consider-using-with
+                    self.command, cwd=self.cwd, stdout=subprocess.PIPE, stderr=stderr
+                )
+            except OSError as exc:
+                raise HistoryException(f"Unable to execute git: {exc}") from exc
+            try:
+                tokens = self._split(process.stdout)
+                for sha in tokens:
+                    timestamp, author = 0, ""
+                    if self.details:
+                        timestamp = int(next(tokens, b"0") or 0)
+                        author = next(tokens, b"").decode("utf8", errors="replace")
+                    message = next(tokens, b"")
+                    yield LogEntry(
+                        sha=sha.decode("ascii").strip(),
+                        message=message,
+                        timestamp=timestamp,
+                        author=author,
+                    )
+            finally:
+                process.stdout.close()
+                return_code = process.wait()
+            if return_code != 0:
+                stderr.seek(0)
+                error = stderr.read().decode("utf8", errors="replace").strip()
+                raise HistoryException(error or f"git exited with code {return_code}.")
+
+    @classmethod
+    def _split(cls, stream) -> Iterator[bytes]:
+        """Split a binary stream in NUL delimited tokens, reading it by chunks."""
+        parts = []
+        start = Tracer.clock()
+        chunk = stream.read(cls.CHUNK_SIZE)
+        Tracer.span("read", "git", start, size=len(chunk))
+        while chunk:
+            *tokens, tail = chunk.split(b"\0")
+            if tokens:
+                tokens[0] = b"".join(parts) + tokens[0]
+                parts.clear()
+            yield from tokens
+            parts.append(tail)
+            start = Tracer.clock()
+            chunk = stream.read(cls.CHUNK_SIZE)
+            Tracer.span("read", "git", start, size=len(chunk))
+        token = b"".join(parts)
+        if token.strip():
+            yield token
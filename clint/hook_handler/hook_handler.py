@@ -12,7 +12,6 @@ class HookHandler:
     OPERATION_NAME = "Hook"
     OPERATION_BASE_ERROR_CODE = 200
     COMMAND = "clint --file $1"
-    ROOT_DIR = os.path.abspath(os.getcwd()).split(os.sep)[0] + os.sep
 
     def __init__(self):
         self.path = self._get_repo_root()
@@ -36,11 +35,12 @@ class HookHandler:
             If not inside git repository.
         """
         current = os.getcwd()
-        while current != HookHandler.ROOT_DIR:
+        root_dir = os.path.abspath(current).split(os.sep)[0] + os.sep
+        while current != root_dir:
             if Path(os.path.join(current, ".git")).is_dir():
                 break
             current = os.path.abspath(os.path.join(current, ".."))
-        if current == HookHandler.ROOT_DIR:
+        if current == root_dir:
             raise HookException("Not in a git repository.")
         return current
 
@@ -0,0 +1,16 @@
+"""Reporter classes."""
+
+from .junit import JunitReporter
+from .reporter import JsonReporter, NdjsonReporter, Reporter, TextReporter
+from .sarif import SarifReporter
+
+REPORTERS = {
+    reporter.NAME: reporter
+    for reporter in (
+        TextReporter,
+        NdjsonReporter,
+        JsonReporter,
+        SarifReporter,
+        JunitReporter,
+    )
+}
@@ -0,0 +1,59 @@
+"""JUnit XML reporter of batch results."""
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from ..result import Result
+from ..validator import BatchSummary
+from .reporter import Reporter
+
+INVALID_XML_CHARS = re.compile(
+    "[^\u0009\u000a\u000d\u0020-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+
+
+class JunitReporter(Reporter):
+    """
+    Class that writes a JUnit XML report, for continuous integration servers.
+
+    Every record is a test case, failed by its errors. The counts of the test
+    suite are only known at the end, so they are left to the readers of the
+    report, which count its test cases and failures.
+    """
+
+    NAME = "junit"
+
+    @staticmethod
+    def text(value: str) -> str:
+        """Get text without the characters XML documents cannot hold."""
+        return INVALID_XML_CHARS.sub("\ufffd", value)
+
+    def start(self) -> None:
+        """Write the XML declaration and the opening of the test suite."""
+        self.write(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            + '<testsuites name="clint">\n<testsuite name="clint">\n'
+        )
+
+    def add(self, record_id: str, result: Result) -> None:
+        """Write the record as a test case, with a failure of its errors."""
+        name = quoteattr(self.text(record_id))
+        errors = [
+            diagnostic for diagnostic in result.diagnostics() if diagnostic.is_error
+        ]
+        if not errors:
+            self.write(f'<testcase classname="clint" name={name}/>\n')
+            return
+        lines = "\n".join(
+            f"{diagnostic.action}: {diagnostic.message}" for diagnostic in errors
+        )
+        self.write(
+            f'<testcase classname="clint" name={name}>'
+            + f"<failure message={quoteattr(self.text(errors[0].message))} "
+            + f"type={quoteattr(errors[0].action)}>{escape(self.text(lines))}"
+            + "</failure></testcase>\n"
+        )
+
+    def finish(self, summary: BatchSummary) -> None:
+        """Write the closing of the test suite."""
+        self.write("</testsuite>\n</testsuites>\n")
+        super().finish(summary)
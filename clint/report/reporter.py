@@ -0,0 +1,171 @@
+"""Streaming reporters of batch results."""
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, TextIO
+
+from .. import __version__
+from ..result import Result
+from ..validator import BatchSummary
+
+
+class Reporter(ABC):
+    """
+    Class that writes the results of a batch of validations to a stream.
+
+    Results are written as they come, through a buffer flushed to the stream
+    once it holds `BUFFER_SIZE` characters, or after every result on interactive
+    streams. Reporters hold one result at a time, so their memory does not grow
+    with the number of results.
+    """
+
+    NAME = ""
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+        self._buffer: List[str] = []
+        self._size = 0
+        self._limit = 0 if stream.isatty() else self.BUFFER_SIZE
+
+    def write(self, text: str) -> None:
+        """
+        Write text to the buffer, flushing it when full.
+
+        Parameters
+        ----------
+        text: str
+            Text to write, as is.
+        """
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size >= self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffer to the stream."""
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer.clear()
+            self._size = 0
+        self.stream.flush()
+
+    def start(self) -> None:
+        """Write the header of the report, before any result."""
+
+    @abstractmethod
+    def add(self, record_id: str, result: Result) -> None:
+        """
+        Write the result of a record.
+
+        Parameters
+        ----------
+        record_id: str
+            Id of the record, such as its position or the commit SHA.
+        result: Result
+            Result of the validation of the record.
+        """
+
+    def finish(self, summary: BatchSummary) -> None:  # pylint: disable=unused-argument
+        """
+        Write the footer of the report, after every result, and flush it.
+
+        Parameters
+        ----------
+        summary: BatchSummary
+            Summary of every reported result.
+        """
+        self.flush()
+
+    @staticmethod
+    def record(record_id: str, result: Result) -> Dict[str, Any]:
+        """
+        Get a serializable representation of the result of a record.
+
+        Parameters
+        ----------
+        record_id: str
+            Id of the record.
+        result: Result
+            Result of the validation of the record.
+
+        Returns
+        -------
+        dict:
+            Id, return code and diagnostics, with their formatted messages.
+        """
+        return {
+            "id": record_id,
+            "return_code": result.return_code,
+            "diagnostics": [
+                {
+                    "action": diagnostic.action,
+                    "message": diagnostic.message,
+                    "is_error": diagnostic.is_error,
+                    "index": diagnostic.index,
+                    "span": list(diagnostic.span),
+                }
+                for diagnostic in result.diagnostics()
+            ],
+        }
+
+
+class TextReporter(Reporter):
+    """Class that writes a `record: action: message` line per diagnostic."""
+
+    NAME = "text"
+
+    def __init__(self, stream: TextIO, only_failures: bool = False):
+        super().__init__(stream=stream)
+        self.only_failures = only_failures
+
+    def add(self, record_id: str, result: Result) -> None:
+        """Write the diagnostics of a record, if failed or not only failures."""
+        if not self.only_failures or result.return_code:
+            self.write(
+                "".join(
+                    f"{record_id}: {diagnostic.action}: {diagnostic.message}\n"
+                    for diagnostic in result.diagnostics()
+                )
+            )
+
+
+class NdjsonReporter(Reporter):
+    """Class that writes a JSON object per record, one per line."""
+
+    NAME = "ndjson"
+
+    def add(self, record_id: str, result: Result) -> None:
+        """Write the record as a JSON line."""
+        self.write(json.dumps(self.record(record_id, result)) + "\n")
+
+
+class JsonReporter(Reporter):
+    """
+    Class that writes a single JSON document, with the records and their summary.
+
+    The document is written as records come, so it is only complete, and valid,
+    once the report is finished.
+    """
+
+    NAME = "json"
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream=stream)
+        self._separator = ""
+
+    def start(self) -> None:
+        """Write the opening of the document."""
+        self.write(f'{{"version": {json.dumps(__version__)}, "results": [')
+
+    def add(self, record_id: str, result: Result) -> None:
+        """Write the record as an item of the results."""
+        self.write(self._separator + json.dumps(self.record(record_id, result)))
+        self._separator = ",\n"
+
+    def finish(self, summary: BatchSummary) -> None:
+        """Write the summary and the closing of the document."""
+        self.write(
+            f'], "total": {summary.total}, "failed": {summary.failed}, '
+            + f'"return_code": {summary.return_code}}}\n'
+        )
+        super().finish(summary)
@@ -0,0 +1,77 @@
+"""SARIF reporter of batch results."""
+import json
+from typing import Any, Dict, Set, TextIO
+
+from .. import __version__
+from ..result import NO_POSITION, Result
+from ..validator import BatchSummary
+from .reporter import Reporter
+
+
+class SarifReporter(Reporter):
+    """
+    Class that writes a SARIF 2.1.0 log, for code scanning dashboards.
+
+    Every error is a result of its rule, located at its record through a logical
+    location, as records are messages and not files. The tool, with the rules
+    that had errors, is written after the results, as only then it is known.
+    """
+
+    NAME = "sarif"
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    INFORMATION_URI = "https://github.com/rcisterna/clint"
+
+    def __init__(self, stream: TextIO):
+        super().__init__(stream=stream)
+        self._separator = ""
+        self._rules: Set[str] = set()
+
+    def start(self) -> None:
+        """Write the opening of the log, up to its results."""
+        self.write(
+            f'{{"$schema": "{self.SCHEMA}", "version": "2.1.0", '
+            + '"runs": [{"results": ['
+        )
+
+    def add(self, record_id: str, result: Result) -> None:
+        """Write every error of the record as a SARIF result."""
+        for diagnostic in result.diagnostics():
+            if not diagnostic.is_error:
+                continue
+            self._rules.add(diagnostic.action)
+            sarif_result: Dict[str, Any] = {
+                "ruleId": diagnostic.action,
+                "level": "error",
+                "message": {"text": diagnostic.message},
+                "locations": [
+                    {"logicalLocations": [{"fullyQualifiedName": record_id}]}
+                ],
+            }
+            if diagnostic.index != NO_POSITION:
+                sarif_result["properties"] = {
+                    "index": diagnostic.index,
+                    "span": list(diagnostic.span),
+                }
+            self.write(self._separator + json.dumps(sarif_result))
+            self._separator = ",\n"
+
+    def finish(self, summary: BatchSummary) -> None:
+        """Write the tool, the invocation and the closing of the log."""
+        tool = {
+            "driver": {
+                "name": "clint",
+                "version": __version__,
+                "informationUri": self.INFORMATION_URI,
+                "rules": [{"id": rule} for rule in sorted(self._rules)],
+            }
+        }
+        invocation = {
+            "executionSuccessful": True,
+            "exitCode": summary.return_code,
+            "properties": {"total": summary.total, "failed": summary.failed},
+        }
+        self.write(
+            f'], "tool": {json.dumps(tool)}, "invocations": [{json.dumps(invocation)}]'
+            + "}]}\n"
+        )
+        super().finish(summary)
@@ -1,4 +1,5 @@
 """Result classes."""
 
-from .exceptions import ResultException
-from .result import Result
+from .exceptions import FailFastException, ResultException
+from .result import NO_POSITION, Diagnostic, Result
+from .stats import Stats, StepStats
@@ -4,3 +4,7 @@ from clint.exceptions import ClintException
 
 class ResultException(ClintException):
     """Generic result exception."""
+
+
+class FailFastException(ResultException):
+    """Exception raised by fail fast results when the first error is registered."""
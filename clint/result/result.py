@@ -1,28 +1,115 @@
 """CLint operation results."""
-from .exceptions import ResultException
+import itertools
+import struct
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .exceptions import FailFastException
+from .stats import Stats
+
+NO_POSITION = -1
+
+
+class Diagnostic(NamedTuple):
+    """Finding of an operation, with its message formatted on demand."""
+
+    action: str
+    template: str
+    args: Tuple[Any, ...]
+    is_error: bool
+    index: int
+    span: Tuple[int, int]
+
+    @property
+    def message(self) -> str:
+        """Output message of the diagnostic."""
+        if not self.args:
+            return self.template
+        return self.template.format(*self.args)
 
 
 class Result:  # pylint: disable=too-few-public-methods
-    """Class that stores result of an operation."""
+    """
+    Class that stores result of an operation.
 
-    def __init__(self, operation: str, base_error_code):
+    Diagnostics are kept as packed records of four integers in a single byte
+    array: the rule id, the paragraph index and the column span. Rules are the distinct
+    combinations of action, message template and error flag, numbered once per
+    process. Message arguments are kept apart, and messages are only formatted
+    when a diagnostic is read. Validations with measured rules also keep the
+    stats of their steps.
+    """
+
+    RECORD = struct.Struct("=Iiii")
+    _rules: Dict[int, Tuple[str, str, bool]] = {}
+    _rule_ids: Dict[Tuple[str, str, bool], int] = {}
+    _next_rule_id = itertools.count()
+
+    def __init__(self, operation: str, base_error_code, fail_fast: bool = False):
         self.operation = operation
-        self.actions = {}
         self.return_code = 0
+        self.fail_fast = fail_fast
         self.__base_error_code = base_error_code
+        self._records = bytearray()
+        self._args: List[Tuple[Any, ...]] = []
+        self.stats: Optional[Stats] = None
+
+    @staticmethod
+    def rule_id(action: str, template: str, is_error: bool) -> int:
+        """
+        Get the numeric id of a rule, registering it on first use.
+
+        Parameters
+        ----------
+        action: str
+            Action name of the operation.
+        template: str
+            Output message template of the action.
+        is_error: bool
+            Indicate if the action ends in an error or not.
+
+        Returns
+        -------
+        int:
+            Id of the rule in this process.
+        """
+        key = (action, template, is_error)
+        rule = Result._rule_ids.get(key)
+        if rule is None:
+            # Safe between threads: losers of a race only leave an unused id.
+            rule = next(Result._next_rule_id)
+            Result._rules[rule] = key
+            rule = Result._rule_ids.setdefault(key, rule)
+        return rule
 
-    def add_action(self, action: str, message: str, is_error: bool) -> "Result":
+    def add_action(  # pylint: disable=too-many-arguments
+        self,
+        action: str,
+        message: str,
+        is_error: bool,
+        args: Tuple[Any, ...] = (),
+        index: int = NO_POSITION,
+        span: Tuple[int, int] = (NO_POSITION, NO_POSITION),
+    ) -> "Result":
         """
         Register new action in the operation.
 
+        The same action can be registered many times, once per finding.
+
         Parameters
         ----------
         action: str
             Action name of the operation.
         message: str
-            Output message of the action.
+            Output message of the action. Formatted with `str.format` and the args,
+            if any.
         is_error: bool
             Indicate if the action ends in an error or not.
+        args: tuple
+            Arguments of the message.
+        index: int
+            Index of the paragraph of the finding, the subject being 0.
+        span: tuple of int
+            Start and end columns of the finding in the paragraph.
 
         Returns
         -------
@@ -31,14 +118,124 @@ class Result:  # pylint: disable=too-few-public-methods
 
         Raises
         ------
-        ResultException
-            If the action has already been registered.
+        FailFastException
+            If the result is fail fast and the action ends in an error, once it is
+            registered.
         """
-        if action in self.actions:
-            raise ResultException("Action result already registered.")
-        self.actions[action] = message
+        rule = Result._rule_ids.get((action, message, is_error))
+        if rule is None:
+            rule = Result.rule_id(action, message, is_error)
+        self._records += self.RECORD.pack(rule, index, span[0], span[1])
+        self._args.append(args)
         if is_error:
             if self.return_code == 0:
                 self.return_code = self.__base_error_code
             self.return_code += 1
+            if self.fail_fast:
+                raise FailFastException(f"Action '{action}' ended in an error.")
         return self
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the state to pickle, with rules instead of the ids of this process."""
+        state = self.__dict__.copy()
+        state["_records"] = [
+            (Result._rules[rule], index, start, end)
+            for rule, index, start, end in self.RECORD.iter_unpack(self._records)
+        ]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Set the unpickled state, with the rule ids of this process."""
+        records = bytearray()
+        for rule, index, start, end in state.pop("_records"):
+            records += self.RECORD.pack(Result.rule_id(*rule), index, start, end)
+        self.__dict__.update(state)
+        self._records = records
+
+    @property
+    def count(self) -> int:
+        """Number of registered diagnostics."""
+        return len(self._args)
+
+    def diagnostics(self) -> Iterator[Diagnostic]:
+        """
+        Get the registered diagnostics, in registration order.
+
+        Yields
+        ------
+        Diagnostic:
+            Diagnostic of every registered action.
+        """
+        records = self.RECORD.iter_unpack(bytes(self._records))
+        for (rule, index, start, end), args in zip(records, self._args):
+            action, template, is_error = Result._rules[rule]
+            yield Diagnostic(
+                action=action,
+                template=template,
+                args=args,
+                is_error=is_error,
+                index=index,
+                span=(start, end),
+            )
+
+    @property
+    def actions(self) -> Dict[str, str]:
+        """Messages by action name, keeping the first one of repeated actions."""
+        actions: Dict[str, str] = {}
+        for diagnostic in self.diagnostics():
+            if diagnostic.action not in actions:
+                actions[diagnostic.action] = diagnostic.message
+        return actions
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get a serializable representation of the result.
+
+        Returns
+        -------
+        dict:
+            Operation, return code and diagnostics of the result.
+        """
+        return {
+            "operation": self.operation,
+            "return_code": self.return_code,
+            "diagnostics": [
+                [
+                    diagnostic.action,
+                    diagnostic.template,
+                    list(diagnostic.args),
+                    diagnostic.is_error,
+                    diagnostic.index,
+                    list(diagnostic.span),
+                ]
+                for diagnostic in self.diagnostics()
+            ],
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "Result":
+        """
+        Get a new instance of Result from its serializable representation.
+
+        Parameters
+        ----------
+        data: dict
+            Representation created by the to_dict method.
+
+        Returns
+        -------
+        Result:
+            New instance, with the same operation, return code and diagnostics.
+        """
+        result = Result(operation=data["operation"], base_error_code=0)
+        for action, template, args, is_error, index, span in data["diagnostics"]:
+            result.add_action(
+                action=action,
+                message=template,
+                is_error=is_error,
+                args=tuple(args),
+                index=index,
+                span=tuple(span),
+            )
+        result.return_code = data["return_code"]
+        return result
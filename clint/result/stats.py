@@ -0,0 +1,150 @@
+"""Counters of the validation steps."""
+from typing import Any, Dict, Iterator, List, NamedTuple
+
+
+class StepStats(NamedTuple):
+    """Counters of one validation step."""
+
+    calls: int
+    findings: int
+    seconds: float
+
+
+class Stats:
+    """
+    Class that counts the calls, findings and seconds of the validation steps.
+
+    Steps are the parsing of the subjects (`parse.subject`), the detection of the
+    footers in the paragraphs (`parse.footers`), and every rule, by its name.
+    Stats of many validations are merged into one.
+    """
+
+    COLUMNS = ("step", "calls", "findings", "seconds", "share")
+
+    def __init__(self):
+        self._steps: Dict[str, List[Any]] = {}
+
+    def add(
+        self, step: str, findings: int = 0, seconds: float = 0.0, calls: int = 1
+    ) -> None:
+        """
+        Count the calls of a step.
+
+        Parameters
+        ----------
+        step: str
+            Name of the step.
+        findings: int
+            Number of findings registered by the calls.
+        seconds: float
+            Time spent in the calls.
+        calls: int
+            Number of calls.
+        """
+        counters = self._steps.get(step)
+        if counters is None:
+            self._steps[step] = [calls, findings, seconds]
+        else:
+            counters[0] += calls
+            counters[1] += findings
+            counters[2] += seconds
+
+    def merge(self, other: "Stats") -> "Stats":
+        """
+        Add the counters of other stats to these ones.
+
+        Parameters
+        ----------
+        other: Stats
+            Stats to add.
+
+        Returns
+        -------
+        Stats:
+            Self object, to chain merges.
+        """
+        for step in other:
+            calls, findings, seconds = other[step]
+            self.add(step, findings=findings, seconds=seconds, calls=calls)
+        return self
+
+    def __getitem__(self, step: str) -> StepStats:
+        """Get the counters of a step."""
+        return StepStats(*self._steps[step])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the names of the counted steps, in the order they ran."""
+        return iter(self._steps)
+
+    def __len__(self) -> int:
+        """Get the number of counted steps."""
+        return len(self._steps)
+
+    @property
+    def seconds(self) -> float:
+        """Time spent in every step."""
+        return sum(counters[2] for counters in self._steps.values())
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a serializable representation of the stats.
+
+        Returns
+        -------
+        dict:
+            Calls, findings and seconds by step name.
+        """
+        return {step: self[step]._asdict() for step in self._steps}
+
+    @staticmethod
+    def from_dict(data: Dict[str, Dict[str, Any]]) -> "Stats":
+        """
+        Get a new instance of Stats from its serializable representation.
+
+        Parameters
+        ----------
+        data: dict
+            Representation created by the to_dict method.
+
+        Returns
+        -------
+        Stats:
+            New instance, with the same counters.
+        """
+        stats = Stats()
+        for step, counters in data.items():
+            stats.add(step, **counters)
+        return stats
+
+    def table(self) -> List[str]:
+        """
+        Get the counters as the lines of a text table.
+
+        Returns
+        -------
+        list of str:
+            Header and one line per step, the slowest first, with its share of the
+            time spent in every step.
+        """
+        total = self.seconds or 1.0
+        rows = [self.COLUMNS] + [
+            (
+                step,
+                str(stats.calls),
+                str(stats.findings),
+                f"{stats.seconds:.6f}",
+                f"{stats.seconds / total:.1%}",
+            )
+            for step, stats in sorted(
+                ((step, self[step]) for step in self._steps),
+                key=lambda item: -item[1].seconds,
+            )
+        ]
+        widths = [max(len(row[column]) for row in rows) for column in range(5)]
+        return [
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+            )
+            for row in rows
+        ]
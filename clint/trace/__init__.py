@@ -0,0 +1,31 @@
+"""Trace classes."""
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .tracer import Tracer
+
+LAZY_ATTRIBUTES = {"Tracer": ".tracer"}
+
+
+def __getattr__(name: str):
+    """Import trace classes on first use, so hooks do not load them."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def is_enabled() -> bool:
+    """
+    Indicate if the spans of this process are recorded.
+
+    Only the tracer enables itself, so this is known without importing it.
+
+    Returns
+    -------
+    bool:
+        True if the tracer is imported and enabled.
+    """
+    tracer = sys.modules.get(f"{__name__}.tracer")
+    return tracer is not None and tracer.Tracer.is_enabled()
@@ -0,0 +1,231 @@
+"""Trace-event recording of the validation spans."""
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, TypeVar
+
+Item = TypeVar("Item")
+Event = Dict[str, Any]
+
+
+class Tracer:
+    """
+    Class that records the spans of this process as Chrome trace events.
+
+    Spans are complete events, with timestamps of the monotonic clock shared by
+    the processes of the machine. The main process streams them to a JSON file,
+    which opens in standard trace viewers (Perfetto, chrome://tracing), and
+    worker processes keep theirs until collected, to send them with their
+    results. Forked processes start with no spans and no file. Nothing is
+    recorded while the tracer is disabled.
+    """
+
+    FLUSH_SIZE = 4096
+    _events: Optional[List[Event]] = None
+    _file: Optional[TextIO] = None
+    _written = 0
+
+    @staticmethod
+    def enable(process_name: str = "clint") -> None:
+        """
+        Start recording the spans of this process, in memory.
+
+        Parameters
+        ----------
+        process_name: str
+            Name of this process in the trace viewers.
+        """
+        pid = os.getpid()
+        Tracer._file = None
+        Tracer._events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": pid,
+                "args": {"name": process_name},
+            }
+        ]
+
+    @staticmethod
+    def forked() -> None:
+        """Keep only the spans of a forked process, without the file of its parent."""
+        if Tracer._events is not None:
+            Tracer.enable(process_name="clint worker")
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Indicate if the spans of this process are recorded."""
+        return Tracer._events is not None
+
+    @staticmethod
+    def clock() -> float:
+        """Get the current time of the trace, in seconds."""
+        return time.perf_counter()
+
+    @staticmethod
+    def span(name: str, category: str, start: float, **args: Any) -> float:
+        """
+        Record a span that ends now, if the tracer is enabled.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        category: str
+            Category of the span, to filter spans in the trace viewers.
+        start: float
+            Start of the span, from the clock method.
+        args: Any
+            Serializable values shown with the span.
+
+        Returns
+        -------
+        float:
+            End of the span, to start the next one.
+        """
+        end = time.perf_counter()
+        events = Tracer._events
+        if events is not None:
+            pid = os.getpid()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": pid,
+                "tid": pid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+            if Tracer._file is not None and len(events) >= Tracer.FLUSH_SIZE:
+                Tracer.flush()
+        return end
+
+    @staticmethod
+    @contextmanager
+    def trace(name: str, category: str, **args: Any) -> Iterator[None]:
+        """
+        Record a span around a block, if the tracer is enabled.
+
+        Parameters
+        ----------
+        name: str
+            Name of the span.
+        category: str
+            Category of the span.
+        args: Any
+            Serializable values shown with the span.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            Tracer.span(name, category, start, **args)
+
+    @staticmethod
+    def iterate(items: Iterable[Item], name: str, category: str) -> Iterator[Item]:
+        """
+        Iterate over items, recording a span for the read of every item.
+
+        Parameters
+        ----------
+        items: iterable
+            Items read lazily, such as input records.
+        name: str
+            Name of the spans.
+        category: str
+            Category of the spans.
+
+        Yields
+        ------
+        any
+            Every item, as read.
+        """
+        start = time.perf_counter()
+        for item in items:
+            Tracer.span(name, category, start)
+            yield item
+            start = time.perf_counter()
+        Tracer.span(name, category, start)
+
+    @staticmethod
+    def collect() -> List[Event]:
+        """
+        Take the spans recorded in this process, to record them in another one.
+
+        Returns
+        -------
+        list of dict:
+            Trace events recorded since the last collection.
+        """
+        events = Tracer._events or []
+        if Tracer._events is not None:
+            Tracer._events = []
+        return events
+
+    @staticmethod
+    def record(events: List[Event]) -> None:
+        """
+        Record the spans collected in another process, if the tracer is enabled.
+
+        Parameters
+        ----------
+        events: list of dict
+            Trace events, from the collect method.
+        """
+        if Tracer._events is not None:
+            Tracer._events.extend(events)
+            if Tracer._file is not None and len(Tracer._events) >= Tracer.FLUSH_SIZE:
+                Tracer.flush()
+
+    @staticmethod
+    def start(path: str) -> None:
+        """
+        Start recording the spans of this process and its workers into a file.
+
+        Parameters
+        ----------
+        path: str
+            Path of the JSON file, in the trace-event array format.
+        """
+        Tracer.enable()
+        file = open(  # pylint: disable=consider-using-with
+            path, mode="w", encoding="utf8"
+        )
+        file.write("[\n")
+        file.flush()
+        Tracer._file = file
+        Tracer._written = 0
+
+    @staticmethod
+    def flush() -> None:
+        """Write the recorded spans to the file, if started."""
+        file, events = Tracer._file, Tracer._events or []
+        if file is None or not events:
+            return
+        for event in events:
+            if Tracer._written:
+                file.write(",\n")
+            file.write(json.dumps(event))
+            Tracer._written += 1
+        # Keep the buffer empty, so forked workers cannot write it again.
+        file.flush()
+        Tracer._events = []
+
+    @staticmethod
+    def stop() -> None:
+        """Stop recording the spans, closing the file if started."""
+        if Tracer._file is not None:
+            Tracer.flush()
+            Tracer._file.write("\n]\n")
+            Tracer._file.close()
+        Tracer._file = None
+        Tracer._events = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Tracer.forked)
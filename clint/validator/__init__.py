@@ -1,10 +1,43 @@
 """Validator classes."""
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-from .commit import Commit
-from .exceptions import GenerationException, ValidationException
+from .batch import (
+    OPERATION_BASE_ERROR_CODE,
+    BatchSummary,
+    ParsedCommit,
+    check,
+    parse,
+    parse_and_check,
+    validate,
+    validate_many,
+    validate_stream,
+)
+from .commit import Commit, ParseFailure
+from .element import Element
+from .exceptions import GenerationException, RuleException, ValidationException
 from .footer import Footer
 from .paragraph import Paragraph
+from .parallel import ParallelValidator
+from .paths import cache_directory
+from .rules import Rule, RuleRegistry
 from .subject import Subject
 
+if TYPE_CHECKING:
+    from .cache import ResultCache
+    from .compiler import RuleCompiler
+    from .digest import rules_digest
+
 OPERATION_NAME = Commit.OPERATION_NAME
-OPERATION_BASE_ERROR_CODE = 100
+LAZY_ATTRIBUTES = {
+    "ResultCache": ".cache",
+    "RuleCompiler": ".compiler",
+    "rules_digest": ".digest",
+}
+
+
+def __getattr__(name: str):
+    """Import validator classes on first use, so hooks do not load them."""
+    if name in LAZY_ATTRIBUTES:
+        return getattr(import_module(LAZY_ATTRIBUTES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
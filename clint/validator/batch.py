@@ -0,0 +1,272 @@
+"""Validation of commit messages, one or many at a time."""
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+from .. import trace
+from ..result import Result, Stats
+from .commit import Commit, ParseFailure
+from .exceptions import GenerationException, ValidationException
+from .parallel import ParallelValidator
+from .rules import Rule, RuleRegistry
+from .scanner import Scanner
+
+OPERATION_BASE_ERROR_CODE = 100
+
+Message = Union[str, bytes, bytearray, memoryview]
+# Commits given by parse, immutable and ready to validate.
+ParsedCommit = Commit
+
+
+def parse(message: str) -> Union[ParsedCommit, ParseFailure]:
+    """
+    Parse a commit message, getting mismatches as values instead of exceptions.
+
+    Parameters
+    ----------
+    message: str
+        Commit message.
+
+    Returns
+    -------
+    ParsedCommit or ParseFailure
+        Parsed commit if the message matches the pattern and length limits. The
+        reason why it does not otherwise.
+    """
+    return Commit.parse(message)
+
+
+def check(message: Message, fail_fast: bool = False) -> Result:
+    """
+    Validate a commit message, without exceptions for messages that do not parse.
+
+    Parameters
+    ----------
+    message: str or bytes
+        Commit message. Raw messages, as read from git, are checked by the rules
+        of the bytes target, and decoded once, replacing invalid UTF-8 sequences.
+        Their findings replace the generation error of messages that do not
+        match the pattern.
+    fail_fast: bool
+        Stop at the first error, registering only that one.
+
+    Returns
+    -------
+    Result:
+        Result information of the validation, with the stats of the parsing and
+        of every rule while the rules are measured.
+    """
+    return parse_and_check(message, fail_fast=fail_fast)[1]
+
+
+def parse_and_check(
+    message: Message, fail_fast: bool = False
+) -> Tuple[Union[ParsedCommit, ParseFailure], Result]:
+    """
+    Parse and validate a commit message, parsing it only once.
+
+    Parameters
+    ----------
+    message: str or bytes
+        Commit message, as in the check function.
+    fail_fast: bool
+        Stop at the first error, registering only that one.
+
+    Returns
+    -------
+    tuple
+        Parsed commit, or the reason why the message does not parse, and the
+        result information of the validation, as given by the check function.
+    """
+    data = None
+    if not isinstance(message, str):
+        data = bytes(message)
+        message = data.decode("utf8", errors="replace")
+    stats = Stats() if RuleRegistry.is_timed() else None
+    tracing = trace.is_enabled()
+    start = trace.Tracer.clock() if tracing else 0.0
+    parsed = Commit.parse(message, stats=stats)
+    if tracing:
+        start = trace.Tracer.span("parse", "validator", start)
+    if isinstance(parsed, ParseFailure):
+        result = _failure_result(parsed, data, stats)
+    else:
+        result = _with_stats(parsed.validate(fail_fast=fail_fast, data=data), stats)
+    if tracing:
+        trace.Tracer.span("validate", "validator", start, findings=result.count)
+    return parsed, result
+
+
+def validate(message: Message, fail_fast: bool = False) -> Result:
+    """
+    Validate a commit message, registering validation errors in the result.
+
+    Parameters
+    ----------
+    message: str or bytes
+        Commit message, as in the check function.
+    fail_fast: bool
+        Stop at the first error, registering only that one.
+
+    Returns
+    -------
+    Result:
+        Result information of the validation.
+    """
+    try:
+        return check(message, fail_fast=fail_fast)
+    except ValidationException as exc:
+        return _error_result().add_action(
+            action="validation", message=str(exc), is_error=True
+        )
+
+
+def validate_stream(chunks: Iterable[str], fail_fast: bool = False) -> Result:
+    """
+    Validate a commit message read in chunks, one paragraph at a time.
+
+    Parameters
+    ----------
+    chunks: iterable of str
+        Consecutive chunks of the commit message, of any size.
+    fail_fast: bool
+        Stop at the first error, registering only that one.
+
+    Returns
+    -------
+    Result:
+        Result information of the validation, the same as validating the whole
+        message at once.
+    """
+    stats = Stats() if RuleRegistry.is_timed() else None
+    try:
+        return Commit.validate_stream(
+            Scanner.stream_paragraphs(chunks), fail_fast=fail_fast, stats=stats
+        )
+    except GenerationException as exc:
+        action, message = "generation", str(exc)
+    except ValidationException as exc:
+        action, message = "validation", str(exc)
+    return _with_stats(_error_result(), stats).add_action(
+        action=action, message=message, is_error=True
+    )
+
+
+def _error_result() -> Result:
+    """Get the result of a message that could not be generated or validated."""
+    return Result(
+        operation=Commit.OPERATION_NAME,
+        base_error_code=OPERATION_BASE_ERROR_CODE,
+    )
+
+
+def _failure_result(
+    failure: ParseFailure, data: Optional[bytes], stats: Optional[Stats]
+) -> Result:
+    """Get the result of a message that could not be parsed."""
+    result = _with_stats(_error_result(), stats)
+    if data is not None:
+        # Invalid UTF-8 is the cause of the parse failure, if found.
+        Commit.validate_bytes(data, result=result)
+    if not result.count:
+        result.add_action(action="generation", message=failure.reason, is_error=True)
+    return result
+
+
+def _with_stats(result: Result, stats: Optional[Stats]) -> Result:
+    """Keep the stats of the parsing in a result, before the ones of its rules."""
+    if stats is not None:
+        if result.stats is not None:
+            stats.merge(result.stats)
+        result.stats = stats
+    return result
+
+
+def validate_many(
+    messages: Iterable[Message], jobs: int = 1, cache=None, fail_fast: bool = False
+) -> Iterator[Result]:
+    """
+    Validate many commit messages, lazily.
+
+    Parameters
+    ----------
+    messages: iterable of str or bytes
+        Commit messages.
+    jobs: int
+        Number of worker processes. Zero or less means one per CPU.
+    cache: ResultCache, optional
+        Cache to reuse the results of messages already validated.
+    fail_fast: bool
+        Stop every validation at its first error, registering only that one.
+
+    Yields
+    ------
+    Result:
+        Result information of the validation, one per message and in order.
+        Worker processes validate with the rules, length limit and measures of
+        this process, whatever their start method.
+    """
+    function = partial(
+        validate if cache is None else cache.validate, fail_fast=fail_fast
+    )
+    # Options are copied as dicts, as the default read-only ones cannot be pickled.
+    rules = tuple(
+        rule._replace(options=dict(rule.options))
+        for rule in RuleRegistry.snapshot().values()
+    )
+    initializer = partial(
+        _init_worker, rules, Commit.MAX_LENGTH, RuleRegistry.is_timed()
+    )
+    yield from ParallelValidator(jobs=jobs, initializer=initializer).map(
+        function, messages
+    )
+
+
+def _init_worker(
+    rules: Tuple[Rule, ...], max_length: Optional[int], timed: bool
+) -> None:
+    """Prepare a worker process with the rules of the parent process."""
+    RuleRegistry.load_plugins()
+    RuleRegistry.restore({rule.name: rule for rule in rules})
+    Commit.MAX_LENGTH = max_length
+    if timed:
+        RuleRegistry.time()
+
+
+class BatchSummary:
+    """Class that summarizes the results of a batch of validations, and their stats."""
+
+    SUCCESS_CODE = 0
+    FAILURE_CODE = 1
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.stats: Optional[Stats] = None
+
+    def add(self, result: Result) -> Result:
+        """
+        Register a result in the summary.
+
+        Parameters
+        ----------
+        result: Result
+            Result of a single validation.
+
+        Returns
+        -------
+        Result:
+            Same result, to use the summary while iterating.
+        """
+        self.total += 1
+        if result.return_code:
+            self.failed += 1
+        if result.stats is not None:
+            if self.stats is None:
+                self.stats = Stats()
+            self.stats.merge(result.stats)
+        return result
+
+    @property
+    def return_code(self) -> int:
+        """Get the return code of the whole batch, always inside 0-255 range."""
+        return self.FAILURE_CODE if self.failed else self.SUCCESS_CODE
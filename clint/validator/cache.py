@@ -0,0 +1,190 @@
+"""Content addressed memoization of validation results."""
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from ..result import Result
+from ..trace import Tracer
+from .batch import Message, validate
+from .digest import rules_digest
+from .rules import RuleRegistry
+
+
+class ResultCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Class that memoizes validation results by message and rules digest.
+
+    Results are kept in a bounded in-process LRU and, optionally, in a SQLite
+    store shared between processes. Keys include the digest of the rules,
+    derived again whenever the registry changes. Pickled caches resolve to one
+    shared instance per process, so worker processes keep their LRU between
+    chunks. Memoized results do not keep their stats, as reusing them runs no
+    rule: results from the cache have no stats.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+    _shared: Dict[Tuple[int, Optional[str]], "ResultCache"] = {}
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, path: Optional[str] = None):
+        """
+        Initialize the class attributes.
+
+        Parameters
+        ----------
+        max_size: int
+            Maximum number of results kept in memory.
+        path: str, optional
+            Path of the SQLite store shared between processes. Memory only if not
+            defined.
+        """
+        self.max_size = max_size
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._hasher = hashlib.blake2b(digest_size=16)
+        self._version = -1
+        self._connection = None
+
+    @classmethod
+    def shared(cls, max_size: int, path: Optional[str]) -> "ResultCache":
+        """Get the cache of this process for the given configuration."""
+        key = (max_size, path)
+        if key not in cls._shared:
+            cls._shared[key] = cls(max_size=max_size, path=path)
+        return cls._shared[key]
+
+    def __reduce__(self):
+        """Pickle only the configuration, to share one cache per process."""
+        return ResultCache.shared, (self.max_size, self.path)
+
+    def _key(self, message: Message, fail_fast: bool) -> bytes:
+        """Get the key of a message under the active rules and validation mode."""
+        version = RuleRegistry.version()
+        if version != self._version:
+            self._hasher = hashlib.blake2b(
+                rules_digest().encode("utf8"), digest_size=16
+            )
+            self._version = version
+        hasher = self._hasher.copy()
+        if isinstance(message, str):
+            hasher.update(b"\1" if fail_fast else b"\0")
+            hasher.update(message.encode("utf8", errors="surrogatepass"))
+        else:
+            # Raw messages are also checked as bytes, so they get their own keys.
+            hasher.update(b"\3" if fail_fast else b"\2")
+            hasher.update(message)
+        return hasher.digest()
+
+    def _store(self):
+        """Get the connection to the SQLite store, opening it on first use."""
+        if self._connection is None and self.path is not None:
+            import sqlite3  # pylint: disable=import-outside-toplevel
+
+            self._connection = sqlite3.connect(
+                self.path, timeout=30, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS results (key BLOB PRIMARY KEY, data TEXT)"
+            )
+        return self._connection
+
+    def get(self, message: Message, fail_fast: bool = False) -> Optional[Result]:
+        """
+        Get the memoized result of a message.
+
+        Parameters
+        ----------
+        message: str or bytes
+            Commit message.
+        fail_fast: bool
+            Get the result of a validation stopped at the first error.
+
+        Returns
+        -------
+        Result, optional
+            New copy of the memoized result, without stats. None if the message
+            is not memoized.
+        """
+        key = self._key(message, fail_fast)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        elif self.path is not None:
+            row = (
+                self._store()
+                .execute("SELECT data FROM results WHERE key = ?", (key,))
+                .fetchone()
+            )
+            if row is not None:
+                data = json.loads(row[0])
+                self._remember(key, data)
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Result.from_dict(data)
+
+    def put(self, message: Message, result: Result, fail_fast: bool = False) -> None:
+        """
+        Memoize the result of a message.
+
+        Parameters
+        ----------
+        message: str or bytes
+            Commit message.
+        result: Result
+            Result of the message validation.
+        fail_fast: bool
+            Indicate if the validation stopped at the first error.
+        """
+        key = self._key(message, fail_fast)
+        data = result.to_dict()
+        self._remember(key, data)
+        if self.path is not None:
+            self._store().execute(
+                "INSERT OR REPLACE INTO results (key, data) VALUES (?, ?)",
+                (key, json.dumps(data)),
+            )
+
+    def _remember(self, key: bytes, data: Dict[str, Any]) -> None:
+        """Keep a result in the LRU, evicting the least recently used ones."""
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def validate(self, message: Message, fail_fast: bool = False) -> Result:
+        """
+        Validate a commit message, reusing the memoized result if available.
+
+        Parameters
+        ----------
+        message: str or bytes
+            Commit message.
+        fail_fast: bool
+            Stop at the first error, registering only that one.
+
+        Returns
+        -------
+        Result:
+            Result of the validation, with the same contents as a new validation.
+        """
+        start = Tracer.clock()
+        result = self.get(message, fail_fast=fail_fast)
+        start = Tracer.span("get", "cache", start, hit=result is not None)
+        if result is None:
+            result = validate(message=message, fail_fast=fail_fast)
+            start = Tracer.clock()
+            self.put(message, result, fail_fast=fail_fast)
+            Tracer.span("put", "cache", start)
+        return result
+
+    def close(self) -> None:
+        """Close the SQLite store, if opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
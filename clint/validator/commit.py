@@ -1,21 +1,153 @@
 """Commit validator."""
-from typing import List, Optional
+import time
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from ..result import Result
+from ..result import NO_POSITION, FailFastException, Result, Stats
+from .element import Element
+from .exceptions import GenerationException
 from .paragraph import Paragraph
+from .rules import RuleRegistry
+from .scanner import Scanner
 from .subject import Subject
 
 
-class Commit:
+class ParseFailure(NamedTuple):
+    """Commit message that could not be parsed, with the reason."""
+
+    reason: str
+
+
+class Commit(Element):
     """Validator class for commit message."""
 
+    __slots__ = ("subject", "paragraphs")
+    subject: Subject
+    paragraphs: Tuple[Paragraph, ...]
+
     OPERATION_NAME = "Validator"
     OPERATION_BASE_ERROR_CODE = 0
+    COMPILE_THRESHOLD = 64
+    _calls = 0
+    _calls_version = -1
+    MAX_LENGTH: Optional[int] = None
 
     def __init__(self, text: str):
-        split = Commit.get_paragraphs(msg=text)
-        self.subject = Subject.generate(split.pop(0))
-        self.paragraphs = tuple(Paragraph.generate(p) for p in split)
+        parsed = Commit.parse(text)
+        if not isinstance(parsed, Commit):
+            raise GenerationException(parsed.reason)
+        for name in Commit.__slots__:
+            object.__setattr__(self, name, getattr(parsed, name))
+
+    @staticmethod
+    def parse(msg: str, stats: Optional[Stats] = None) -> Union["Commit", ParseFailure]:
+        """
+        Parse a commit message, without raising if it cannot be parsed.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+        stats: Stats, optional
+            Stats where the parsing of the subject and the detection of the
+            footers are counted, if given.
+
+        Returns
+        -------
+        Commit or ParseFailure
+            Commit instance if the message matches the pattern and length limits.
+            The reason why it does not otherwise.
+        """
+        start = time.perf_counter() if stats is not None else 0.0
+        spans = Scanner.paragraphs(msg)
+        subject = Commit._parse_subject(msg, spans)
+        middle = time.perf_counter() if stats is not None else 0.0
+        if stats is not None:
+            failed = isinstance(subject, ParseFailure)
+            stats.add("parse.subject", findings=int(failed), seconds=middle - start)
+        if isinstance(subject, ParseFailure):
+            return subject
+        paragraphs = tuple(Paragraph(text=msg[s:e]) for s, e in spans)
+        if stats is not None and paragraphs:
+            stats.add(
+                "parse.footers",
+                seconds=time.perf_counter() - middle,
+                calls=len(paragraphs),
+            )
+        return Commit._new(subject, paragraphs)
+
+    @staticmethod
+    def _parse_subject(
+        msg: str, spans: Iterator[Tuple[int, int]]
+    ) -> Union[Subject, ParseFailure]:
+        """Parse the subject of a commit message, taking its span."""
+        reason = Commit.length_error(len(msg))
+        if reason is not None:
+            return ParseFailure(reason)
+        start, end = next(spans)
+        reason = Subject.length_error(end - start)
+        if reason is not None:
+            return ParseFailure(reason)
+        subject = Subject.match(msg, start, end)
+        if subject is None:
+            return ParseFailure(
+                f"Message '{msg[start:end]}' did not match the pattern."
+            )
+        return subject
+
+    @staticmethod
+    def _new(subject: Subject, paragraphs: Tuple[Paragraph, ...]) -> "Commit":
+        """Get a new instance from its parsed elements."""
+        commit = object.__new__(Commit)
+        object.__setattr__(commit, "subject", subject)
+        object.__setattr__(commit, "paragraphs", paragraphs)
+        return commit
+
+    @staticmethod
+    def length_error(length: int) -> Optional[str]:
+        """
+        Get the error of a commit message longer than the maximum length, if any.
+
+        Parameters
+        ----------
+        length: int
+            Length of the commit message.
+
+        Returns
+        -------
+        str, optional
+            Error message if longer than `Commit.MAX_LENGTH`. None otherwise.
+        """
+        if Commit.MAX_LENGTH is not None and length > Commit.MAX_LENGTH:
+            return f"Message is longer than {Commit.MAX_LENGTH} characters."
+        return None
+
+    @staticmethod
+    def check_length(length: int) -> None:
+        """
+        Check that a commit message is not longer than the maximum length.
+
+        Parameters
+        ----------
+        length: int
+            Length of the commit message.
+
+        Raises
+        ------
+        GenerationException
+            If the commit message is longer than `Commit.MAX_LENGTH`.
+        """
+        reason = Commit.length_error(length)
+        if reason is not None:
+            raise GenerationException(reason)
 
     @staticmethod
     def get_paragraphs(msg: str) -> List[str]:
@@ -32,7 +164,7 @@ class Commit:
         list of str
             List of paragraphs, without trailing newline.
         """
-        return msg.rstrip("\n").split("\n\n")
+        return [msg[start:end] for start, end in Scanner.paragraphs(msg)]
 
     @staticmethod
     def generate(msg: str) -> Optional["Commit"]:
@@ -51,32 +183,236 @@ class Commit:
         """
         return Commit(text=msg)
 
-    def validate(self) -> Result:
+    def validate(self, fail_fast: bool = False, data: bytes = None) -> Result:
         """
         Validate that all attributes in the class are conventional commits compliant.
 
+        The subject is checked before the paragraphs, since most messages that are
+        not compliant fail in the subject, and the rules of the whole message go last.
+        Once compiled, the rules run in one function generated by RuleCompiler.
+
+        Parameters
+        ----------
+        fail_fast: bool
+            Stop at the first error, registering only that one.
+        data: bytes, optional
+            Raw message, checked by the rules of the bytes target before the
+            elements, if given.
+
         Returns
         -------
-        bool:
-            True if the object is valid.
-
-        Raises
-        ------
-        ValidatorException
-            If any attribute is not valid.
+        Result:
+            Result information of the validation, with the findings of every rule,
+            or the compliant action if there are none. Stops at the first error if
+            fail fast.
         """
         # pylint: disable=duplicate-code
         result = Result(
             operation=self.OPERATION_NAME,
             base_error_code=self.OPERATION_BASE_ERROR_CODE,
+            fail_fast=fail_fast,
         )
-        self.subject.validate(result=result)
-        for paragraph in self.paragraphs:
-            paragraph.validate(result=result)
-        if not result.actions:
+        validator = Commit.compiled()
+        try:
+            if data is not None:
+                Commit.validate_bytes(data, result=result)
+            if validator is not None:
+                validator(self, result)
+            else:
+                self.subject.validate(result=result)
+                for index, paragraph in enumerate(self.paragraphs, start=1):
+                    paragraph.validate(result=result, index=index)
+                for check, options in RuleRegistry.scheduled("message"):
+                    check(self, result, NO_POSITION, options)
+        except FailFastException:
+            return result
+        return Commit._compliant(result)
+
+    @staticmethod
+    def compiled() -> Optional[Callable[["Commit", Result], None]]:
+        """
+        Get the compiled rules, once enough commits are validated with them.
+
+        The compiler, with the modules it needs, is only imported once the process
+        validates `COMPILE_THRESHOLD` commits with the same rules, so single
+        validations, such as the ones of git hooks, never load it.
+
+        Returns
+        -------
+        callable, optional
+            Function generated by RuleCompiler. None until the threshold is
+            reached, or while the rules are measured.
+        """
+        version = RuleRegistry.version()
+        if Commit._calls_version != version:
+            Commit._calls_version = version
+            Commit._calls = 0
+        if Commit._calls < Commit.COMPILE_THRESHOLD:
+            Commit._calls += 1
+            return None
+        from .compiler import (  # pylint: disable=import-outside-toplevel,cyclic-import
+            RuleCompiler,
+        )
+
+        return RuleCompiler.validator()
+
+    @staticmethod
+    def validate_stream(
+        paragraphs: Iterable[str],
+        fail_fast: bool = False,
+        stats: Optional[Stats] = None,
+    ) -> Result:
+        """
+        Validate a commit message given paragraph by paragraph.
+
+        Every paragraph is validated and dropped once read, so memory is bounded
+        by the longest paragraph, unless rules of the message target are enabled,
+        since they check the whole commit. Results are the ones of generating and
+        validating the whole message, with the length of the message counted
+        without its trailing newlines.
+
+        Parameters
+        ----------
+        paragraphs: iterable of str
+            Paragraphs of the commit message, subject first, without separators
+            nor trailing newlines, as given by `Scanner.stream_paragraphs`.
+        fail_fast: bool
+            Stop at the first error, registering only that one.
+        stats: Stats, optional
+            Stats where the parsing is counted, kept by the result, if given.
+
+        Returns
+        -------
+        Result:
+            Result information of the validation.
+
+        Raises
+        ------
+        GenerationException
+            If the message is longer than `Commit.MAX_LENGTH`, or its subject does
+            not match the pattern.
+        """
+        start = time.perf_counter() if stats is not None else 0.0
+        paragraphs = iter(paragraphs)
+        text = next(paragraphs, "")
+        length = len(text)
+        reason = Subject.length_error(length)
+        subject = Subject.match(text) if reason is None else None
+        if stats is not None:
+            stats.add(
+                "parse.subject",
+                findings=int(subject is None),
+                seconds=time.perf_counter() - start,
+            )
+        if subject is None:
+            Commit._check_rest(length, paragraphs)
+            raise GenerationException(
+                reason or f"Message '{text}' did not match the pattern."
+            )
+        result = Result(
+            operation=Commit.OPERATION_NAME,
+            base_error_code=Commit.OPERATION_BASE_ERROR_CODE,
+            fail_fast=fail_fast,
+        )
+        result.stats = stats
+        kept: Optional[List[Paragraph]] = (
+            [] if RuleRegistry.scheduled("message") else None
+        )
+        try:
+            subject.validate(result=result)
+            for index, text in enumerate(paragraphs, start=1):
+                length += len(Scanner.PARAGRAPH_SEPARATOR) + len(text)
+                Commit.check_length(length)
+                start = time.perf_counter() if stats is not None else 0.0
+                paragraph = Paragraph(text=text)
+                if stats is not None:
+                    stats.add("parse.footers", seconds=time.perf_counter() - start)
+                paragraph.validate(result=result, index=index)
+                if kept is not None:
+                    kept.append(paragraph)
+            Commit.check_length(length)
+            if kept is not None:
+                commit = Commit._new(subject, tuple(kept))
+                for check, options in RuleRegistry.scheduled("message"):
+                    check(commit, result, NO_POSITION, options)
+        except FailFastException:
+            Commit._check_rest(length, paragraphs)
+            return result
+        return Commit._compliant(result)
+
+    @staticmethod
+    def _check_rest(length: int, paragraphs: Iterator[str]) -> None:
+        """Check the length of a message, reading the rest of its paragraphs."""
+        if Commit.MAX_LENGTH is not None:
+            for text in paragraphs:
+                length += len(Scanner.PARAGRAPH_SEPARATOR) + len(text)
+                Commit.check_length(length)
+            Commit.check_length(length)
+
+    @staticmethod
+    def _compliant(result: Result) -> Result:
+        """Register the compliant action in a result without findings."""
+        if not result.count:
             result.add_action(
                 action="validation",
                 message="Your commit message is CC compliant!",
                 is_error=False,
             )
         return result
+
+    @staticmethod
+    def validate_bytes(data: bytes, result: Result) -> None:
+        """
+        Validate a raw message with the rules of the bytes target.
+
+        Parameters
+        ----------
+        data: bytes
+            Raw message.
+        result: Result
+            Result where the findings are registered.
+        """
+        for check, options in RuleRegistry.scheduled("bytes"):
+            check(data, result, NO_POSITION, options)
+
+
+# pylint: disable=unused-argument
+
+
+@RuleRegistry.rule(target="bytes", action="encoding_utf8")
+def encoding_utf8(data: bytes, result: Result, index: int, options) -> None:
+    """Check that a raw message is valid UTF-8, decoding it only if not ASCII."""
+    if not data.isascii():
+        try:
+            data.decode("utf8")
+        except UnicodeDecodeError as exc:
+            result.add_action(
+                action="encoding_utf8",
+                message="Message is not valid UTF-8, at byte {0}.",
+                is_error=True,
+                args=(exc.start,),
+                index=index,
+                span=(exc.start, exc.end),
+            )
+
+
+@RuleRegistry.rule(
+    target="message",
+    action="ticket_reference",
+    enabled=False,
+    options={"tokens": ("Refs",)},
+)
+def ticket_reference(commit: Commit, result: Result, index: int, options) -> None:
+    """Check that some footer references a ticket, with one of the `tokens` option."""
+    if not any(
+        footer.token in options["tokens"]
+        for paragraph in commit.paragraphs
+        for footer in paragraph.footers
+    ):
+        result.add_action(
+            action="ticket_reference",
+            message="Message must reference a ticket in a '{0}' footer.",
+            is_error=True,
+            args=("' or '".join(options["tokens"]),),
+            index=index,
+        )
@@ -0,0 +1,337 @@
+"""Compilation of the active rules into one validation function."""
+import ast
+import builtins
+import inspect
+import marshal
+import os
+import sys
+import textwrap
+from types import CodeType, FunctionType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from ..result import NO_POSITION, Result
+from .paths import CACHE_DIRECTORY_VARIABLE, cache_directory
+from .rules import TARGETS, Check, Rule, RuleRegistry
+
+Validator = Callable[[Any, Result], None]
+Binding = Tuple[str, str, str]
+
+# Names of the generated function, which inlined rules cannot bind as globals.
+RESERVED_NAMES = {"validate", "commit", "result", "index", "subject"}
+RESERVED_NAMES |= {"paragraph", "footer", "__builtins__"}
+
+# Statements that do not keep their meaning once the body of a check is inlined.
+NOT_INLINABLE = (
+    ast.Return,
+    ast.Yield,
+    ast.YieldFrom,
+    ast.Await,
+    ast.Global,
+    ast.Nonlocal,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+    ast.ClassDef,
+    ast.Lambda,
+)
+
+
+class _Renamer(ast.NodeTransformer):
+    """Transformer that renames the variables of an inlined check."""
+
+    def __init__(self, names: Dict[str, str]):
+        self.names = names
+
+    def visit_Name(self, node: ast.Name) -> ast.Name:  # pylint: disable=invalid-name
+        """Rename a variable, if needed."""
+        if node.id in self.names:
+            return ast.copy_location(
+                ast.Name(id=self.names[node.id], ctx=node.ctx), node
+            )
+        return node
+
+
+class RuleCompiler:
+    """
+    Class that compiles the enabled rules into one specialized validation function.
+
+    The generated function walks the commit elements once, after the rules of raw
+    messages, with the body of every check inlined, or called when it cannot be
+    inlined (closures, lambdas, early returns). Commits use the interpreted rules
+    until a process validates `Commit.COMPILE_THRESHOLD` messages with the same
+    rules, and only then import this module, so single validations never pay its
+    imports or the compilation. Compiled code is kept in memory and on disk by
+    rules digest, under the directory of the `CLINT_CACHE_DIR` environment
+    variable, or `clint` in the user cache directory.
+    """
+
+    DIRECTORY_VARIABLE = CACHE_DIRECTORY_VARIABLE
+    FILENAME = "validator-{digest}.{tag}.bin"
+    _functions: Dict[str, Validator] = {}
+    _function: Optional[Validator] = None
+    _version = -1
+
+    @staticmethod
+    def validator() -> Optional[Validator]:
+        """
+        Get the compiled validation function of the current rules.
+
+        Returns
+        -------
+        callable, optional
+            Function that validates a commit, registering the findings in a result,
+            compiled on first use after every change of the rules. None while the
+            rules are measured.
+        """
+        if RuleRegistry.is_timed():
+            return None
+        version = RuleRegistry.version()
+        if RuleCompiler._version != version or RuleCompiler._function is None:
+            RuleCompiler._function = RuleCompiler.compile()
+            RuleCompiler._version = version
+        return RuleCompiler._function
+
+    @staticmethod
+    def compile() -> Validator:
+        """
+        Get the validation function of the enabled rules, compiling it if needed.
+
+        Returns
+        -------
+        callable:
+            Function that validates a commit, registering the findings in a result.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .digest import rules_digest
+
+        digest = rules_digest()
+        function = RuleCompiler._functions.get(digest)
+        if function is None:
+            loaded = RuleCompiler._load(digest)
+            if loaded is None:
+                loaded = RuleCompiler.generate()
+                RuleCompiler._save(digest, *loaded)
+            function = RuleCompiler._build(*loaded)
+            RuleCompiler._functions[digest] = function
+        return function
+
+    @staticmethod
+    def generate() -> Tuple[CodeType, Tuple[Binding, ...]]:
+        """
+        Generate the code of the validation function of the enabled rules.
+
+        Returns
+        -------
+        tuple:
+            Module code that defines the `validate` function, and the bindings of
+            its global names, as kind, rule name and name in the rule module.
+        """
+        enabled = [rule for rule in RuleRegistry.rules() if rule.enabled]
+        rules = {
+            target: [rule for rule in enabled if rule.target == target]
+            for target in TARGETS
+            if target != "bytes"
+        }
+        lines = ["def validate(commit, result):"]
+        if rules["subject"]:
+            lines += ["    subject = commit.subject", "    index = 0"]
+            lines += RuleCompiler._placeholders(rules["subject"], "subject", 1)
+        if rules["paragraph"] or rules["footer"]:
+            lines += ["    index = 0", "    for paragraph in commit.paragraphs:"]
+            lines += ["        index += 1"]
+            lines += RuleCompiler._placeholders(rules["paragraph"], "paragraph", 2)
+            if rules["footer"]:
+                lines += ["        for footer in paragraph.footers:"]
+                lines += RuleCompiler._placeholders(rules["footer"], "footer", 3)
+        if rules["message"]:
+            lines += [f"    index = {NO_POSITION}"]
+            lines += RuleCompiler._placeholders(rules["message"], "commit", 1)
+        lines += ["    return None"]
+        module = ast.parse("\n".join(lines))
+        bindings: Dict[str, Binding] = {}
+        numbered = [rule for target in rules.values() for rule in target]
+        module.body[0].body = RuleCompiler._expand(
+            module.body[0].body, numbered, bindings
+        )
+        ast.fix_missing_locations(module)
+        code = compile(module, "<clint-validator>", "exec")
+        return code, tuple(bindings.values())
+
+    @staticmethod
+    def _placeholders(rules: List[Rule], element: str, depth: int) -> List[str]:
+        """Get the placeholder lines of the rules of an element."""
+        indent = "    " * depth
+        return [f"{indent}{element}.__rule__" for _ in rules] or [f"{indent}pass"]
+
+    @staticmethod
+    def _expand(
+        body: List[ast.stmt], rules: List[Rule], bindings: Dict[str, Binding]
+    ) -> List[ast.stmt]:
+        """Replace the placeholders of a body, and its nested loops, in order."""
+        expanded: List[ast.stmt] = []
+        for statement in body:
+            if isinstance(statement, ast.For):
+                statement.body = RuleCompiler._expand(statement.body, rules, bindings)
+                expanded.append(statement)
+            elif (
+                isinstance(statement, ast.Expr)
+                and isinstance(statement.value, ast.Attribute)
+                and statement.value.attr == "__rule__"
+            ):
+                number = len(bindings)
+                rule = rules.pop(0)
+                element = statement.value.value.id  # type: ignore
+                expanded += RuleCompiler._inline(
+                    rule, number, element, bindings
+                ) or RuleCompiler._call(rule, number, element, bindings)
+            else:
+                expanded.append(statement)
+        return expanded
+
+    @staticmethod
+    def _call(
+        rule: Rule, number: int, element: str, bindings: Dict[str, Binding]
+    ) -> List[ast.stmt]:
+        """Get the statements that call the check of a rule."""
+        bindings[f"check_{number}"] = ("check", rule.name, f"check_{number}")
+        bindings[f"options_{number}"] = ("options", rule.name, f"options_{number}")
+        call = f"check_{number}({element}, result, index, options_{number})"
+        return ast.parse(call).body
+
+    @staticmethod
+    def _parse(check: Check) -> Optional[ast.FunctionDef]:
+        """Get the syntax tree of a check, if it can be inlined."""
+        if not isinstance(check, FunctionType) or check.__code__.co_freevars:
+            return None
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(check)))
+        except (OSError, TypeError, SyntaxError):
+            return None
+        function = tree.body[0]
+        if not isinstance(function, ast.FunctionDef):
+            return None
+        arguments = function.args
+        if (
+            len(arguments.args) != 4
+            or arguments.vararg
+            or arguments.kwarg
+            or arguments.kwonlyargs
+            or arguments.defaults
+        ):
+            return None
+        if ast.get_docstring(function):
+            function.body = function.body[1:]
+        return function
+
+    @staticmethod
+    def _inline(
+        rule: Rule, number: int, element: str, bindings: Dict[str, Binding]
+    ) -> Optional[List[ast.stmt]]:
+        """Get the body of the check of a rule, renamed to run inline."""
+        function = RuleCompiler._parse(rule.check)
+        if function is None:
+            return None
+        nodes = [node for statement in function.body for node in ast.walk(statement)]
+        if any(isinstance(node, NOT_INLINABLE) for node in nodes):
+            return None
+        parameters = [argument.arg for argument in function.args.args]
+        names = dict(zip(parameters, (element, "result", "index", f"options_{number}")))
+        variables = [node for node in nodes if isinstance(node, ast.Name)]
+        stored = {node.id for node in variables if not isinstance(node.ctx, ast.Load)}
+        if stored & set(parameters):
+            return None
+        names.update({name: f"{name}_{number}" for name in stored})
+        globals_ = RuleCompiler._globals(
+            rule, {node.id for node in variables if node.id not in names}, bindings
+        )
+        if globals_ is None:
+            return None
+        bindings.update(globals_)
+        if any(node.id == parameters[3] for node in variables):
+            bindings[f"options_{number}"] = ("options", rule.name, f"options_{number}")
+        renamer = _Renamer(names)
+        return [renamer.visit(statement) for statement in function.body] or [ast.Pass()]
+
+    @staticmethod
+    def _globals(
+        rule: Rule, names: Set[str], bindings: Dict[str, Binding]
+    ) -> Optional[Dict[str, Binding]]:
+        """Get the bindings of the global names of a check, if they do not clash."""
+        globals_: Dict[str, Binding] = {}
+        for name in names:
+            if name in RESERVED_NAMES:
+                return None
+            if name in rule.check.__globals__:
+                binding = ("global", rule.name, name)
+                known = bindings.get(name)
+                if known is not None and RuleCompiler._resolve(
+                    known
+                ) is not RuleCompiler._resolve(binding):
+                    return None
+                globals_[name] = binding
+            elif not hasattr(builtins, name):
+                return None
+        return globals_
+
+    @staticmethod
+    def _resolve(binding: Binding) -> Any:
+        """Get the value of a global name of the generated function."""
+        kind, name, value = binding
+        rule = next(rule for rule in RuleRegistry.rules() if rule.name == name)
+        if kind == "check":
+            return rule.check
+        if kind == "options":
+            return rule.options
+        return rule.check.__globals__[value]
+
+    @staticmethod
+    def _build(code: CodeType, bindings: Tuple[Binding, ...]) -> Validator:
+        """Get the validation function defined by generated code."""
+        namespace = {binding[2]: RuleCompiler._resolve(binding) for binding in bindings}
+        exec(code, namespace)  # pylint: disable=exec-used
+        return namespace["validate"]
+
+    @staticmethod
+    def directory() -> str:
+        """
+        Get the directory of the compiled code.
+
+        Returns
+        -------
+        str:
+            `CLINT_CACHE_DIR` environment variable if defined. Otherwise, `clint`
+            in the user cache directory.
+        """
+        return cache_directory()
+
+    @staticmethod
+    def _path(digest: str) -> str:
+        """Get the path of the compiled code of a rules digest."""
+        filename = RuleCompiler.FILENAME.format(
+            digest=digest[:32], tag=sys.implementation.cache_tag
+        )
+        return os.path.join(RuleCompiler.directory(), filename)
+
+    @staticmethod
+    def _load(digest: str) -> Optional[Tuple[CodeType, Tuple[Binding, ...]]]:
+        """Get the compiled code of a rules digest from disk, if available."""
+        try:
+            with open(RuleCompiler._path(digest), mode="rb") as file:
+                code, bindings = marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(code, CodeType):
+            return None
+        return code, bindings
+
+    @staticmethod
+    def _save(digest: str, code: CodeType, bindings: Tuple[Binding, ...]) -> None:
+        """Keep the compiled code of a rules digest on disk, if possible."""
+        path = RuleCompiler._path(digest)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(temp_path, mode="wb") as file:
+                marshal.dump((code, bindings), file)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
@@ -0,0 +1,80 @@
+"""Digest of the active validation rules."""
+import hashlib
+from functools import partial
+from types import CodeType
+from typing import Any
+
+from .. import __version__
+from .commit import Commit
+from .footer import Footer
+from .paragraph import Paragraph
+from .rules import RuleRegistry
+from .subject import Subject
+
+
+def _update_with_code(digest, code: CodeType) -> None:
+    """Update a digest with the bytecode, names and constants of a code object."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf8"))
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_with_code(digest, const)
+        else:
+            digest.update(repr(const).encode("utf8"))
+
+
+def _update_with_check(digest, check: Any) -> None:
+    """
+    Update a digest with the code of a check, or what describes it without code.
+
+    Partial functions are described by their function and arguments, and other
+    callable objects by their class, the code of their call method and their
+    representation, which changes on every run unless the class defines it.
+    """
+    code = getattr(check, "__code__", None)
+    if isinstance(code, CodeType):
+        _update_with_code(digest, code)
+    elif isinstance(check, partial):
+        _update_with_check(digest, check.func)
+        digest.update(repr((check.args, sorted(check.keywords.items()))).encode("utf8"))
+    else:
+        kind = type(check)
+        digest.update(f"{kind.__module__}.{kind.__qualname__}".encode("utf8"))
+        call = getattr(kind, "__call__", None)
+        if isinstance(getattr(call, "__code__", None), CodeType):
+            _update_with_code(digest, call.__code__)
+        digest.update(repr(check).encode("utf8"))
+
+
+def rules_digest() -> str:
+    """
+    Get a digest that changes whenever the validation rules change.
+
+    The digest covers the CLint version, the patterns, the valid commit types and
+    separators, the maximum lengths, the code of the validate methods and every
+    registered rule, with its state, options and code, so patched, updated or
+    reconfigured rules get a new one.
+
+    Returns
+    -------
+    str:
+        Hexadecimal digest of the active rules.
+    """
+    digest = hashlib.sha256(__version__.encode("utf8"))
+    for pattern in (Subject.PATTERN, Subject.ASCII_PATTERN):
+        digest.update(pattern.pattern.encode("utf8"))
+    for pattern in (Footer.PATTERN, Footer.ASCII_PATTERN):
+        digest.update(pattern.pattern.encode("utf8"))
+    digest.update("\0".join(sorted(Subject.VALID_COMMIT_TYPES)).encode("utf8"))
+    digest.update("\0".join(Footer.VALID_SEPARATORS).encode("utf8"))
+    digest.update(repr((Commit.MAX_LENGTH, Subject.MAX_LENGTH)).encode("utf8"))
+    for element in (Commit, Subject, Paragraph, Footer):
+        _update_with_code(digest, element.validate.__code__)
+    for rule in RuleRegistry.rules():
+        digest.update(
+            repr(
+                (rule.name, rule.cost, rule.enabled, sorted(rule.options.items()))
+            ).encode("utf8")
+        )
+        _update_with_check(digest, rule.check)
+    return digest.hexdigest()
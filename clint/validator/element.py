@@ -0,0 +1,55 @@
+"""Base class of the commit message elements."""
+from typing import Any, Dict, Iterator, Tuple
+
+# Contents of the character classes of the element patterns. The ASCII ones
+# match the same ASCII characters as the Unicode ones, `\s` included, from a
+# table of the regex engine instead of the Unicode database.
+UNICODE_CLASSES = {"word": r"\w", "space": r"\s"}
+ASCII_CLASSES = {"word": "0-9A-Za-z_", "space": r"\t\n\x0b\x0c\r\x1c-\x1f "}
+
+
+class Element:
+    """
+    Base class for immutable commit message elements.
+
+    Elements keep their attributes in slots instead of a dict, and cannot be
+    changed after initialization, so parsed commits can be kept in memory by the
+    million and shared safely. Subclasses set their attributes on initialization
+    with `object.__setattr__`.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Forbid changes after initialization."""
+        raise AttributeError(f"'{type(self).__name__}' object is immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        """Forbid changes after initialization."""
+        raise AttributeError(f"'{type(self).__name__}' object is immutable.")
+
+    def _span(
+        self, attribute: str, names: Tuple[str, ...], start: int = 0
+    ) -> Tuple[int, int]:
+        """Get the span of an attribute in a text made of consecutive attributes."""
+        end = start
+        for name in names:
+            end = start + len(getattr(self, name))
+            if name == attribute:
+                break
+            start = end
+        return start, end
+
+    def _slots(self) -> Iterator[str]:
+        """Get the names of every slot of the element."""
+        for cls in type(self).__mro__:
+            yield from getattr(cls, "__slots__", ())
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Get the attributes to pickle."""
+        return {name: getattr(self, name) for name in self._slots()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Set the attributes of an unpickled element."""
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
@@ -12,3 +12,7 @@ class GenerationException(ValidatorException):
 
 class ValidationException(ValidatorException):
     """Exception in validation process."""
+
+
+class RuleException(ValidatorException):
+    """Exception in rule registration."""
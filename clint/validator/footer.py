@@ -1,25 +1,47 @@
 """Footer validator."""
 import re
 import string
+import sys
+from typing import Optional, Tuple
 
-from ..result import Result
+from ..result import NO_POSITION, Result
+from .element import ASCII_CLASSES, UNICODE_CLASSES, Element
 from .exceptions import GenerationException
+from .rules import RuleRegistry
 
+WHITESPACE = frozenset(string.whitespace)
 
-class Footer:
+
+class Footer(Element):
     """Validator class for paragraphs (body & footers) on the commit message."""
 
-    PATTERN = re.compile(
-        r"(?P<token>BREAKING CHANGE|[\w|-]+)"
-        + r"(?P<separator>:\s+|\s#)"
-        + r"(?P<description>[\w. ]+)"
+    __slots__ = ("token", "separator", "description", "offset")
+    token: str
+    separator: str
+    description: str
+    offset: int
+
+    # The token is atomic, emulated with a lookahead and a backreference to its
+    # capture. The separator can only give back whitespace, and the description
+    # needs a single character to match, so the match is linear in the line length.
+    # ASCII lines match with the same pattern made of ASCII character classes.
+    TEMPLATE = (
+        r"(?=(?P<token>BREAKING CHANGE|[{word}|-]+))(?P=token)"
+        + r"(?P<separator>:[{space}]+|[{space}]#)"
+        + r"(?P<description>[{word}. ]+)"
         + r"\n?"
     )
+    PATTERN = re.compile(TEMPLATE.format(**UNICODE_CLASSES))
+    ASCII_PATTERN = re.compile(TEMPLATE.format(**ASCII_CLASSES))
+
+    VALID_SEPARATORS = (": ", " #")
 
-    def __init__(self, token: str, separator: str, description: str):
-        self.token = token or ""
-        self.separator = separator or ""
-        self.description = description or ""
+    def __init__(self, token: str, separator: str, description: str, offset: int = 0):
+        init = object.__setattr__
+        init(self, "token", sys.intern(token or ""))
+        init(self, "separator", sys.intern(separator or ""))
+        init(self, "description", description or "")
+        init(self, "offset", offset)
 
     @staticmethod
     def generate(msg: str) -> "Footer":
@@ -41,17 +63,58 @@ class Footer:
         ValidatorException
             If the commit footer line did not match the pattern.
         """
-        match = Footer.PATTERN.match(msg)
-        if match is None:
+        footer = Footer.match(msg)
+        if footer is None:
             raise GenerationException(f"Message '{msg}' did not match the pattern.")
-        groups = match.groupdict()
+        return footer
+
+    @staticmethod
+    def match(msg: str, pos: int = 0, endpos: int = None) -> Optional["Footer"]:
+        """
+        Get a new instance of Footer from a region of a commit message.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+        pos: int
+            Start offset of the footer line.
+        endpos: int, optional
+            End offset of the footer line. The end of the message if not defined.
+
+        Returns
+        -------
+        Footer, optional
+            New instance if the region matches the pattern. None otherwise.
+        """
+        pattern = Footer.ASCII_PATTERN if msg.isascii() else Footer.PATTERN
+        match = pattern.match(msg, pos, len(msg) if endpos is None else endpos)
+        if match is None:
+            return None
         return Footer(
-            token=groups["token"],
-            separator=groups["separator"],
-            description=groups["description"],
+            token=match.group("token"),
+            separator=match.group("separator"),
+            description=match.group("description"),
+            offset=pos,
         )
 
-    def validate(self, result: Result) -> None:
+    def span(self, attribute: str) -> Tuple[int, int]:
+        """
+        Get the offset span of an attribute in the paragraph of the footer.
+
+        Parameters
+        ----------
+        attribute: str
+            Attribute name, one of token, separator or description.
+
+        Returns
+        -------
+        tuple of int
+            Start and end offsets of the attribute.
+        """
+        return self._span(attribute, ("token", "separator", "description"), self.offset)
+
+    def validate(self, result: Result, index: int = NO_POSITION) -> None:
         """
         Validate that all attributes in the class are conventional commits compliant.
 
@@ -59,42 +122,87 @@ class Footer:
         ----------
         result: Result
             Result object to register errors.
+        index: int
+            Index of the paragraph of the footer in the commit message.
 
         Raises
         ------
         ValidatorException
             If any attribute is not valid.
         """
-        # pylint: disable=duplicate-code
-        if not self.token:
-            result.add_action(
-                action="token_empty",
-                message="Token cannot be empty.",
-                is_error=True,
-            )
+        for check, options in RuleRegistry.scheduled("footer"):
+            check(self, result, index, options)
+
+
+# pylint: disable=unused-argument
+
+
+@RuleRegistry.rule(target="footer", action="token_empty")
+def token_empty(footer: Footer, result: Result, index: int, options) -> None:
+    """Check that the token is not empty."""
+    if not footer.token:
+        result.add_action(
+            action="token_empty",
+            message="Token cannot be empty.",
+            is_error=True,
+            index=index,
+            span=footer.span("token"),
+        )
+
+
+@RuleRegistry.rule(target="footer", action="separator_empty")
+def separator_empty(footer: Footer, result: Result, index: int, options) -> None:
+    """Check that the separator is not empty."""
+    # pylint: disable=duplicate-code
+    if not footer.separator:
+        result.add_action(
+            action="separator_empty",
+            message="Separator cannot be empty.",
+            is_error=True,
+            index=index,
+            span=footer.span("separator"),
+        )
+
+
+@RuleRegistry.rule(target="footer", action="separator_valid")
+def separator_valid(footer: Footer, result: Result, index: int, options) -> None:
+    """Check that a separator is one of the valid footer separators."""
+    if footer.separator and footer.separator not in footer.VALID_SEPARATORS:
+        result.add_action(
+            action="separator_valid",
+            message="Separator '{0}' is not valid.",
+            is_error=True,
+            args=(footer.separator,),
+            index=index,
+            span=footer.span("separator"),
+        )
+
+
+@RuleRegistry.rule(target="footer", action="description_empty")
+def description_empty(footer: Footer, result: Result, index: int, options) -> None:
+    """Check that the description is not empty."""
+    # pylint: disable=duplicate-code
+    if not footer.description:
+        result.add_action(
+            action="description_empty",
+            message="Description cannot be empty.",
+            is_error=True,
+            index=index,
+            span=footer.span("description"),
+        )
+
+
+@RuleRegistry.rule(target="footer", action="token_whitespace", cost=3)
+def token_whitespace(footer: Footer, result: Result, index: int, options) -> None:
+    """Check that the token has no whitespace, except for breaking changes."""
+    if footer.token != "BREAKING CHANGE" and not WHITESPACE.isdisjoint(footer.token):
         for whitespace in string.whitespace:
-            if self.token != "BREAKING CHANGE" and whitespace in self.token:
+            if whitespace in footer.token:
                 result.add_action(
                     action="token_whitespace",
-                    message=f"Token '{self.token}' cannot have '{whitespace}' char.",
+                    message="Token '{0}' cannot have '{1}' char.",
                     is_error=True,
+                    args=(footer.token, whitespace),
+                    index=index,
+                    span=footer.span("token"),
                 )
-        if not self.separator:
-            result.add_action(
-                action="separator_empty",
-                message="Separator cannot be empty.",
-                is_error=True,
-            )
-        valid_separators = [": ", " #"]
-        if self.separator and self.separator not in valid_separators:
-            result.add_action(
-                action="separator_valid",
-                message=f"Separator '{self.separator}' is not valid.",
-                is_error=True,
-            )
-        if not self.description:
-            result.add_action(
-                action="description_empty",
-                message="Description cannot be empty.",
-                is_error=True,
-            )
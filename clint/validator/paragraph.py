@@ -1,18 +1,28 @@
 """Paragraph validator."""
-from ..result import Result
-from .exceptions import GenerationException
+from typing import Tuple
+
+from ..result import NO_POSITION, Result
+from .element import Element
 from .footer import Footer
+from .rules import RuleRegistry
+from .scanner import Scanner
 
 
-class Paragraph:
+class Paragraph(Element):
     """Validator class for paragraphs (body & footers) on the commit message."""
 
+    __slots__ = ("text", "footers", "is_pure")
+    text: str
+    footers: Tuple[Footer, ...]
+    is_pure: bool
+
     def __init__(self, text: str):
-        self.text = text or ""
-        self.footers = ()
-        self.is_pure = False
-        self.__footers_generated_with = None
-        self.__generate_footers()
+        text = text or ""
+        footers, is_pure = Paragraph.generate_footers(text)
+        init = object.__setattr__
+        init(self, "text", text)
+        init(self, "footers", footers)
+        init(self, "is_pure", is_pure)
 
     @staticmethod
     def generate(msg: str) -> "Paragraph":
@@ -31,24 +41,32 @@ class Paragraph:
         """
         return Paragraph(text=msg)
 
-    def __generate_footers(self) -> None:
-        """Generate footers tuple."""
-        if self.__footers_generated_with == self.text:
-            return
+    @staticmethod
+    def generate_footers(text: str) -> Tuple[Tuple[Footer, ...], bool]:
+        """
+        Get the footers of a commit paragraph.
+
+        Parameters
+        ----------
+        text: str
+            Commit paragraph.
+
+        Returns
+        -------
+        tuple
+            Tuple of footers in the paragraph, and True if the paragraph is pure,
+            meaning that it has no footers or only footers.
+        """
         footers = []
-        splited_text = self.text.split("\n")
-        for line in splited_text:
-            try:
-                footer = Footer.generate(line)
-            except GenerationException:
-                pass
-            else:
+        lines = 0
+        for start, end in Scanner.lines(text):
+            lines += 1
+            footer = Footer.match(text, start, end)
+            if footer is not None:
                 footers.append(footer)
-        self.is_pure = not footers or len(footers) == len(splited_text)
-        self.footers = tuple(footers)
-        self.__footers_generated_with = self.text
+        return tuple(footers), not footers or len(footers) == lines
 
-    def validate(self, result: Result) -> None:
+    def validate(self, result: Result, index: int = NO_POSITION) -> None:
         """
         Validate that all attributes in the class are conventional commits compliant.
 
@@ -56,37 +74,75 @@ class Paragraph:
         ----------
         result: Result
             Result object to register errors.
+        index: int
+            Index of the paragraph in the commit message.
 
         Raises
         ------
         ValidatorException
             If any attribute is not valid.
         """
-        # pylint: disable=duplicate-code
-        self.__generate_footers()
-        if self.text.startswith("\n"):
-            result.add_action(
-                action="paragraph_startnewline",
-                message="Paragraph cannot start with new line.",
-                is_error=True,
-            )
-        if self.text.endswith("\n"):
-            result.add_action(
-                action="paragraph_endnewline",
-                message="Paragraph cannot end with new line.",
-                is_error=True,
-            )
-        if not self.is_pure:
-            result.add_action(
-                action="paragraph_ispure",
-                message="Paragraph is a mix of footers and common lines.",
-                is_error=True,
-            )
-        if not self.text:
-            result.add_action(
-                action="paragraph_empty",
-                message="Paragraph cannot be empty.",
-                is_error=True,
-            )
+        for check, options in RuleRegistry.scheduled("paragraph"):
+            check(self, result, index, options)
         for footer in self.footers:
-            footer.validate(result=result)
+            footer.validate(result=result, index=index)
+
+
+# pylint: disable=unused-argument
+
+
+@RuleRegistry.rule(target="paragraph", action="paragraph_startnewline")
+def paragraph_startnewline(
+    paragraph: Paragraph, result: Result, index: int, options
+) -> None:
+    """Check that the paragraph does not start with a new line."""
+    if paragraph.text.startswith("\n"):
+        result.add_action(
+            action="paragraph_startnewline",
+            message="Paragraph cannot start with new line.",
+            is_error=True,
+            index=index,
+            span=(0, 1),
+        )
+
+
+@RuleRegistry.rule(target="paragraph", action="paragraph_endnewline")
+def paragraph_endnewline(
+    paragraph: Paragraph, result: Result, index: int, options
+) -> None:
+    """Check that the paragraph does not end with a new line."""
+    if paragraph.text.endswith("\n"):
+        end = len(paragraph.text)
+        result.add_action(
+            action="paragraph_endnewline",
+            message="Paragraph cannot end with new line.",
+            is_error=True,
+            index=index,
+            span=(end - 1, end),
+        )
+
+
+@RuleRegistry.rule(target="paragraph", action="paragraph_ispure")
+def paragraph_ispure(paragraph: Paragraph, result: Result, index: int, options) -> None:
+    """Check that the paragraph is not a mix of footers and common lines."""
+    if not paragraph.is_pure:
+        result.add_action(
+            action="paragraph_ispure",
+            message="Paragraph is a mix of footers and common lines.",
+            is_error=True,
+            index=index,
+            span=(0, len(paragraph.text)),
+        )
+
+
+@RuleRegistry.rule(target="paragraph", action="paragraph_empty")
+def paragraph_empty(paragraph: Paragraph, result: Result, index: int, options) -> None:
+    """Check that the paragraph is not empty."""
+    if not paragraph.text:
+        result.add_action(
+            action="paragraph_empty",
+            message="Paragraph cannot be empty.",
+            is_error=True,
+            index=index,
+            span=(0, 0),
+        )
@@ -0,0 +1,127 @@
+"""Parallel validation of commit messages in a process pool."""
+import os
+import time
+from itertools import chain, islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .. import trace
+
+
+def _run_chunk(
+    function: Callable, chunk: List[Any]
+) -> Tuple[List[Any], float, List[Dict[str, Any]]]:
+    """Apply a function over a chunk of items, measuring the elapsed time."""
+    start = time.perf_counter()
+    results = [function(item) for item in chunk]
+    end = trace.Tracer.span("chunk", "worker", start, items=len(chunk))
+    return results, end - start, trace.Tracer.collect()
+
+
+class ParallelValidator:  # pylint: disable=too-few-public-methods
+    """Class that distributes validations over a pool of worker processes."""
+
+    SERIAL_THRESHOLD = 512
+    MIN_CHUNK_SIZE = 16
+    MAX_CHUNK_SIZE = 4096
+    TARGET_CHUNK_SECONDS = 0.05
+
+    def __init__(
+        self,
+        jobs: int = 1,
+        ordered: bool = True,
+        initializer: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the class attributes.
+
+        Parameters
+        ----------
+        jobs: int
+            Number of worker processes. Zero or less means one per CPU.
+        ordered: bool
+            Yield results in input order if True, in completion order otherwise.
+        initializer: callable, optional
+            Picklable function called once by every worker process, on start.
+        """
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.ordered = ordered
+        self.initializer = initializer
+
+    def map(self, function: Callable, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Apply a function over every item, in worker processes for big inputs.
+
+        Inputs smaller than SERIAL_THRESHOLD are processed in this process, so
+        they do not pay the pool startup.
+
+        Parameters
+        ----------
+        function: callable
+            Picklable function applied over every item.
+        items: iterable
+            Items to process, read lazily.
+
+        Yields
+        ------
+        any
+            Function result for every item.
+        """
+        iterator = iter(items)
+        head = list(islice(iterator, self.SERIAL_THRESHOLD))
+        if self.jobs == 1 or len(head) < self.SERIAL_THRESHOLD:
+            yield from map(function, chain(head, iterator))
+        else:
+            yield from self._map_parallel(function, chain(head, iterator))
+
+    def _map_parallel(  # pylint: disable=too-many-locals
+        self, function: Callable, items: Iterator[Any]
+    ) -> Iterator[Any]:
+        """Apply a function over every item, distributing chunks to the workers."""
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        max_chunks = self.jobs * 4
+        chunk_size = self.MIN_CHUNK_SIZE
+        pending: Dict[Any, int] = {}
+        completed: Dict[int, List[Any]] = {}
+        submitted = 0
+        next_index = 0
+        exhausted = False
+        with ProcessPoolExecutor(
+            max_workers=self.jobs, initializer=self.initializer
+        ) as executor:
+            while True:
+                while not exhausted and len(pending) + len(completed) < max_chunks:
+                    chunk = list(islice(items, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                        break
+                    future = executor.submit(_run_chunk, function, chunk)
+                    pending[future] = submitted
+                    submitted += 1
+                if not pending:
+                    break
+                with trace.Tracer.trace("wait", "pool", pending=len(pending)):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    results, elapsed, events = future.result()
+                    trace.Tracer.record(events)
+                    chunk_size = self._adapt_chunk_size(chunk_size, results, elapsed)
+                    if self.ordered:
+                        completed[index] = results
+                    else:
+                        yield from results
+                while next_index in completed:
+                    yield from completed.pop(next_index)
+                    next_index += 1
+
+    def _adapt_chunk_size(
+        self, chunk_size: int, results: List[Any], elapsed: float
+    ) -> int:
+        """Get the next chunk size, aiming to TARGET_CHUNK_SECONDS per chunk."""
+        if not results or elapsed <= 0:
+            return self.MAX_CHUNK_SIZE
+        estimate = int(self.TARGET_CHUNK_SECONDS * len(results) / elapsed)
+        size = (chunk_size + estimate) // 2
+        return max(self.MIN_CHUNK_SIZE, min(self.MAX_CHUNK_SIZE, size))
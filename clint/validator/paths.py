@@ -0,0 +1,22 @@
+"""Paths of the files cached between processes."""
+import os
+
+CACHE_DIRECTORY_VARIABLE = "CLINT_CACHE_DIR"
+
+
+def cache_directory() -> str:
+    """
+    Get the directory of the compiled rules and parsed configuration files.
+
+    Returns
+    -------
+    str:
+        `CLINT_CACHE_DIR` environment variable if defined. Otherwise, `clint` in
+        the user cache directory.
+    """
+    if os.environ.get(CACHE_DIRECTORY_VARIABLE):
+        return os.environ[CACHE_DIRECTORY_VARIABLE]
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(cache_home, "clint")
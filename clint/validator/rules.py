@@ -0,0 +1,398 @@
+"""Registry of the validation rules."""
+import importlib
+import os
+import time
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from ..result import Result, Stats
+from .exceptions import RuleException
+
+Check = Callable[[Any, Result, int, Mapping[str, Any]], None]
+
+TARGETS = ("bytes", "subject", "paragraph", "footer", "message")
+
+
+class Rule(NamedTuple):
+    """
+    Validation rule over one element of the commit message.
+
+    The check is called with the element, the result, the index of the paragraph
+    of the element and the options of the rule, and registers its findings in the
+    result. Rules of the same target run from the cheapest to the most expensive.
+    """
+
+    target: str
+    action: str
+    check: Check
+    cost: int = 1
+    enabled: bool = True
+    options: Mapping[str, Any] = MappingProxyType({})
+
+    @property
+    def name(self) -> str:
+        """Unique name of the rule, made of its target and action."""
+        return f"{self.target}.{self.action}"
+
+
+class RuleRegistry:
+    """
+    Class that keeps the validation rules and schedules them by target and cost.
+
+    The checks of every target are sorted once, and kept until the registry
+    changes, so the validation only loops over the enabled ones. Plugin modules,
+    which register their rules on import, are listed in the `CLINT_PLUGINS`
+    environment variable, separated by commas, and imported on first use.
+    """
+
+    PLUGINS_VARIABLE = "CLINT_PLUGINS"
+    _rules: Dict[str, Rule] = {}
+    _scheduled: Dict[str, Tuple[Tuple[Check, Mapping[str, Any]], ...]] = {}
+    _timings: Optional[Dict[str, List[float]]] = None
+    _plugins_loaded = False
+    _plugins: Dict[str, Tuple[Rule, ...]] = {}
+    _version = 0
+
+    @staticmethod
+    def register(rule: Rule) -> Rule:
+        """
+        Register a rule, replacing the one with the same name if any.
+
+        Parameters
+        ----------
+        rule: Rule
+            Rule to register.
+
+        Returns
+        -------
+        Rule:
+            Registered rule.
+
+        Raises
+        ------
+        RuleException
+            If the target of the rule is not valid.
+        """
+        if rule.target not in TARGETS:
+            raise RuleException(f"Target '{rule.target}' is not valid.")
+        RuleRegistry._rules[rule.name] = rule._replace(options=dict(rule.options))
+        RuleRegistry._changed()
+        return rule
+
+    @staticmethod
+    def rule(
+        target: str,
+        action: str,
+        cost: int = 1,
+        enabled: bool = True,
+        options: Optional[Dict[str, Any]] = None,
+    ) -> Callable[[Check], Check]:
+        """
+        Get a decorator that registers a function as the check of a rule.
+
+        Parameters
+        ----------
+        target: str
+            Element checked by the rule: bytes (raw message, only for messages
+            given as bytes), subject, paragraph, footer or message.
+        action: str
+            Action name of the findings of the rule.
+        cost: int
+            Relative cost of the check.
+        enabled: bool
+            Indicate if the rule runs by default.
+        options: dict, optional
+            Default options of the rule, passed to the check.
+
+        Returns
+        -------
+        callable:
+            Decorator that returns the check unchanged.
+        """
+
+        def decorator(check: Check) -> Check:
+            RuleRegistry.register(
+                Rule(target, action, check, cost, enabled, options or {})
+            )
+            return check
+
+        return decorator
+
+    @staticmethod
+    def unregister(name: str) -> None:
+        """
+        Remove the rules with the given name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the rule, or action name of the rules of every target.
+        """
+        for rule in RuleRegistry._find(name):
+            del RuleRegistry._rules[rule.name]
+        RuleRegistry._changed()
+
+    @staticmethod
+    def enable(name: str, enabled: bool = True) -> None:
+        """
+        Enable or disable the rules with the given name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the rule, or action name of the rules of every target.
+        enabled: bool
+            Indicate if the rules run.
+        """
+        for rule in RuleRegistry._find(name):
+            RuleRegistry._rules[rule.name] = rule._replace(enabled=enabled)
+        RuleRegistry._changed()
+
+    @staticmethod
+    def disable(name: str) -> None:
+        """
+        Disable the rules with the given name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the rule, or action name of the rules of every target.
+        """
+        RuleRegistry.enable(name, enabled=False)
+
+    @staticmethod
+    def configure(name: str, **options: Any) -> None:
+        """
+        Update the options of the rules with the given name.
+
+        Parameters
+        ----------
+        name: str
+            Name of the rule, or action name of the rules of every target.
+        options: Any
+            Options to update.
+        """
+        for rule in RuleRegistry._find(name):
+            RuleRegistry._rules[rule.name] = rule._replace(
+                options={**rule.options, **options}
+            )
+        RuleRegistry._changed()
+
+    @staticmethod
+    def snapshot() -> Dict[str, Rule]:
+        """
+        Get the state of every registered rule, to restore it later.
+
+        Returns
+        -------
+        dict:
+            Rules by name.
+        """
+        RuleRegistry.load_plugins()
+        return dict(RuleRegistry._rules)
+
+    @staticmethod
+    def restore(snapshot: Dict[str, Rule]) -> None:
+        """
+        Restore the state of the rules of a snapshot.
+
+        Rules registered after the snapshot, such as the ones of plugins, are
+        unregistered.
+
+        Parameters
+        ----------
+        snapshot: dict
+            Rules by name, from the snapshot method.
+        """
+        RuleRegistry._rules.clear()
+        RuleRegistry._rules.update(snapshot)
+        RuleRegistry._changed()
+
+    @staticmethod
+    def _changed() -> None:
+        """Forget the scheduled checks, after a change in the registry."""
+        RuleRegistry._scheduled.clear()
+        RuleRegistry._version += 1
+
+    @staticmethod
+    def version() -> int:
+        """
+        Get the version of the registry, changed on every change in the rules.
+
+        Returns
+        -------
+        int:
+            Number of changes in this process.
+        """
+        return RuleRegistry._version
+
+    @staticmethod
+    def _find(name: str) -> List[Rule]:
+        """Get the rules with the given name, raising if there are none."""
+        RuleRegistry.load_plugins()
+        rules = [
+            rule
+            for rule in RuleRegistry._rules.values()
+            if name in (rule.name, rule.action)
+        ]
+        if not rules:
+            raise RuleException(f"Rule '{name}' is not registered.")
+        return rules
+
+    @staticmethod
+    def rules() -> List[Rule]:
+        """
+        Get every registered rule, in the order they run.
+
+        Returns
+        -------
+        list of Rule:
+            Rules sorted by target and cost, enabled or not.
+        """
+        RuleRegistry.load_plugins()
+        return sorted(
+            RuleRegistry._rules.values(),
+            key=lambda rule: (TARGETS.index(rule.target), rule.cost),
+        )
+
+    @staticmethod
+    def scheduled(target: str) -> Tuple[Tuple[Check, Mapping[str, Any]], ...]:
+        """
+        Get the checks of the enabled rules of a target, in the order they run.
+
+        Parameters
+        ----------
+        target: str
+            Element checked by the rules.
+
+        Returns
+        -------
+        tuple:
+            Pairs of check and options of every enabled rule.
+        """
+        checks = RuleRegistry._scheduled.get(target)
+        if checks is None:
+            checks = tuple(
+                (RuleRegistry._timed(rule), rule.options)
+                for rule in RuleRegistry.rules()
+                if rule.target == target and rule.enabled
+            )
+            RuleRegistry._scheduled[target] = checks
+        return checks
+
+    @staticmethod
+    def _timed(rule: Rule) -> Check:
+        """
+        Get the check of a rule, measuring its calls if timing is enabled.
+
+        Measured calls are also counted in the stats of their result, with their
+        findings.
+        """
+        timings = RuleRegistry._timings
+        if timings is None:
+            return rule.check
+        name = rule.name
+        timing = timings.setdefault(name, [0, 0.0])
+        check = rule.check
+
+        def timed_check(element, result, index, options):
+            count = result.count
+            start = time.perf_counter()
+            try:
+                check(element, result, index, options)
+            finally:
+                seconds = time.perf_counter() - start
+                timing[0] += 1
+                timing[1] += seconds
+                if result.stats is None:
+                    result.stats = Stats()
+                result.stats.add(name, findings=result.count - count, seconds=seconds)
+
+        return timed_check
+
+    @staticmethod
+    def time(enabled: bool = True) -> None:
+        """
+        Start or stop measuring the checks, resetting the measures when started.
+
+        While measured, the results of the validations keep the stats of the
+        parsing and of every rule.
+
+        Parameters
+        ----------
+        enabled: bool
+            Indicate if the checks are measured.
+        """
+        RuleRegistry._timings = {} if enabled else None
+        RuleRegistry._changed()
+
+    @staticmethod
+    def is_timed() -> bool:
+        """Indicate if the checks are measured."""
+        return RuleRegistry._timings is not None
+
+    @staticmethod
+    def timings() -> Dict[str, Tuple[int, float]]:
+        """
+        Get the measures of the checks since timing started.
+
+        Returns
+        -------
+        dict:
+            Number of calls and total seconds by rule name.
+        """
+        timings = RuleRegistry._timings or {}
+        return {name: (calls, seconds) for name, (calls, seconds) in timings.items()}
+
+    @staticmethod
+    def load_plugins(modules: Optional[Iterable[str]] = None) -> None:
+        """
+        Import plugin modules, which register their rules on import.
+
+        Modules are imported only once, so the rules registered by their import
+        are kept, and registered again when they are loaded again.
+
+        Parameters
+        ----------
+        modules: iterable of str, optional
+            Names of the modules to import. The ones listed in the `CLINT_PLUGINS`
+            environment variable if not defined, only the first time.
+
+        Raises
+        ------
+        RuleException
+            If a plugin module cannot be imported.
+        """
+        if modules is None:
+            if RuleRegistry._plugins_loaded:
+                return
+            RuleRegistry._plugins_loaded = True
+            modules = os.environ.get(RuleRegistry.PLUGINS_VARIABLE, "").split(",")
+        for module in modules:
+            module = module.strip()
+            if not module:
+                continue
+            if module in RuleRegistry._plugins:
+                for rule in RuleRegistry._plugins[module]:
+                    RuleRegistry.register(rule)
+                continue
+            previous = dict(RuleRegistry._rules)
+            try:
+                importlib.import_module(module)
+            except ImportError as exc:
+                raise RuleException(f"Plugin '{module}' cannot be imported.") from exc
+            RuleRegistry._plugins[module] = tuple(
+                rule
+                for name, rule in RuleRegistry._rules.items()
+                if previous.get(name) is not rule
+            )
@@ -0,0 +1,184 @@
+"""Single pass commit message scanner."""
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+Span = Tuple[int, int]
+
+
+class Scanner:
+    """Class that walks a commit message producing spans over the original text."""
+
+    PARAGRAPH_SEPARATOR = "\n\n"
+    LINE_SEPARATOR = "\n"
+
+    @staticmethod
+    def message_end(msg: str) -> int:
+        """
+        Get the end offset of a commit message, ignoring trailing newlines.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+
+        Returns
+        -------
+        int
+            Offset right after the last character that is not a trailing newline.
+        """
+        end = len(msg)
+        while end and msg[end - 1] == "\n":
+            end -= 1
+        return end
+
+    @staticmethod
+    def split(msg: str, separator: str, start: int, end: int) -> Iterator[Span]:
+        """
+        Get the spans of a region split by a separator, like `str.split` does.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+        separator: str
+            Separator between the spans.
+        start: int
+            Start offset of the region to split.
+        end: int
+            End offset of the region to split.
+
+        Yields
+        ------
+        tuple of int
+            Start and end offsets of every span, without the separator.
+        """
+        step = len(separator)
+        index = msg.find(separator, start, end)
+        while index != -1:
+            yield start, index
+            start = index + step
+            index = msg.find(separator, start, end)
+        yield start, end
+
+    @staticmethod
+    def paragraphs(msg: str) -> Iterator[Span]:
+        """
+        Get the paragraph spans of a commit message.
+
+        The first span is always the subject.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+
+        Yields
+        ------
+        tuple of int
+            Start and end offsets of every paragraph, without trailing newlines.
+        """
+        return Scanner.split(
+            msg, Scanner.PARAGRAPH_SEPARATOR, 0, Scanner.message_end(msg)
+        )
+
+    @staticmethod
+    def lines(msg: str, start: int = 0, end: int = None) -> Iterator[Span]:
+        """
+        Get the line spans of a commit message region.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+        start: int
+            Start offset of the region.
+        end: int, optional
+            End offset of the region. The end of the message if not defined.
+
+        Yields
+        ------
+        tuple of int
+            Start and end offsets of every line, without the newline.
+        """
+        return Scanner.split(
+            msg, Scanner.LINE_SEPARATOR, start, len(msg) if end is None else end
+        )
+
+    @staticmethod
+    def strip_chunks(
+        chunks: Iterable[str], chars: Optional[str] = None, leading: bool = True
+    ) -> Iterator[str]:
+        """
+        Get the chunks of a message without its leading and trailing characters.
+
+        Trailing characters of a chunk are kept back until more text follows, so
+        the message is stripped like `str.strip` does, without joining it.
+
+        Parameters
+        ----------
+        chunks: iterable of str
+            Consecutive chunks of a commit message.
+        chars: str, optional
+            Characters to remove. Whitespaces if not defined.
+        leading: bool
+            Remove the leading characters too, not only the trailing ones.
+
+        Yields
+        ------
+        str
+            Non empty chunks of the stripped message.
+        """
+        pending: List[str] = []
+        started = not leading
+        for chunk in chunks:
+            if not started:
+                chunk = chunk.lstrip(chars)
+                started = bool(chunk)
+            stripped = chunk.rstrip(chars)
+            if stripped:
+                yield from pending
+                pending.clear()
+                yield stripped
+            if len(stripped) < len(chunk):
+                pending.append(chunk[len(stripped) :])
+
+    @staticmethod
+    def stream_paragraphs(chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Get the paragraphs of a commit message given in chunks.
+
+        Only the paragraph being read is kept, so memory is bounded by the longest
+        paragraph, not by the whole message.
+
+        Parameters
+        ----------
+        chunks: iterable of str
+            Consecutive chunks of a commit message.
+
+        Yields
+        ------
+        str
+            Every paragraph, without trailing newlines, like the spans of the
+            paragraphs method.
+        """
+        separator = Scanner.PARAGRAPH_SEPARATOR
+        parts: List[str] = []
+        for chunk in Scanner.strip_chunks(
+            chunks, Scanner.LINE_SEPARATOR, leading=False
+        ):
+            start = 0
+            # A separator can start at the end of the previous chunk.
+            if parts and parts[-1][-1] == chunk[0] == separator[0]:
+                parts[-1] = parts[-1][:-1]
+                yield "".join(parts)
+                parts = []
+                start = 1
+            index = chunk.find(separator, start)
+            while index != -1:
+                parts.append(chunk[start:index])
+                yield "".join(parts)
+                parts = []
+                start = index + len(separator)
+                index = chunk.find(separator, start)
+            if start < len(chunk):
+                parts.append(chunk[start:])
+        yield "".join(parts)
@@ -1,21 +1,40 @@
 """Subject validator."""
 import re
-from typing import Optional
+import sys
+from typing import Optional, Tuple
 
 from ..result import Result
+from .element import ASCII_CLASSES, UNICODE_CLASSES, Element
 from .exceptions import GenerationException
+from .rules import RuleRegistry
 
 
-class Subject:
+class Subject(Element):
     """Validator class for subject section of the commit message."""
 
-    PATTERN = re.compile(
-        r"^(?P<type>\w+)?"
-        + r"(?P<scope>\([\w\- ]+\))?"
+    __slots__ = ("type", "scope", "breaking", "separator", "description")
+    type: str
+    scope: str
+    breaking: str
+    separator: str
+    description: str
+
+    # Every repeated group is atomic, emulated with a lookahead and a backreference
+    # to its capture, so the matcher never gives characters back between groups.
+    # Backtracking is then bounded by the number of optional groups, keeping the
+    # match linear in the subject length. ASCII subjects, which are almost all of
+    # them, match with the same pattern made of ASCII character classes.
+    TEMPLATE = (
+        r"(?:(?=(?P<type>[{word}]+))(?P=type))?"
+        + r"(?:(?=(?P<scope>\([{word}\- ]+\)))(?P=scope))?"
         + r"(?P<breaking>!)?"
-        + r"(?P<separator>:\s+)?"
-        + r"(?P<description>[\w. ]+)?$"
+        + r"(?:(?=(?P<separator>:[{space}]+))(?P=separator))?"
+        + r"(?:(?=(?P<description>[{word}. ]+))(?P=description))?$"
     )
+    PATTERN = re.compile(TEMPLATE.format(**UNICODE_CLASSES))
+    ASCII_PATTERN = re.compile(TEMPLATE.format(**ASCII_CLASSES))
+
+    MAX_LENGTH: Optional[int] = None
 
     VALID_COMMIT_TYPES = {
         "build",
@@ -50,11 +69,12 @@ class Subject:
         description: str
             Description of the commit.
         """
-        self.type = c_type or ""
-        self.scope = scope or ""
-        self.breaking = breaking or ""
-        self.separator = separator or ""
-        self.description = description or ""
+        init = object.__setattr__
+        init(self, "type", sys.intern(c_type or ""))
+        init(self, "scope", sys.intern(scope or ""))
+        init(self, "breaking", sys.intern(breaking or ""))
+        init(self, "separator", sys.intern(separator or ""))
+        init(self, "description", description or "")
 
     @staticmethod
     def generate(msg: str) -> Optional["Subject"]:
@@ -71,22 +91,103 @@ class Subject:
         Subject, optional
             Subject instance if the subject line matches the pattern. None otherwise.
         """
-        match = Subject.PATTERN.match(msg)
-        if match is None:
+        Subject.check_length(len(msg))
+        subject = Subject.match(msg)
+        if subject is None:
             raise GenerationException(f"Message '{msg}' did not match the pattern.")
-        groups = match.groupdict()
+        return subject
+
+    @staticmethod
+    def check_length(length: int) -> None:
+        """
+        Check that a subject line is not longer than the maximum length.
+
+        Parameters
+        ----------
+        length: int
+            Length of the subject line.
+
+        Raises
+        ------
+        GenerationException
+            If the subject line is longer than `Subject.MAX_LENGTH`.
+        """
+        reason = Subject.length_error(length)
+        if reason is not None:
+            raise GenerationException(reason)
+
+    @staticmethod
+    def length_error(length: int) -> Optional[str]:
+        """
+        Get the error of a subject line longer than the maximum length, if any.
+
+        Parameters
+        ----------
+        length: int
+            Length of the subject line.
+
+        Returns
+        -------
+        str, optional
+            Error message if longer than `Subject.MAX_LENGTH`. None otherwise.
+        """
+        if Subject.MAX_LENGTH is not None and length > Subject.MAX_LENGTH:
+            return f"Subject is longer than {Subject.MAX_LENGTH} characters."
+        return None
+
+    @staticmethod
+    def match(msg: str, pos: int = 0, endpos: int = None) -> Optional["Subject"]:
+        """
+        Get a new instance of Subject from a region of a commit message.
+
+        Parameters
+        ----------
+        msg: str
+            Commit message.
+        pos: int
+            Start offset of the subject line.
+        endpos: int, optional
+            End offset of the subject line. The end of the message if not defined.
+
+        Returns
+        -------
+        Subject, optional
+            New instance if the region matches the pattern. None otherwise.
+        """
+        pattern = Subject.ASCII_PATTERN if msg.isascii() else Subject.PATTERN
+        match = pattern.match(msg, pos, len(msg) if endpos is None else endpos)
+        if match is None:
+            return None
         return Subject(
-            groups["type"],
-            groups["scope"],
-            groups["breaking"],
-            groups["separator"],
-            groups["description"],
+            match.group("type"),
+            match.group("scope"),
+            match.group("breaking"),
+            match.group("separator"),
+            match.group("description"),
         )
 
+    def span(self, attribute: str) -> Tuple[int, int]:
+        """
+        Get the column span of an attribute in the subject line.
+
+        Parameters
+        ----------
+        attribute: str
+            Attribute name.
+
+        Returns
+        -------
+        tuple of int
+            Start and end columns of the attribute.
+        """
+        return self._span(attribute, self.__slots__)
+
     def validate(self, result: Result) -> None:
         """
         Validate that all attributes in the class are conventional commits compliant.
 
+        Runs every enabled rule of the subject target.
+
         Parameters
         ----------
         result: Result
@@ -97,63 +198,189 @@ class Subject:
         ValidatorException
             If any attribute is not valid.
         """
-        # pylint: disable=duplicate-code
-        if not self.type:
-            result.add_action(
-                action="type_empty", message="Type cannot be empty.", is_error=True
-            )
-        elif not self.type.islower():
-            result.add_action(
-                action="type_case",
-                message=f"Type '{self.type}' is not lowercase.",
-                is_error=True,
-            )
-        elif self.type not in self.VALID_COMMIT_TYPES:
-            result.add_action(
-                action="type_valid",
-                message=f"Type '{self.type}' is not valid.",
-                is_error=True,
-            )
-        if self.scope:
-            if not self.scope.startswith("("):
-                result.add_action(
-                    action="scope_start",
-                    message=f"Scope '{self.type}' should starts with '('.",
-                    is_error=True,
-                )
-            if not self.scope.endswith(")"):
-                result.add_action(
-                    action="scope_end",
-                    message=f"Scope '{self.type}' should ends with ')'.",
-                    is_error=True,
-                )
-            if len(self.scope) == 2:
-                result.add_action(
-                    action="scope_empty",
-                    message=f"Scope '{self.type}' cannot be empty.",
-                    is_error=True,
-                )
-        if not self.separator:
-            result.add_action(
-                action="separator_empty",
-                message="Separator cannot be empty.",
-                is_error=True,
-            )
-        elif self.separator != ": ":
-            result.add_action(
-                action="separator_invalid",
-                message=f"Separator '{self.separator}' is not valid.",
-                is_error=True,
-            )
-        if not self.description:
-            result.add_action(
-                action="description_empty",
-                message="Description cannot be empty.",
-                is_error=True,
-            )
-        if "\n" in self.description:
-            result.add_action(
-                action="description_newline",
-                message="Description cannot have new lines.",
-                is_error=True,
-            )
+        for check, options in RuleRegistry.scheduled("subject"):
+            check(self, result, 0, options)
+
+
+# pylint: disable=unused-argument
+
+
+@RuleRegistry.rule(target="subject", action="type_empty")
+def type_empty(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the type is not empty."""
+    if not subject.type:
+        result.add_action(
+            action="type_empty",
+            message="Type cannot be empty.",
+            is_error=True,
+            index=index,
+            span=subject.span("type"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="type_case")
+def type_case(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the type is lowercase."""
+    if subject.type and not subject.type.islower():
+        result.add_action(
+            action="type_case",
+            message="Type '{0}' is not lowercase.",
+            is_error=True,
+            args=(subject.type,),
+            index=index,
+            span=subject.span("type"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="type_valid", options={"types": ()})
+def type_valid(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that a lowercase type is in the `types` option, or a valid commit type."""
+    if (
+        subject.type
+        and subject.type.islower()
+        and subject.type not in (options["types"] or subject.VALID_COMMIT_TYPES)
+    ):
+        result.add_action(
+            action="type_valid",
+            message="Type '{0}' is not valid.",
+            is_error=True,
+            args=(subject.type,),
+            index=index,
+            span=subject.span("type"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="scope_start")
+def scope_start(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the scope starts with a parenthesis."""
+    if subject.scope and not subject.scope.startswith("("):
+        result.add_action(
+            action="scope_start",
+            message="Scope '{0}' should starts with '('.",
+            is_error=True,
+            args=(subject.type,),
+            index=index,
+            span=subject.span("scope"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="scope_end")
+def scope_end(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the scope ends with a parenthesis."""
+    if subject.scope and not subject.scope.endswith(")"):
+        result.add_action(
+            action="scope_end",
+            message="Scope '{0}' should ends with ')'.",
+            is_error=True,
+            args=(subject.type,),
+            index=index,
+            span=subject.span("scope"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="scope_empty")
+def scope_empty(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the scope is not an empty pair of parenthesis."""
+    if len(subject.scope) == 2:
+        result.add_action(
+            action="scope_empty",
+            message="Scope '{0}' cannot be empty.",
+            is_error=True,
+            args=(subject.type,),
+            index=index,
+            span=subject.span("scope"),
+        )
+
+
+@RuleRegistry.rule(
+    target="subject",
+    action="scope_valid",
+    enabled=False,
+    options={"scopes": ()},
+)
+def scope_valid(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the scope, without parenthesis, is in the `scopes` option."""
+    if subject.scope and subject.scope.strip("()") not in options["scopes"]:
+        result.add_action(
+            action="scope_valid",
+            message="Scope '{0}' is not valid.",
+            is_error=True,
+            args=(subject.scope,),
+            index=index,
+            span=subject.span("scope"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="separator_empty")
+def separator_empty(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the separator is not empty."""
+    # pylint: disable=duplicate-code
+    if not subject.separator:
+        result.add_action(
+            action="separator_empty",
+            message="Separator cannot be empty.",
+            is_error=True,
+            index=index,
+            span=subject.span("separator"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="separator_invalid")
+def separator_invalid(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that a separator is a colon followed by a single space."""
+    if subject.separator and subject.separator != ": ":
+        result.add_action(
+            action="separator_invalid",
+            message="Separator '{0}' is not valid.",
+            is_error=True,
+            args=(subject.separator,),
+            index=index,
+            span=subject.span("separator"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="description_empty")
+def description_empty(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the description is not empty."""
+    # pylint: disable=duplicate-code
+    if not subject.description:
+        result.add_action(
+            action="description_empty",
+            message="Description cannot be empty.",
+            is_error=True,
+            index=index,
+            span=subject.span("description"),
+        )
+
+
+@RuleRegistry.rule(target="subject", action="description_newline", cost=2)
+def description_newline(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the description has no new lines."""
+    if "\n" in subject.description:
+        result.add_action(
+            action="description_newline",
+            message="Description cannot have new lines.",
+            is_error=True,
+            index=index,
+            span=subject.span("description"),
+        )
+
+
+@RuleRegistry.rule(
+    target="subject",
+    action="subject_length",
+    enabled=False,
+    options={"max_length": 72},
+)
+def subject_length(subject: Subject, result: Result, index: int, options) -> None:
+    """Check that the subject line is not longer than the `max_length` option."""
+    length = subject.span("description")[1]
+    if length > options["max_length"]:
+        result.add_action(
+            action="subject_length",
+            message="Subject cannot be longer than {0} characters.",
+            is_error=True,
+            args=(options["max_length"],),
+            index=index,
+            span=(options["max_length"], length),
+        )
@@ -5,8 +5,13 @@ import pytest
 from click.testing import CliRunner
 
 from clint import validator
+from clint.cli.runner import Runner
 from clint.result import Result
 
+from ..history.conftest import (  # pylint: disable=unused-import
+    fixture_git_repo,
+    git_commit,
+)
 from ..hook_handler.conftest import (  # pylint: disable=unused-import
     mock_hook_get_repo_root,
     valid_path,
@@ -62,6 +67,22 @@ def mock_runner_validate(request, class_mocker):
     )
 
 
+@pytest.fixture(scope="class")
+def mock_runner_validate_stream(request, class_mocker):
+    """Fixture to patch cli.runner.Runner.validate_stream method."""
+    request.cls.mock_runner_validate_stream = class_mocker.patch(
+        "clint.cli.runner.Runner.validate_stream"
+    )
+
+
+@pytest.fixture(scope="class")
+def mock_runner_validate_log(request, class_mocker):
+    """Fixture to patch cli.runner.Runner.validate_log method."""
+    request.cls.mock_runner_validate_log = class_mocker.patch(
+        "clint.cli.runner.Runner.validate_log"
+    )
+
+
 @pytest.fixture(scope="class")
 def mock_runner_change_hook_handler(request, class_mocker):
     """Fixture to patch cli.runner.Runner.change_hook_handler method."""
@@ -81,10 +102,10 @@ def mock_runner_help(request, class_mocker):
 
 
 @pytest.fixture(scope="class")
-def mock_commit_generate(request, class_mocker):
-    """Fixture to patch clint.validator.Commit.generate method."""
-    request.cls.mock_commit_generate = class_mocker.patch(
-        "clint.validator.Commit.generate", return_value=validator.Commit("")
+def mock_commit_parse(request, class_mocker):
+    """Fixture to patch clint.validator.Commit.parse method."""
+    request.cls.mock_commit_parse = class_mocker.patch(
+        "clint.validator.Commit.parse", return_value=validator.Commit("")
     )
 
 
@@ -99,8 +120,8 @@ def mock_commit_validate(request, class_mocker):
 @pytest.fixture
 def clean_commit_mocks(request: pytest.FixtureRequest):
     """Fixture to reset mock_subject_validate and mock_paragraph_validate."""
-    request.cls.mock_commit_generate.reset_mock()
-    request.cls.mock_commit_generate.side_effect = None
+    request.cls.mock_commit_parse.reset_mock()
+    request.cls.mock_commit_parse.side_effect = None
     request.cls.mock_commit_validate.reset_mock()
     request.cls.mock_commit_validate.side_effect = None
 
@@ -109,3 +130,11 @@ def clean_commit_mocks(request: pytest.FixtureRequest):
 def mock_click_echo(request, class_mocker):
     """Fixture to patch clint.validator.Commit.validate method."""
     request.cls.mock_click_echo = class_mocker.patch("click.echo")
+
+
+@pytest.fixture
+def measured():
+    """Fixture to stop measuring the rules and tracing after a test."""
+    yield Runner
+    Runner.measure(enabled=False)
+    Runner.stop_trace()
@@ -0,0 +1,53 @@
+"""Test suite for batch records reader."""
+import io
+
+from clint.cli.batch import BatchReader, BatchRecord
+
+
+class TestBatchReader:
+    """Tests for clint.cli.batch.BatchReader class."""
+
+    def test_nul_records(self, mocker):
+        """Test reading of NUL delimited records, across chunk boundaries."""
+        mocker.patch.object(BatchReader, "CHUNK_SIZE", 3)
+        stream = io.StringIO("feat: a\0fix: b\n\nbody\0chore: c")
+        records = list(BatchReader(stream=stream, input_format="nul"))
+        assert records == [
+            BatchRecord(id="1", message="feat: a"),
+            BatchRecord(id="2", message="fix: b\n\nbody"),
+            BatchRecord(id="3", message="chore: c"),
+        ]
+
+    def test_nul_trailing_delimiter(self):
+        """Test that a trailing delimiter does not generate an empty record."""
+        stream = io.StringIO("feat: a\0fix: b\0\n")
+        records = list(BatchReader(stream=stream, input_format="nul"))
+        assert [record.message for record in records] == ["feat: a", "fix: b"]
+
+    def test_nul_binary_records(self, mocker):
+        """Test that NUL delimited records of binary streams are kept as bytes."""
+        mocker.patch.object(BatchReader, "CHUNK_SIZE", 3)
+        stream = io.TextIOWrapper(io.BytesIO(b"feat: caf\xe9\0fix: b\0"))
+        records = list(BatchReader(stream=stream, input_format="nul"))
+        assert records == [
+            BatchRecord(id="1", message=b"feat: caf\xe9"),
+            BatchRecord(id="2", message=b"fix: b"),
+        ]
+
+    def test_ndjson_records(self):
+        """Test reading of NDJSON records, with and without id."""
+        stream = io.StringIO(
+            '{"id": "abc", "message": "feat: a"}\n\n{"message": "fix: b"}\n'
+        )
+        records = list(BatchReader(stream=stream, input_format="ndjson"))
+        assert records == [
+            BatchRecord(id="abc", message="feat: a"),
+            BatchRecord(id="3", message="fix: b"),
+        ]
+
+    def test_ndjson_invalid_records(self):
+        """Test that invalid records are reported instead of stopping the batch."""
+        stream = io.StringIO('not json\n{"id": 1}\n{"message": 2}\n')
+        records = list(BatchReader(stream=stream, input_format="ndjson"))
+        assert [record.message for record in records] == [None, None, None]
+        assert all(record.error for record in records)
@@ -1,14 +1,17 @@
 """Test suite for CLI class."""
-from unittest.mock import MagicMock, call
+import json
+from unittest.mock import ANY, MagicMock, call
 
 import pytest
 
 from clint.cli.command import Command
-from clint.result import Result
+from clint.result import Result, Stats
+from clint.validator import OPERATION_BASE_ERROR_CODE, BatchSummary
 
 
 @pytest.mark.usefixtures(
     "mock_runner_validate",
+    "mock_runner_validate_stream",
     "mock_runner_change_hook_handler",
     "mock_runner_help",
     "mock_command_show_result",
@@ -17,10 +20,20 @@ class TestCommandEntrypoint:
     """Tests for clint.cli.command.Command.entrypoint method."""
 
     mock_runner_validate: MagicMock
+    mock_runner_validate_stream: MagicMock
     mock_runner_change_hook_handler: MagicMock
     mock_runner_help: MagicMock
     mock_command_show_result: MagicMock
 
+    def stream_messages(self, result):
+        """Return the result from the stream validation, keeping its messages."""
+        messages = []
+        self.mock_runner_validate_stream.reset_mock()
+        self.mock_runner_validate_stream.side_effect = (
+            lambda reader, fail_fast: messages.append("".join(reader)) or result
+        )
+        return messages
+
     results = [
         Result(operation="test", base_error_code=0),
         Result(operation="test", base_error_code=0).add_action(
@@ -46,7 +59,9 @@ class TestCommandEntrypoint:
         self.mock_runner_help.reset_mock()
         self.mock_command_show_result.reset_mock()
         cmd_result = cli_runner.invoke(Command.entrypoint, [sentence])
-        assert self.mock_runner_validate.call_args_list == [call(message=sentence)]
+        assert self.mock_runner_validate.call_args_list == [
+            call(message=sentence, fail_fast=False)
+        ]
         assert not self.mock_runner_change_hook_handler.called
         assert not self.mock_runner_help.called
         assert self.mock_command_show_result.call_args_list == [call(result=result)]
@@ -60,8 +75,12 @@ class TestCommandEntrypoint:
         self.mock_runner_change_hook_handler.reset_mock()
         self.mock_runner_help.reset_mock()
         self.mock_command_show_result.reset_mock()
-        cmd_result = cli_runner.invoke(Command.entrypoint, input=f"{sentence}\n")
-        assert self.mock_runner_validate.call_args_list == [call(message=sentence)]
+        messages = self.stream_messages(result)
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint, input=f" \n{sentence}\n\n \n"
+        )
+        assert messages == [sentence]
+        assert not self.mock_runner_validate.called
         assert not self.mock_runner_change_hook_handler.called
         assert not self.mock_runner_help.called
         assert self.mock_command_show_result.call_args_list == [call(result=result)]
@@ -79,8 +98,10 @@ class TestCommandEntrypoint:
             filename = "example.txt"
             with open(filename, "w", encoding="utf8") as temp_file:
                 temp_file.write(sentence)
+            messages = self.stream_messages(result)
             cmd_result = cli_runner.invoke(Command.entrypoint, ["--file", filename])
-        assert self.mock_runner_validate.call_args_list == [call(message=sentence)]
+        assert messages == [sentence]
+        assert not self.mock_runner_validate.called
         assert not self.mock_runner_change_hook_handler.called
         assert not self.mock_runner_help.called
         assert self.mock_command_show_result.call_args_list == [call(result=result)]
@@ -89,11 +110,13 @@ class TestCommandEntrypoint:
     def test_empty_invocation(self, cli_runner):
         """Test invocation of the entrypoint with no arguments."""
         self.mock_runner_validate.reset_mock()
+        self.mock_runner_validate_stream.reset_mock()
         self.mock_runner_change_hook_handler.reset_mock()
         self.mock_runner_help.reset_mock()
         self.mock_command_show_result.reset_mock()
         cmd_result = cli_runner.invoke(Command.entrypoint)
         assert not self.mock_runner_validate.called
+        assert not self.mock_runner_validate_stream.called
         assert not self.mock_runner_change_hook_handler.called
         assert self.mock_runner_help.call_args_list == [call()]
         assert self.mock_command_show_result.call_args_list == [
@@ -101,6 +124,14 @@ class TestCommandEntrypoint:
         ]
         assert cmd_result.exit_code == 0
 
+    def test_blank_pipe_message(self, cli_runner):
+        """Test that a message of only whitespaces from shell pipe shows the help."""
+        self.mock_runner_validate_stream.reset_mock()
+        self.mock_runner_help.reset_mock()
+        cli_runner.invoke(Command.entrypoint, input=" \n\n\t")
+        assert not self.mock_runner_validate_stream.called
+        assert self.mock_runner_help.call_args_list == [call()]
+
     @pytest.mark.parametrize("hook_flag", ["--enable-hook", "--disable-hook"])
     def test_hook(self, hook_flag, cli_runner):
         """Test invocation of the entrypoint for git hook."""
@@ -144,5 +175,227 @@ class TestCommandShowResult:  # pylint: disable=too-few-public-methods
         Command.show_result(result=result)
         calls = []
         for action, message in result.actions.items():
-            calls.append(call(f"{action}: {message}"))
+            calls.append(call(f"{action}: {message}", err=False))
         assert self.mock_click_echo.call_args_list == calls
+
+
+class TestCommandEncoding:
+    """Tests for clint.cli.command.Command.entrypoint method with raw messages."""
+
+    def test_invalid_utf8_file(self, cli_runner):
+        """Test that files that are not valid UTF-8 are validated as bytes."""
+        with cli_runner.isolated_filesystem():
+            filename = "example.txt"
+            with open(filename, "wb") as temp_file:
+                temp_file.write(b"feat: caf\xe9\n")
+            cmd_result = cli_runner.invoke(Command.entrypoint, ["--file", filename])
+        assert cmd_result.output.splitlines() == [
+            "encoding_utf8: Message is not valid UTF-8, at byte 9."
+        ]
+        assert cmd_result.exit_code == OPERATION_BASE_ERROR_CODE + 1
+
+    def test_invalid_utf8_pipe(self, cli_runner):
+        """Test that piped messages that are not valid UTF-8 are validated as bytes."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint, input=b" \nfeat: caf\xe9\n\n"
+        )
+        assert cmd_result.output.splitlines() == [
+            "encoding_utf8: Message is not valid UTF-8, at byte 9."
+        ]
+        assert cmd_result.exit_code == OPERATION_BASE_ERROR_CODE + 1
+
+
+class TestCommandBatch:
+    """Tests for clint.cli.command.Command.entrypoint method in batch mode."""
+
+    def test_nul_records(self, cli_runner):
+        """Test that every NUL delimited record is validated."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint,
+            ["--batch"],
+            input="feat: valid\0foo: invalid\0",
+        )
+        assert cmd_result.output.splitlines() == [
+            "1: validation: Your commit message is CC compliant!",
+            "2: type_valid: Type 'foo' is not valid.",
+        ]
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    def test_reporter_without_batch(self, cli_runner):
+        """Test that reporters other than the text one need batch mode."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint, ["--reporter", "json", "feat: valid"]
+        )
+        assert "--reporter is only available in batch mode." in cmd_result.output
+        assert cmd_result.exit_code == 2
+
+    def test_nul_invalid_utf8(self, cli_runner):
+        """Test that records with invalid UTF-8 are reported, not decoded."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint,
+            ["--batch"],
+            input=b"feat: valid\0feat: caf\xe9\0",
+        )
+        assert cmd_result.output.splitlines() == [
+            "1: validation: Your commit message is CC compliant!",
+            "2: encoding_utf8: Message is not valid UTF-8, at byte 9.",
+        ]
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    def test_ndjson_file(self, cli_runner):
+        """Test that NDJSON records from file are validated with their ids."""
+        with cli_runner.isolated_filesystem():
+            filename = "records.ndjson"
+            with open(filename, "w", encoding="utf8") as temp_file:
+                temp_file.write('{"id": "abc", "message": "feat: valid"}\n')
+            cmd_result = cli_runner.invoke(
+                Command.entrypoint,
+                ["--batch", "--input-format", "ndjson", "--file", filename],
+            )
+        assert cmd_result.output.splitlines() == [
+            "abc: validation: Your commit message is CC compliant!",
+        ]
+        assert cmd_result.exit_code == BatchSummary.SUCCESS_CODE
+
+    def test_reporter(self, cli_runner):
+        """Test that results are written by the chosen reporter."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint,
+            ["--batch", "--reporter", "json"],
+            input="feat: valid\0foo: invalid\0",
+        )
+        document = json.loads(cmd_result.output)
+        assert [record["id"] for record in document["results"]] == ["1", "2"]
+        assert document["failed"] == 1
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    def test_fail_fast(self, cli_runner):
+        """Test that every record stops at its first error."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint,
+            ["--batch", "--fail-fast"],
+            input="Foo:  bad\0feat: valid\0",
+        )
+        assert cmd_result.output.splitlines() == [
+            "1: type_case: Type 'Foo' is not lowercase.",
+            "2: validation: Your commit message is CC compliant!",
+        ]
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    @pytest.mark.usefixtures("measured")
+    def test_stats(self, cli_runner):
+        """Test that the stats of every record are shown after the results."""
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint,
+            ["--batch", "--stats", "--stats-format", "json"],
+            input="Foo:  bad\0feat: valid\0",
+        )
+        stats = json.loads(cmd_result.output.splitlines()[-1])
+        assert stats["parse.subject"]["calls"] == 2
+        assert stats["subject.type_case"]["findings"] == 1
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    def test_trace(self, cli_runner):
+        """Test that the spans of reading, validating and writing are traced."""
+        with cli_runner.isolated_filesystem():
+            cmd_result = cli_runner.invoke(
+                Command.entrypoint,
+                ["--batch", "--trace", "trace.json"],
+                input="feat: valid\0foo: invalid\0",
+            )
+            with open("trace.json", encoding="utf8") as trace_file:
+                events = json.load(trace_file)
+        names = [event["name"] for event in events if event["ph"] == "X"]
+        assert names.count("read") == 3
+        assert names.count("parse") == names.count("validate") == 2
+        assert names.count("get") == names.count("put") == 2
+        assert names.count("write") == 2
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+    @pytest.mark.usefixtures("measured")
+    def test_stats_table(self, cli_runner):
+        """Test that the stats of a single message are shown as a table."""
+        cmd_result = cli_runner.invoke(Command.entrypoint, ["--stats", "Foo:  bad"])
+        lines = cmd_result.output.splitlines()
+        assert lines[:2] == [
+            "type_case: Type 'Foo' is not lowercase.",
+            "separator_invalid: Separator ':  ' is not valid.",
+        ]
+        assert lines[2].split() == list(Stats.COLUMNS)
+        assert "subject.type_case" in {line.split()[0] for line in lines[3:]}
+
+
+@pytest.mark.usefixtures("mock_runner_validate_log")
+class TestCommandLog:  # pylint: disable=too-few-public-methods
+    """Tests for clint.cli.command.Command.log method."""
+
+    mock_runner_validate_log: MagicMock
+
+    def test_only_failures(self, cli_runner):
+        """Test that only failing commits are shown, tied to their SHA."""
+        self.mock_runner_validate_log.return_value = iter(
+            [
+                ("a" * 40, Result(operation="test", base_error_code=0)),
+                (
+                    "b" * 40,
+                    Result(operation="test", base_error_code=0).add_action(
+                        action="error", message="message", is_error=True
+                    ),
+                ),
+            ]
+        )
+        cmd_result = cli_runner.invoke(Command.entrypoint, ["log", "main..HEAD"])
+        assert self.mock_runner_validate_log.call_args_list == [
+            call(
+                rev_range="main..HEAD",
+                jobs=1,
+                ordered=True,
+                ledger=None,
+                cache=ANY,
+                fail_fast=False,
+                stats=False,
+                trace=False,
+            )
+        ]
+        assert cmd_result.output.splitlines() == [
+            f"{'b' * 40}: error: message",
+            "2 commits validated, 1 failed.",
+        ]
+        assert cmd_result.exit_code == BatchSummary.FAILURE_CODE
+
+
+class TestCommandLogError:  # pylint: disable=too-few-public-methods
+    """Tests for clint.cli.command.Command.log method with git errors."""
+
+    def test_bad_revision(self, cli_runner, git_repo, git_commit, monkeypatch):
+        """Test that git errors are shown, exiting with their code."""
+        monkeypatch.chdir(git_repo)
+        git_commit("Foo: first commit")
+        cmd_result = cli_runner.invoke(Command.entrypoint, ["log", "unknown"])
+        assert cmd_result.output.startswith("log: ")
+        assert "commits validated" not in cmd_result.output
+        assert cmd_result.exit_code == OPERATION_BASE_ERROR_CODE + 1
+
+
+class TestCommandStats:
+    """Tests for clint.cli.command.Command.stats method."""
+
+    def test_json(self, cli_runner, git_repo, git_commit, monkeypatch):
+        """Test that the statistics of the history are shown as JSON."""
+        monkeypatch.chdir(git_repo)
+        git_commit("feat(cli)!: first commit")
+        git_commit("first commit?")
+        cmd_result = cli_runner.invoke(
+            Command.entrypoint, ["stats", "--format", "json", "--bucket", "year"]
+        )
+        data = json.loads(cmd_result.output)
+        assert (data["commits"], data["compliant"], data["breaking"]) == (2, 1, 1)
+        assert data["scopes"] == [{"name": "cli", "count": 1, "error": 0}]
+        assert cmd_result.exit_code == 0
+
+    def test_bad_revision(self, cli_runner, git_repo, monkeypatch):
+        """Test that git errors are shown, exiting with their code."""
+        monkeypatch.chdir(git_repo)
+        cmd_result = cli_runner.invoke(Command.entrypoint, ["stats", "unknown"])
+        assert cmd_result.output.startswith("log: ")
+        assert cmd_result.exit_code == OPERATION_BASE_ERROR_CODE + 1
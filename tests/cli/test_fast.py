@@ -0,0 +1,138 @@
+"""Test suite for FastPath class."""
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+from clint import __version__
+from clint.cli.fast import FastPath
+from clint.validator import OPERATION_BASE_ERROR_CODE
+
+IMPORT_BUDGET_US = 100_000
+
+
+def imported_modules(stderr: str, top_level: bool = False) -> Dict[str, int]:
+    """Get imported modules and their cumulative import time from -X importtime."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if top_level and name.startswith("  "):
+            continue
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestFastPathIsHookInvocation:  # pylint: disable=too-few-public-methods
+    """Tests for clint.cli.fast.FastPath.is_hook_invocation method."""
+
+    @pytest.mark.parametrize(
+        "args, expected",
+        [
+            (["--file", ".git/COMMIT_EDITMSG"], True),
+            (["-f", ".git/COMMIT_EDITMSG"], True),
+            (["--file", "-"], False),
+            (["--file"], False),
+            (["feat: message"], False),
+            (["--enable-hook"], False),
+            (["log", "HEAD"], False),
+        ],
+    )
+    def test_arguments(self, args, expected):
+        """Test which arguments use the fast path."""
+        assert FastPath.is_hook_invocation(args) is expected
+
+
+class TestFastPathMain:
+    """Tests for clint.cli.fast.FastPath.main method."""
+
+    def test_hook_invocation(self, tmp_path, monkeypatch):
+        """Test that the hook invocation validates without importing click."""
+        monkeypatch.setenv("CLINT_SOCKET", str(tmp_path / "no-daemon.sock"))
+        message_path = tmp_path / "COMMIT_EDITMSG"
+        message_path.write_text("Foo: invalid type\n", encoding="utf8")
+        code = (
+            "from clint.cli.fast import FastPath;"
+            + f"FastPath.main(['--file', {str(message_path)!r}])"
+        )
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert process.stdout == "type_case: Type 'Foo' is not lowercase.\n"
+        assert process.returncode == 1
+        modules = imported_modules(process.stderr)
+        assert "clint.validator" in modules
+        assert "clint.validator.cache" not in modules
+        assert "clint.trace.tracer" not in modules
+        assert not [name for name in modules if name.startswith("click")]
+
+    def test_invalid_utf8(self, tmp_path, monkeypatch, capsys):
+        """Test that hook files that are not valid UTF-8 are validated as bytes."""
+        monkeypatch.setenv("CLINT_SOCKET", str(tmp_path / "no-daemon.sock"))
+        message_path = tmp_path / "COMMIT_EDITMSG"
+        message_path.write_bytes(b"feat: caf\xe9\n")
+        with pytest.raises(SystemExit) as exc_info:
+            FastPath.main(["--file", str(message_path)])
+        assert capsys.readouterr().out == (
+            "encoding_utf8: Message is not valid UTF-8, at byte 9.\n"
+        )
+        assert exc_info.value.code == OPERATION_BASE_ERROR_CODE + 1
+
+    def test_large_file(self, tmp_path, monkeypatch):
+        """Test that files too large for the daemon are streamed by the command."""
+        monkeypatch.setattr(FastPath, "MAX_SIZE", 8)
+        message_path = tmp_path / "COMMIT_EDITMSG"
+        message_path.write_text("Foo: invalid type\n", encoding="utf8")
+        assert FastPath.read(str(message_path)) is None
+        code = (
+            "from clint.cli.fast import FastPath; FastPath.MAX_SIZE = 8;"
+            + f"FastPath.main(['--file', {str(message_path)!r}])"
+        )
+        process = subprocess.run(
+            [sys.executable, "-c", code],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert process.stdout == "type_case: Type 'Foo' is not lowercase.\n"
+        assert process.returncode == 1
+
+    def test_import_budget(self, tmp_path, monkeypatch):
+        """Test that the hook invocation imports stay inside the time budget."""
+        monkeypatch.setenv("CLINT_SOCKET", str(tmp_path / "no-daemon.sock"))
+        message_path = tmp_path / "COMMIT_EDITMSG"
+        message_path.write_text("feat: valid message\n", encoding="utf8")
+        code = (
+            "import sys; sys.stderr.write('hook start\\n'); sys.stderr.flush();"
+            + "from clint.cli.fast import FastPath;"
+            + f"FastPath.main(['--file', {str(message_path)!r}])"
+        )
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert process.returncode == 0
+        # Site packages may import modules at startup, before the hook runs.
+        _, hook_imports = process.stderr.split("hook start\n")
+        modules = imported_modules(hook_imports)
+        assert "clint.cli.fast" in modules
+        assert sum(imported_modules(hook_imports, top_level=True).values()) < (
+            IMPORT_BUDGET_US
+        )
+        assert not {"ast", "inspect", "sqlite3", "click"} & set(modules)
+
+    def test_click_invocation(self, capsys):
+        """Test that other invocations are handled by the click command."""
+        with pytest.raises(SystemExit) as exit_info:
+            FastPath.main(["--version"])
+        assert exit_info.value.code == 0
+        assert __version__ in capsys.readouterr().out
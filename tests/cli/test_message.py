@@ -0,0 +1,53 @@
+"""Test suite for commit message reader."""
+import io
+
+import pytest
+
+from clint.cli.message import MessageReader
+
+
+class TestMessageReader:
+    """Tests for clint.cli.message.MessageReader class."""
+
+    def test_chunks(self, mocker):
+        """Test that the message is read in chunks, unchanged if not stripped."""
+        mocker.patch.object(MessageReader, "CHUNK_SIZE", 4)
+        reader = MessageReader(stream=io.StringIO(" feat: a\n\nbody\n"))
+        assert list(reader) == [" fea", "t: a", "\n\nbo", "dy\n"]
+
+    def test_strip(self, mocker):
+        """Test that stripped messages lose leading and trailing whitespaces."""
+        mocker.patch.object(MessageReader, "CHUNK_SIZE", 4)
+        reader = MessageReader(
+            stream=io.StringIO(" \n feat: a\n\nbody \n\n"), strip=True
+        )
+        assert "".join(reader) == "feat: a\n\nbody"
+
+    @pytest.mark.parametrize(
+        "text, strip, expected",
+        [("", False, True), ("\n", False, False), (" \n\t", True, True)],
+    )
+    def test_is_empty(self, text, strip, expected):
+        """Test that emptiness is checked without losing the first chunk."""
+        reader = MessageReader(stream=io.StringIO(text), strip=strip)
+        assert reader.is_empty() is expected
+        assert "".join(reader) == (text.strip() if strip else text)
+
+    def test_read_whole(self):
+        """Test that small messages are read whole as bytes, keeping invalid ones."""
+        stream = io.TextIOWrapper(
+            io.BytesIO(b" feat: caf\xe9\n"), encoding="utf8", errors="surrogateescape"
+        )
+        reader = MessageReader(stream=stream, strip=True)
+        assert reader.read_whole() == b"feat: caf\xe9"
+
+    def test_read_whole_large(self, mocker):
+        """Test that large messages are iterated instead, replacing invalid bytes."""
+        mocker.patch.object(MessageReader, "CHUNK_SIZE", 4)
+        mocker.patch.object(MessageReader, "WHOLE_SIZE", 8)
+        stream = io.TextIOWrapper(
+            io.BytesIO(b"feat: caf\xe9\n"), encoding="utf8", errors="surrogateescape"
+        )
+        reader = MessageReader(stream=stream)
+        assert reader.read_whole() is None
+        assert "".join(reader) == "feat: caf\ufffd\n"
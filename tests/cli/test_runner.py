@@ -4,37 +4,44 @@ from unittest.mock import MagicMock, call
 import pytest
 
 from clint import validator
+from clint.cli.batch import BatchRecord
 from clint.cli.runner import Runner
+from clint.history import HistoryException, Ledger, LogEntry
 from clint.hook_handler import HookException, HookHandler
+from clint.trace import Tracer
 
 from .conftest import get_result
 
 
-@pytest.mark.usefixtures("mock_commit_generate", "mock_commit_validate")
+@pytest.mark.usefixtures("mock_commit_parse", "mock_commit_validate")
 class TestRunnerValidate:
     """Tests for clint.cli.runner.Runner.validate method."""
 
     # pylint: disable=unused-argument
 
-    mock_commit_generate: MagicMock
+    mock_commit_parse: MagicMock
     mock_commit_validate: MagicMock
 
     def test_valid_execution(self, clean_commit_mocks):
         """Test valid execution of validate method."""
         message = "message"
         Runner.validate(message=message)
-        assert self.mock_commit_generate.call_args_list == [call(msg=message)]
-        assert self.mock_commit_validate.call_args_list == [call()]
+        assert self.mock_commit_parse.call_args_list == [call(message, stats=None)]
+        assert self.mock_commit_validate.call_args_list == [
+            call(fail_fast=False, data=None)
+        ]
 
-    def test_generation_exception(self, clean_commit_mocks):
-        """Test exception handling on validate method."""
+    def test_parse_failure(self, clean_commit_mocks):
+        """Test that parse failures are registered as generation errors."""
         error = "error"
         message = "message"
-        self.mock_commit_generate.side_effect = validator.GenerationException(error)
+        self.mock_commit_parse.side_effect = lambda msg, stats: validator.ParseFailure(
+            error
+        )
         result = Runner.validate(message=message)
         assert result.actions == {"generation": error}
         assert result.return_code == 101
-        assert self.mock_commit_generate.call_args_list == [call(msg=message)]
+        assert self.mock_commit_parse.call_args_list == [call(message, stats=None)]
         assert not self.mock_commit_validate.called
 
     def test_validation_exception(self, clean_commit_mocks):
@@ -45,8 +52,93 @@ class TestRunnerValidate:
         result = Runner.validate(message=message)
         assert result.actions == {"validation": error}
         assert result.return_code == 101
-        assert self.mock_commit_generate.call_args_list == [call(msg=message)]
-        assert self.mock_commit_validate.call_args_list == [call()]
+        assert self.mock_commit_parse.call_args_list == [call(message, stats=None)]
+        assert self.mock_commit_validate.call_args_list == [
+            call(fail_fast=False, data=None)
+        ]
+
+
+class TestRunnerValidateBatch:  # pylint: disable=too-few-public-methods
+    """Tests for clint.cli.runner.Runner.validate_batch method."""
+
+    def test_valid_execution(self):
+        """Test that every record gets its result, including invalid records."""
+        records = [
+            BatchRecord(id="1", message="feat: description"),
+            BatchRecord(id="2", message=None, error="error"),
+            BatchRecord(id="3", message="foo: description"),
+        ]
+        results = list(Runner.validate_batch(records))
+        assert [record_id for record_id, _ in results] == ["1", "2", "3"]
+        assert results[0][1].return_code == 0
+        assert results[1][1].actions == {"record": "error"}
+        assert results[1][1].return_code == validator.OPERATION_BASE_ERROR_CODE + 1
+        assert results[2][1].actions == {"type_valid": "Type 'foo' is not valid."}
+
+
+@pytest.mark.usefixtures("measured")
+class TestRunnerMeasure:
+    """Tests for clint.cli.runner.Runner measure methods."""
+
+    def test_batch_stats(self):
+        """Test that measured validations keep their stats."""
+        Runner.measure()
+        records = [BatchRecord(id="1", message="foo: description")]
+        results = list(Runner.validate_batch(records, stats=True))
+        assert results[0][1].stats["subject.type_valid"].findings == 1
+
+    def test_init_worker(self, mocker):
+        """Test that workers apply the configuration, and measure if requested."""
+        mock_load = mocker.patch("clint.cli.runner.Config.load")
+        Runner.init_worker()
+        assert not validator.RuleRegistry.is_timed()
+        Runner.init_worker(stats=True)
+        assert validator.RuleRegistry.is_timed()
+        assert not Tracer.is_enabled()
+        Runner.init_worker(trace=True)
+        assert Tracer.is_enabled()
+        assert mock_load.call_args_list == [call(), call(), call()]
+
+
+class TestRunnerValidateLog:
+    """Tests for clint.cli.runner.Runner.validate_log method."""
+
+    def test_valid_execution(self, mocker):
+        """Test that every commit of the range gets its result."""
+        entries = [
+            LogEntry(sha="a" * 40, message="feat: description\n"),
+            LogEntry(sha="b" * 40, message="foo: description\n"),
+        ]
+        mock_git_log = mocker.patch("clint.cli.runner.GitLog", return_value=entries)
+        results = list(Runner.validate_log(rev_range="HEAD"))
+        assert mock_git_log.call_args_list == [call(rev_range="HEAD")]
+        assert [sha for sha, _ in results] == ["a" * 40, "b" * 40]
+        assert [result.return_code for _, result in results] == [0, 1]
+
+    def test_ledger(self, mocker, tmp_path):
+        """Test that ledger commits are skipped and compliant ones recorded."""
+        entries = [
+            LogEntry(sha="a" * 40, message="feat: description\n"),
+            LogEntry(sha="b" * 40, message="foo: description\n"),
+        ]
+        mocker.patch("clint.cli.runner.GitLog", return_value=entries)
+        ledger = Ledger(digest="digest", directory=str(tmp_path))
+        first = list(Runner.validate_log(rev_range="HEAD", ledger=ledger))
+        assert [sha for sha, _ in first] == ["a" * 40, "b" * 40]
+        ledger = Ledger(digest="digest", directory=str(tmp_path))
+        second = list(Runner.validate_log(rev_range="HEAD", ledger=ledger))
+        assert [sha for sha, _ in second] == ["b" * 40]
+        assert ledger.hits == 1
+
+    def test_history_exception(self, mocker):
+        """Test that git errors are raised, not counted as commits."""
+        mock_git_log = mocker.patch("clint.cli.runner.GitLog")
+        mock_git_log.return_value.__iter__.side_effect = HistoryException("error")
+        with pytest.raises(HistoryException):
+            list(Runner.validate_log(rev_range="HEAD"))
+        result = Runner.history_error(HistoryException("error"))
+        assert result.actions == {"log": "error"}
+        assert result.return_code == validator.OPERATION_BASE_ERROR_CODE + 1
 
 
 @pytest.mark.usefixtures("hook_handler_methods")
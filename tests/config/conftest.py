@@ -0,0 +1,30 @@
+"""Configuration for config tests."""
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture(name="project")
+def fixture_project(tmp_path: Path, monkeypatch) -> Path:
+    """Fixture to get an empty project directory, as working directory."""
+    project = tmp_path / "project"
+    project.mkdir()
+    monkeypatch.chdir(project)
+    return project
+
+
+@pytest.fixture
+def write_config(project: Path) -> Callable[..., Path]:
+    """Fixture to get a function that writes a configuration file."""
+
+    def write(content: str, filename: str = ".clint.toml", directory=None) -> Path:
+        path = Path(directory or project) / filename
+        path.write_text(content, encoding="utf8")
+        stat = path.stat()
+        # Keep the modification time moving forward on coarse file systems.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        return path
+
+    return write
@@ -0,0 +1,204 @@
+"""Tests for clint.config.Config class."""
+# pylint: disable=unused-argument
+import sys
+
+import pytest
+
+from clint.cli.runner import Runner
+from clint.config import Config, ConfigException
+from clint.validator import Commit, rules_digest, validate
+
+
+def actions(message: str):
+    """Get the actions of every diagnostic of a message validation."""
+    return [diagnostic.action for diagnostic in validate(message).diagnostics()]
+
+
+class TestConfigFind:
+    """Tests for clint.config.Config.find method."""
+
+    def test_pyproject(self, config, project, write_config):
+        """Test that the clint table of pyproject.toml files is found."""
+        path = write_config('[tool.clint]\ntypes = ["wip"]\n', "pyproject.toml")
+        assert config.find() == (str(path), config.find()[1], {"types": ["wip"]})
+
+    def test_pyproject_without_table(self, config, project, write_config):
+        """Test that pyproject.toml files without a clint table are skipped."""
+        write_config('[tool.other]\ntypes = ["wip"]\n', "pyproject.toml")
+        path = write_config('types = ["wip"]\n', directory=project.parent)
+        assert config.find()[0] == str(path)
+
+    def test_without_toml_library(self, config, project, write_config, monkeypatch):
+        """Test that pyproject.toml files without a clint table need no TOML library."""
+        for module in ("tomllib", "tomli", "toml"):
+            monkeypatch.setitem(sys.modules, module, None)
+        write_config("[tool.black]\nline-length = 88\n", "pyproject.toml")
+        assert config.find() is None
+        write_config('[tool.clint]\ntypes = ["wip"]\n', "pyproject.toml")
+        with pytest.raises(ConfigException, match="tomli"):
+            config.find()
+
+    def test_clint_toml_first(self, config, project, write_config):
+        """Test that .clint.toml files win over pyproject.toml files."""
+        write_config('[tool.clint]\ntypes = ["foo"]\n', "pyproject.toml")
+        path = write_config('types = ["wip"]\n')
+        assert config.find()[0] == str(path)
+
+    def test_walk_up(self, config, project, write_config):
+        """Test that configuration files are found in parent directories."""
+        path = write_config('types = ["wip"]\n')
+        directory = project / "sub" / "dir"
+        directory.mkdir(parents=True)
+        assert config.find(str(directory))[0] == str(path)
+
+
+class TestConfigRead:
+    """Tests for clint.config.Config.read method."""
+
+    def test_memory_cache(self, config, project, write_config, mocker):
+        """Test that unchanged files are parsed once."""
+        write_config('types = ["wip"]\n')
+        parse = mocker.spy(config, "parse")
+        config.find()
+        config.find()
+        assert parse.call_count == 1
+
+    def test_disk_cache(self, config, project, write_config, mocker):
+        """Test that unchanged files are not parsed again by new processes."""
+        write_config('types = ["wip"]\n')
+        config.find()
+        mocker.patch.object(config, "_parsed", {})
+        parse = mocker.spy(config, "parse")
+        assert config.find()[2] == {"types": ["wip"]}
+        parse.assert_not_called()
+
+    def test_changed(self, config, project, write_config):
+        """Test that changed files are parsed again."""
+        write_config('types = ["wip"]\n')
+        config.find()
+        write_config('types = ["foo"]\n')
+        assert config.find()[2] == {"types": ["foo"]}
+
+
+class TestConfigCheck:  # pylint: disable=too-few-public-methods
+    """Tests for clint.config.Config.check method."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            'foo = "bar"\n',
+            'types = "wip"\n',
+            "types = [1]\n",
+            "max-length = 0\n",
+            "max-length = true\n",
+            "rules = { foo = 1 }\n",
+            "types = [\n",
+        ],
+    )
+    def test_invalid(self, config, project, write_config, content):
+        """Test that invalid configurations are rejected."""
+        write_config(content)
+        with pytest.raises(ConfigException):
+            config.find()
+
+
+class TestConfigLoad:
+    """Tests for clint.config.Config.load method."""
+
+    def test_types(self, config, project, write_config):
+        """Test that configured types replace the valid commit types."""
+        write_config('types = ["wip", "feat"]\n')
+        config.load()
+        assert actions("wip: description") == ["validation"]
+        assert actions("fix: description") == ["type_valid"]
+
+    def test_scopes(self, config, project, write_config):
+        """Test that configured scopes are the only valid ones."""
+        write_config('scopes = ["api"]\n')
+        config.load()
+        assert actions("feat(api): description") == ["validation"]
+        assert actions("feat(web): description") == ["scope_valid"]
+        assert actions("feat: description") == ["validation"]
+
+    def test_lengths(self, config, project, write_config):
+        """Test that configured length limits are applied."""
+        write_config("max-subject-length = 20\nmax-length = 100\n")
+        config.load()
+        assert actions("feat: a long description") == ["subject_length"]
+        assert actions("feat: x\n\n" + "a" * 100) == ["generation"]
+
+    def test_rules(self, config, project, write_config):
+        """Test that rules are enabled, disabled and configured."""
+        write_config(
+            'enable = ["ticket_reference"]\ndisable = ["type_case"]\n'
+            + '[rules.ticket_reference]\ntokens = ["Jira"]\n'
+        )
+        config.load()
+        assert actions("Feat: description\n\nJira: ABC") == ["validation"]
+        assert actions("feat: description\n\nRefs #1") == ["ticket_reference"]
+
+    def test_unknown_rule(self, config, project, write_config):
+        """Test that unknown rules are rejected."""
+        write_config('disable = ["foo"]\n')
+        with pytest.raises(ConfigException):
+            config.load()
+
+    def test_failed_apply(self, config, project, write_config, tmp_path):
+        """Test that a failed configuration is not kept, nor taken as applied."""
+        other = tmp_path / "other"
+        other.mkdir()
+        write_config('types = ["feat"]\n')
+        write_config('types = ["wip"]\ndisable = ["foo"]\n', directory=other)
+        config.load()
+        with pytest.raises(ConfigException):
+            config.load(str(other))
+        assert actions("wip: description") == ["type_valid"]
+        config.load()
+        assert actions("feat: description") == ["validation"]
+        assert actions("wip: description") == ["type_valid"]
+
+    def test_reload(self, config, project, write_config):
+        """Test that changed and removed files restore the rules before applying."""
+        path = write_config('types = ["wip"]\nmax-length = 100\n')
+        config.load()
+        digest = rules_digest()
+        write_config('scopes = ["api"]\n')
+        config.load()
+        assert actions("fix(api): description") == ["validation"]
+        assert actions("wip(api): description") == ["type_valid"]
+        assert Commit.MAX_LENGTH is None
+        assert rules_digest() != digest
+        path.unlink()
+        assert config.load() is None
+        assert actions("fix(web): description") == ["validation"]
+
+    def test_plugins(self, config, project, write_config, plugin):
+        """Test that plugins apply only while listed in the configuration."""
+        name = plugin()
+        write_config(f'types = ["wip"]\nplugins = ["{name}"]\n')
+        config.load()
+        assert actions("wip: description") == ["no_wip"]
+        path = write_config('types = ["wip"]\n')
+        config.load()
+        assert actions("wip: description") == ["validation"]
+        write_config(f'types = ["wip"]\nplugins = ["{name}"]\n')
+        config.load()
+        assert actions("wip: description") == ["no_wip"]
+        path.unlink()
+        config.load()
+        assert actions("wip: description") == ["type_valid"]
+
+    def test_unchanged(self, config, project, write_config, mocker):
+        """Test that unchanged files are not applied again."""
+        write_config('types = ["wip"]\n')
+        config.load()
+        apply = mocker.spy(config, "apply")
+        config.load()
+        apply.assert_not_called()
+
+    def test_runner(self, config, project, write_config):
+        """Test that the runner gets a result with configuration errors."""
+        write_config('foo = "bar"\n')
+        result = Runner.load_config()
+        assert result.return_code == Config.OPERATION_BASE_ERROR_CODE + 1
+        assert [diagnostic.action for diagnostic in result.diagnostics()] == ["config"]
@@ -1,11 +1,66 @@
 """Configuration for general tests."""
+import sys
+
 import pytest
 from faker import Faker
 
+from clint.config import Config
+from clint.validator import Commit, RuleRegistry
+
 from .ci.conftest import metadata_current  # pylint: disable=unused-import
 
 faker = Faker()
 
+WIP_PLUGIN = """
+from clint.validator import RuleRegistry
+
+
+@RuleRegistry.rule(target="subject", action="no_wip")
+def no_wip(subject, result, index, options):
+    if subject.type == "wip":
+        result.add_action(action="no_wip", message="No WIP.", is_error=True)
+"""
+
+
+@pytest.fixture(scope="session", autouse=True)
+def clint_cache_dir(tmp_path_factory):
+    """Fixture to keep the compiled rules of the tests in a temporary directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("CLINT_CACHE_DIR", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture
+def config(monkeypatch, tmp_path):
+    """Fixture to apply configurations, restoring the rules after a test."""
+    monkeypatch.setenv("CLINT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(Config, "_parsed", {})
+    monkeypatch.setattr(Config, "_applied", None)
+    monkeypatch.setattr(Config, "_baseline", None)
+    rules = RuleRegistry.snapshot()
+    max_length = Commit.MAX_LENGTH
+    yield Config
+    RuleRegistry.restore(rules)
+    Commit.MAX_LENGTH = max_length
+
+
+@pytest.fixture
+def plugin(tmp_path, monkeypatch):
+    """Fixture to get a function that writes a plugin module, and gets its name."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(RuleRegistry, "_plugins", {})
+    names = []
+
+    def write(source: str = WIP_PLUGIN) -> str:
+        name = f"clint_test_plugin_{len(names)}"
+        (tmp_path / f"{name}.py").write_text(source, encoding="utf8")
+        names.append(name)
+        return name
+
+    yield write
+    for name in names:
+        sys.modules.pop(name, None)
+
 
 @pytest.fixture(scope="class")
 def mock_cc_get_commit_msg(request, class_mocker):
@@ -0,0 +1,42 @@
+"""Configuration for daemon tests."""
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from clint.daemon import Daemon
+
+
+@pytest.fixture(name="socket_path")
+def fixture_socket_path(tmp_path: Path) -> str:
+    """Fixture to get a socket path inside a temporary directory."""
+    return str(tmp_path / "clint.sock")
+
+
+@pytest.fixture
+def running_daemon(socket_path):
+    """Fixture to get a daemon serving requests in a background thread."""
+    daemon = Daemon(socket_path=socket_path)
+    server = daemon.bind()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield daemon
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+@pytest.fixture
+def projects(tmp_path: Path, config) -> List[Path]:
+    """Fixture to get projects with other types, restoring the rules after a test."""
+    # pylint: disable=unused-argument
+    directories = []
+    for types in ('["wip"]', '["feat"]'):
+        directory = tmp_path / f"project-{len(directories)}"
+        directory.mkdir()
+        (directory / ".clint.toml").write_text(f"types = {types}\n", encoding="utf8")
+        directories.append(directory)
+    return directories
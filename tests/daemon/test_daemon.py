@@ -0,0 +1,178 @@
+"""Test suite for validation daemon and client classes."""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import clint
+from clint.daemon import Client, Daemon, DaemonException
+from clint.daemon.server import RequestHandler
+from clint.validator import validate
+
+MESSAGES = ["feat(scope): valid message", "Foo: invalid message", "feat: what?"]
+
+
+class TestClientRequest:
+    """Tests for clint.daemon.Client.request method."""
+
+    @pytest.mark.usefixtures("running_daemon")
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_daemon_result(self, socket_path, message):
+        """Test that the daemon result is the same as in process validation."""
+        result = Client(socket_path=socket_path).request(message=message)
+        assert result.to_dict() == validate(message=message).to_dict()
+
+    def test_no_daemon(self, socket_path):
+        """Test that no result is returned if the daemon is not running."""
+        assert Client(socket_path=socket_path).request(message=MESSAGES[0]) is None
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_too_large(self, socket_path, monkeypatch):
+        """Test that no result is returned if the message is too large."""
+        monkeypatch.setattr(RequestHandler, "MAX_REQUEST_SIZE", 8)
+        client = Client(socket_path=socket_path)
+        assert client.request(message=MESSAGES[1]) is None
+        result = client.validate(message=MESSAGES[1])
+        assert result.to_dict() == validate(message=MESSAGES[1]).to_dict()
+
+
+@pytest.mark.usefixtures("running_daemon")
+class TestRequestHandler:
+    """Tests for clint.daemon.server.RequestHandler class."""
+
+    @staticmethod
+    def send(socket_path, data):
+        """Send raw data to the daemon and get its JSON reply."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(socket_path)
+            conn.sendall(data)
+            conn.shutdown(socket.SHUT_WR)
+            return json.loads(conn.makefile("rb").read())
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'{"size": 1073741824, "cwd": "."}\n',
+            b'{"size": -1, "cwd": "."}\n',
+            b'{"size": 16, "cwd": "."}\nfeat: short',
+            b'{"size": 0}\n',
+            b'{"size": 0, "cwd": null}\n',
+            b"feat: no header",
+            b"",
+        ],
+    )
+    def test_error(self, socket_path, data):
+        """Test that requests not validated get an explicit error."""
+        assert "error" in self.send(socket_path, data)
+
+    def test_message(self, socket_path):
+        """Test that the message after the header is validated."""
+        reply = self.send(
+            socket_path, b'{"size": 20, "cwd": "."}\nFoo: invalid message'
+        )
+        assert reply == validate(message=MESSAGES[1]).to_dict()
+
+    def test_concurrent_configurations(self, socket_path, projects):
+        """Test that concurrent requests are validated with their configuration."""
+
+        def return_code(directory):
+            header = json.dumps({"size": 16, "cwd": str(directory)})
+            data = header.encode("utf8") + b"\nwip: description"
+            return self.send(socket_path, data)["return_code"]
+
+        # Switch threads often, so unlocked changes of the rules would interleave.
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                return_codes = list(executor.map(return_code, projects * 300))
+        finally:
+            sys.setswitchinterval(interval)
+        assert not any(return_codes[0::2])
+        assert all(return_codes[1::2])
+
+
+class TestClientDirectory:  # pylint: disable=too-few-public-methods
+    """Tests for the configuration of daemon and client in different directories."""
+
+    def test_client_configuration(self, socket_path, tmp_path, monkeypatch):
+        """Test that the daemon applies the configuration of the client directory."""
+        daemon_directory = tmp_path / "daemon"
+        daemon_directory.mkdir()
+        (daemon_directory / ".clint.toml").write_text(
+            'types = ["foo"]\n', encoding="utf8"
+        )
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / ".clint.toml").write_text('types = ["wip"]\n', encoding="utf8")
+        env = {
+            **os.environ,
+            "CLINT_CACHE_DIR": str(tmp_path / "cache"),
+            "PYTHONPATH": os.path.dirname(os.path.dirname(clint.__file__)),
+        }
+        code = f"from clint.daemon import Daemon; Daemon({socket_path!r}).serve()"
+        with subprocess.Popen(
+            [sys.executable, "-c", code], cwd=daemon_directory, env=env
+        ) as daemon:
+            try:
+                monkeypatch.chdir(project)
+                client = Client(socket_path=socket_path)
+                deadline = time.monotonic() + 10
+                result = client.request(message="wip: description")
+                while result is None and time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    result = client.request(message="wip: description")
+                assert result.return_code == 0
+                result = client.request(message="foo: description")
+                assert result.return_code != 0
+            finally:
+                daemon.terminate()
+
+
+class TestClientValidate:
+    """Tests for clint.daemon.Client.validate method."""
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_fallback(self, socket_path, message):
+        """Test fallback to in process validation if the daemon is not running."""
+        result = Client(socket_path=socket_path).validate(message=message)
+        assert result.to_dict() == validate(message=message).to_dict()
+
+    def test_main(self, socket_path, tmp_path, monkeypatch, capsys):
+        """Test the hook entrypoint with a commit message file."""
+        monkeypatch.setenv("CLINT_SOCKET", socket_path)
+        message_path = tmp_path / "COMMIT_EDITMSG"
+        message_path.write_text(MESSAGES[1], encoding="utf8")
+        with pytest.raises(SystemExit) as exit_info:
+            Client.main([str(message_path)])
+        assert exit_info.value.code == 1
+        assert capsys.readouterr().out == "type_case: Type 'Foo' is not lowercase.\n"
+
+
+class TestDaemonBind:
+    """Tests for clint.daemon.Daemon.bind method."""
+
+    def test_stale_socket(self, socket_path):
+        """Test that a socket file without daemon is replaced."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(socket_path)
+        server = Daemon(socket_path=socket_path).bind()
+        server.server_close()
+        assert os.path.exists(socket_path)
+
+    @pytest.mark.usefixtures("running_daemon")
+    def test_already_running(self, socket_path):
+        """Test that only one daemon can listen on the same socket."""
+        with pytest.raises(DaemonException):
+            Daemon(socket_path=socket_path).bind()
+
+    def test_user_only_permissions(self, socket_path):
+        """Test that the socket is only accessible by the current user."""
+        server = Daemon(socket_path=socket_path).bind()
+        server.server_close()
+        assert os.stat(socket_path).st_mode & 0o077 == 0
@@ -0,0 +1,36 @@
+"""Configuration for history tests."""
+import subprocess
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+GIT_CONFIG = ["-c", "user.name=CLint", "-c", "user.email=clint@example.com"]
+
+
+@pytest.fixture(name="git_repo")
+def fixture_git_repo(tmp_path: Path) -> Path:
+    """Fixture to get an empty git repository."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+@pytest.fixture
+def git_commit(git_repo: Path) -> Callable[[str], str]:
+    """Fixture to get a function that commits a message and returns its SHA."""
+
+    def commit(message: str) -> str:
+        subprocess.run(
+            ["git", *GIT_CONFIG, "commit", "-q", "--allow-empty", "-m", message],
+            cwd=git_repo,
+            check=True,
+        )
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+
+    return commit
@@ -0,0 +1,157 @@
+"""Test suite for history analytics classes."""
+import pytest
+
+from clint.history import CommitFacts, GitLog, HistoryStats, LogEntry, SpaceSaving
+
+DAY = 24 * 60 * 60
+
+
+def get_facts(message: str, timestamp: int = 0, author: str = "a@b.c") -> CommitFacts:
+    """Get the facts of a commit message."""
+    return CommitFacts.of(
+        LogEntry(sha="0", message=message.encode(), timestamp=timestamp, author=author)
+    )
+
+
+class TestSpaceSaving:
+    """Tests for clint.history.SpaceSaving class."""
+
+    def test_exact(self):
+        """Test that counts are exact while the keys fit in the capacity."""
+        counter = SpaceSaving(capacity=3)
+        for key in "abacab":
+            counter.add(key)
+        assert counter.top(2) == [("a", 3, 0), ("b", 2, 0)]
+
+    def test_heavy_hitters(self):
+        """Test that frequent keys are kept, with overestimation bounded by error."""
+        counter = SpaceSaving(capacity=8)
+        stream = [f"rare{index}" for index in range(100)]
+        for index in range(100):
+            stream.insert(index * 2, "x" if index % 3 else "y")
+        for key in stream:
+            counter.add(key)
+        assert len(counter) == 8
+        (first, first_count, first_error), (
+            second,
+            second_count,
+            second_error,
+        ) = counter.top(2)
+        assert (first, second) == ("x", "y")
+        assert first_count - first_error <= 66 <= first_count
+        assert second_count - second_error <= 34 <= second_count
+
+
+class TestCommitFacts:
+    """Tests for clint.history.CommitFacts class."""
+
+    @pytest.mark.parametrize(
+        "message, breaking",
+        [
+            ("feat(api): add endpoint", False),
+            ("feat(api)!: add endpoint", True),
+            ("feat(api): add endpoint\n\nBREAKING CHANGE: removed another", True),
+            ("feat(api): add endpoint\n\nBREAKING-CHANGE: removed another", True),
+        ],
+    )
+    def test_parsed(self, message, breaking):
+        """Test that type, scope and breaking changes come from the parsed commit."""
+        facts = get_facts(message, timestamp=10, author="dev@example.com")
+        assert facts == CommitFacts(
+            timestamp=10,
+            author="dev@example.com",
+            parsed=True,
+            type="feat",
+            scope="api",
+            breaking=breaking,
+            actions=(),
+        )
+
+    def test_failed(self):
+        """Test that the distinct actions of the errors are kept."""
+        facts = get_facts("Feat: Add endpoint\n\nRefs: #1 \nRefs:  #2")
+        assert facts.parsed
+        assert facts.actions[0] == "type_case"
+        assert len(set(facts.actions)) == len(facts.actions)
+
+    def test_unparsed(self):
+        """Test that messages that do not parse have no type."""
+        facts = get_facts("Add endpoint?")
+        assert not facts.parsed
+        assert (facts.type, facts.actions) == ("", ("generation",))
+
+
+class TestHistoryStats:
+    """Tests for clint.history.HistoryStats class."""
+
+    @staticmethod
+    def get_stats(bucket: str = "month") -> HistoryStats:
+        """Get statistics of a few commits, over two months."""
+        stats = HistoryStats(bucket=bucket, top=3)
+        for message, day, author in [
+            ("feat(api): add endpoint", 0, "a@b.c"),
+            ("fix(api)!: remove field", 1, "a@b.c"),
+            ("Fix: typo", 2, "c@d.e"),
+            ("Add endpoint?", 40, "c@d.e"),
+            ("docs: explain", 41, "a@b.c"),
+        ]:
+            stats.add(get_facts(message, timestamp=day * DAY, author=author))
+        return stats
+
+    def test_to_dict(self):
+        """Test that totals, top counts and buckets are aggregated."""
+        data = self.get_stats().to_dict()
+        assert (data["commits"], data["compliant"], data["unparsed"]) == (5, 3, 1)
+        assert data["breaking"] == 1
+        assert data["breaking_rate"] == 0.25
+        assert [item["name"] for item in data["types"]] == ["Fix", "docs", "feat"]
+        assert data["scopes"] == [{"name": "api", "count": 2, "error": 0}]
+        assert [
+            (bucket["bucket"], bucket["commits"]) for bucket in data["buckets"]
+        ] == [
+            ("1970-01", 3),
+            ("1970-02", 2),
+        ]
+        assert data["buckets"][0]["compliance_rate"] == 2 / 3
+        assert data["authors"] == [{"name": "c@d.e", "count": 2, "error": 0}]
+        assert data["actions"][0] == {"name": "generation", "count": 1, "error": 0}
+
+    @pytest.mark.parametrize(
+        "bucket, expected",
+        [
+            ("day", "1970-01-02"),
+            ("week", "1970-W01"),
+            ("month", "1970-01"),
+            ("year", "1970"),
+        ],
+    )
+    def test_buckets(self, bucket, expected):
+        """Test that commits are bucketed by their commit date, in UTC."""
+        assert HistoryStats(bucket=bucket).bucket_of(DAY) == expected
+
+    def test_tables(self):
+        """Test that every table is aligned, and separated by an empty line."""
+        lines = self.get_stats().tables()
+        assert lines[0].split() == ["commits", "5"]
+        assert lines[1].split() == ["compliant", "3", "60.0%"]
+        tables = "\n".join(lines).split("\n\n")
+        assert [table.split()[0] for table in tables[1:]] == [
+            "type",
+            "scope",
+            "action",
+            "author",
+            "month",
+        ]
+
+    def test_history(self, git_repo, git_commit):
+        """Test that the commits of a git history are aggregated."""
+        git_commit("feat: first commit")
+        git_commit("first commit?")
+        stats = HistoryStats()
+        for entry in GitLog(rev_range="HEAD", cwd=str(git_repo), details=True):
+            stats.add(CommitFacts.of(entry))
+        data = stats.to_dict()
+        assert (data["commits"], data["compliant"]) == (2, 1)
+        assert data["authors"] == [
+            {"name": "clint@example.com", "count": 1, "error": 0}
+        ]
@@ -0,0 +1,134 @@
+"""Test suite for Ledger class."""
+import os
+import random
+import threading
+
+import pytest
+
+from clint.history import HistoryException, Ledger
+
+DIGEST = "a" * 64
+
+
+@pytest.fixture(name="shas")
+def fixture_shas():
+    """Fixture to get random commit SHAs."""
+    generator = random.Random(0)
+    return [f"{generator.getrandbits(160):040x}" for _ in range(200)]
+
+
+class TestLedger:
+    """Tests for clint.history.Ledger class."""
+
+    def test_add_and_contains(self, tmp_path, shas):
+        """Test that only added SHAs are in the ledger, counting the hits."""
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            for sha in shas[:100]:
+                ledger.add(sha)
+            assert all(sha in ledger for sha in shas[:100])
+            assert not any(sha in ledger for sha in shas[100:])
+            assert ledger.count == 100
+            assert ledger.hits == 100
+
+    def test_persistence(self, tmp_path, shas):
+        """Test that SHAs are kept between runs with the same digest."""
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            ledger.add(shas[0])
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            assert shas[0] in ledger
+            assert ledger.count == 1
+
+    def test_growth(self, tmp_path, shas, mocker):
+        """Test that the table grows keeping every SHA."""
+        mocker.patch.object(Ledger, "INITIAL_CAPACITY", 4)
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            for sha in shas:
+                ledger.add(sha)
+                ledger.add(sha)
+            assert ledger.capacity >= len(shas) / Ledger.MAX_LOAD_FACTOR
+            assert ledger.count == len(shas)
+            assert all(sha in ledger for sha in shas)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+    def test_growth_error(self, tmp_path, shas, mocker):
+        """Test that errors while growing the table are history errors."""
+        mocker.patch.object(Ledger, "INITIAL_CAPACITY", 4)
+        mocker.patch(
+            "clint.history.ledger.tempfile.mkstemp",
+            side_effect=OSError(28, "No space left on device"),
+        )
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            with pytest.raises(HistoryException, match="No space left on device"):
+                for sha in shas:
+                    ledger.add(sha)
+
+    def test_replace_error(self, tmp_path, shas, mocker):
+        """Test that a new file that cannot replace the ledger is removed."""
+        mocker.patch.object(Ledger, "INITIAL_CAPACITY", 4)
+        mocker.patch(
+            "clint.history.ledger.os.replace", side_effect=PermissionError("denied")
+        )
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            with pytest.raises(HistoryException, match="denied"):
+                for sha in shas:
+                    ledger.add(sha)
+        assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+    def test_stale_temporary_file(self, tmp_path):
+        """Test that temporary files of interrupted growths are removed."""
+        (tmp_path / "ledger-abc123.tmp").write_bytes(b"partial")
+        with Ledger(digest=DIGEST, directory=str(tmp_path)):
+            pass
+        assert not (tmp_path / "ledger-abc123.tmp").exists()
+
+    def test_lock(self, tmp_path, shas):
+        """Test that a ledger waits until the open one of the directory is closed."""
+        pytest.importorskip("fcntl")
+        opened = threading.Event()
+
+        def open_ledger():
+            with Ledger(digest="b" * 64, directory=str(tmp_path)) as ledger:
+                opened.set()
+                assert shas[0] not in ledger
+
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            ledger.add(shas[0])
+            thread = threading.Thread(target=open_ledger)
+            thread.start()
+            assert not opened.wait(timeout=0.2)
+            assert os.path.exists(ledger.path)
+        thread.join(timeout=5)
+        assert opened.is_set()
+        assert not os.path.exists(ledger.path)
+
+    def test_invalidation(self, tmp_path, shas):
+        """Test that a new rules digest invalidates the previous ledger."""
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            ledger.add(shas[0])
+        with Ledger(digest="b" * 64, directory=str(tmp_path)) as ledger:
+            assert shas[0] not in ledger
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            [os.path.basename(ledger.path), Ledger.LOCK_FILENAME]
+        )
+
+    def test_corrupted_file(self, tmp_path, shas):
+        """Test that a corrupted ledger file is replaced by an empty one."""
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            ledger.add(shas[0])
+        with open(ledger.path, mode="r+b") as file:
+            file.write(b"corrupted")
+        with Ledger(digest=DIGEST, directory=str(tmp_path)) as ledger:
+            assert shas[0] not in ledger
+
+    def test_git_directory(self, git_repo, monkeypatch):
+        """Test that the ledger is stored inside the git directory by default."""
+        monkeypatch.chdir(git_repo)
+        with Ledger(digest=DIGEST) as ledger:
+            assert os.path.dirname(ledger.path) == str(git_repo / ".git" / "clint")
+
+    def test_outside_repository(self, tmp_path, monkeypatch):
+        """Test that the ledger cannot be opened outside a git repository."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        with pytest.raises(HistoryException):
+            Ledger(digest=DIGEST).open()
@@ -0,0 +1,64 @@
+"""Test suite for GitLog class."""
+import sys
+import threading
+import time
+
+import pytest
+
+from clint.history import GitLog, HistoryException, LogEntry
+
+
+class TestGitLog:
+    """Tests for clint.history.GitLog class."""
+
+    def test_entries(self, git_repo, git_commit, mocker):
+        """Test that every commit of the range is read, in git log order."""
+        mocker.patch.object(GitLog, "CHUNK_SIZE", 7)
+        first = git_commit("feat: first commit")
+        second = git_commit("fix(scope): second commit\n\nBody of the commit.")
+        entries = list(GitLog(rev_range="HEAD", cwd=str(git_repo)))
+        assert entries == [
+            LogEntry(
+                sha=second,
+                message=b"fix(scope): second commit\n\nBody of the commit.\n",
+            ),
+            LogEntry(sha=first, message=b"feat: first commit\n"),
+        ]
+
+    def test_details(self, git_repo, git_commit):
+        """Test that the commit time and author email are read, if asked."""
+        sha = git_commit("feat: first commit\n\nBody.")
+        (entry,) = GitLog(rev_range="HEAD", cwd=str(git_repo), details=True)
+        assert entry.sha == sha
+        assert entry.message == b"feat: first commit\n\nBody.\n"
+        assert entry.author == "clint@example.com"
+        assert abs(entry.timestamp - time.time()) < 60
+
+    def test_range(self, git_repo, git_commit):
+        """Test that only commits inside the revision range are read."""
+        first = git_commit("feat: first commit")
+        second = git_commit("feat: second commit")
+        entries = list(GitLog(rev_range=f"{first}..HEAD", cwd=str(git_repo)))
+        assert [entry.sha for entry in entries] == [second]
+
+    def test_bad_revision(self, git_repo, git_commit):
+        """Test that git errors are raised after reading the stream."""
+        git_commit("feat: first commit")
+        with pytest.raises(HistoryException):
+            list(GitLog(rev_range="unknown-revision", cwd=str(git_repo)))
+
+    def test_large_stderr(self, mocker):
+        """Test that a large error output does not block the read of the history."""
+        script = (
+            "import sys; sys.stderr.write('warning' * 100000);"
+            + "sys.stdout.write('a' * 40 + '\\0feat: message\\0')"
+        )
+        mocker.patch.object(GitLog, "command", [sys.executable, "-c", script])
+        entries = []
+        thread = threading.Thread(
+            target=lambda: entries.extend(GitLog(rev_range="HEAD")), daemon=True
+        )
+        thread.start()
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+        assert [entry.sha for entry in entries] == ["a" * 40]
@@ -0,0 +1 @@
+"""Tests suite for report classes."""
@@ -0,0 +1,49 @@
+"""Configuration for report tests."""
+import io
+from typing import Callable, List, Tuple
+
+import pytest
+
+from clint.report import Reporter
+from clint.result import Result
+from clint.validator import BatchSummary
+
+
+def get_results() -> List[Tuple[str, Result]]:
+    """Get the results of a compliant record and of a failed one."""
+    return [
+        (
+            "1",
+            Result(operation="test", base_error_code=0).add_action(
+                action="validation", message="Compliant!", is_error=False
+            ),
+        ),
+        (
+            "2",
+            Result(operation="test", base_error_code=0).add_action(
+                action="type_valid",
+                message="Type '{}' is not valid.",
+                is_error=True,
+                args=("foo",),
+                index=0,
+                span=(0, 3),
+            ),
+        ),
+    ]
+
+
+@pytest.fixture
+def report() -> Callable[[Callable[[io.StringIO], Reporter]], str]:
+    """Fixture to get a function that reports the results, getting the output."""
+
+    def write(reporter_class: Callable[[io.StringIO], Reporter]) -> str:
+        stream = io.StringIO()
+        reporter = reporter_class(stream)
+        summary = BatchSummary()
+        reporter.start()
+        for record_id, result in get_results():
+            reporter.add(record_id, summary.add(result))
+        reporter.finish(summary)
+        return stream.getvalue()
+
+    return write
@@ -0,0 +1,38 @@
+"""Test suite for JunitReporter class."""
+import io
+from xml.etree import ElementTree
+
+from clint.report import JunitReporter
+from clint.result import Result
+from clint.validator import BatchSummary
+
+
+class TestJunitReporter:
+    """Tests for clint.report.JunitReporter class."""
+
+    def test_report(self, report):
+        """Test that every record is a test case, failed by its errors."""
+        root = ElementTree.fromstring(report(JunitReporter))
+        cases = root.findall("./testsuite/testcase")
+        assert [case.get("name") for case in cases] == ["1", "2"]
+        assert cases[0].find("failure") is None
+        failure = cases[1].find("failure")
+        assert failure.get("type") == "type_valid"
+        assert failure.get("message") == "Type 'foo' is not valid."
+        assert failure.text == "type_valid: Type 'foo' is not valid."
+
+    def test_invalid_characters(self):
+        """Test that characters XML cannot hold are replaced and escaped."""
+        stream = io.StringIO()
+        reporter = JunitReporter(stream)
+        reporter.start()
+        reporter.add(
+            '<a\0"&',
+            Result(operation="test", base_error_code=0).add_action(
+                action="type_valid", message="Type '\x1b<' is not valid.", is_error=True
+            ),
+        )
+        reporter.finish(BatchSummary())
+        case = ElementTree.fromstring(stream.getvalue()).find("./testsuite/testcase")
+        assert case.get("name") == '<a\ufffd"&'
+        assert case.find("failure").get("message") == "Type '\ufffd<' is not valid."
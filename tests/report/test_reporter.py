@@ -0,0 +1,103 @@
+"""Test suite for Reporter classes."""
+import io
+import json
+from functools import partial
+
+import pytest
+
+from clint import __version__
+from clint.report import (
+    REPORTERS,
+    JsonReporter,
+    NdjsonReporter,
+    Reporter,
+    TextReporter,
+)
+from clint.result import Result
+from clint.validator import BatchSummary
+
+
+class TestReporterBuffer:
+    """Tests for clint.report.Reporter buffer."""
+
+    def test_buffer(self, monkeypatch):
+        """Test that text is only written to the stream once the buffer is full."""
+        monkeypatch.setattr(Reporter, "BUFFER_SIZE", 4)
+        stream = io.StringIO()
+        reporter = NdjsonReporter(stream)
+        reporter.write("ab")
+        assert stream.getvalue() == ""
+        reporter.write("cd")
+        assert stream.getvalue() == "abcd"
+        reporter.write("e")
+        reporter.flush()
+        assert stream.getvalue() == "abcde"
+
+    def test_abstract(self):
+        """Test that the base reporter cannot write results."""
+        with pytest.raises(TypeError):
+            Reporter(io.StringIO())  # pylint: disable=abstract-class-instantiated
+
+    def test_names(self):
+        """Test that reporters are registered by their names."""
+        assert list(REPORTERS) == ["text", "ndjson", "json", "sarif", "junit"]
+
+
+class TestReporterFormats:
+    """Tests for clint.report text and JSON reporters."""
+
+    def test_text(self, report):
+        """Test that every diagnostic is a line, tied to its record."""
+        assert report(TextReporter).splitlines() == [
+            "1: validation: Compliant!",
+            "2: type_valid: Type 'foo' is not valid.",
+        ]
+
+    def test_text_only_failures(self, report):
+        """Test that compliant records are skipped, if only failures are shown."""
+        assert report(partial(TextReporter, only_failures=True)).splitlines() == [
+            "2: type_valid: Type 'foo' is not valid.",
+        ]
+
+    def test_ndjson(self, report):
+        """Test that every record is a JSON line, with its diagnostics."""
+        records = [json.loads(line) for line in report(NdjsonReporter).splitlines()]
+        assert [record["id"] for record in records] == ["1", "2"]
+        assert records[1] == {
+            "id": "2",
+            "return_code": 1,
+            "diagnostics": [
+                {
+                    "action": "type_valid",
+                    "message": "Type 'foo' is not valid.",
+                    "is_error": True,
+                    "index": 0,
+                    "span": [0, 3],
+                }
+            ],
+        }
+
+    def test_json(self, report):
+        """Test that the records and their summary are a single JSON document."""
+        document = json.loads(report(JsonReporter))
+        assert document["version"] == __version__
+        assert [record["id"] for record in document["results"]] == ["1", "2"]
+        assert (document["total"], document["failed"]) == (2, 1)
+        assert document["return_code"] == 1
+
+    def test_json_empty(self):
+        """Test that the document is valid without records."""
+        stream = io.StringIO()
+        reporter = JsonReporter(stream)
+        reporter.start()
+        reporter.finish(BatchSummary())
+        assert json.loads(stream.getvalue())["results"] == []
+
+    def test_record(self):
+        """Test that records without diagnostics are serializable."""
+        result = Result(operation="test", base_error_code=0)
+        assert Reporter.record("a", result) == {
+            "id": "a",
+            "return_code": 0,
+            "diagnostics": [],
+        }
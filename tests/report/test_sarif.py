@@ -0,0 +1,26 @@
+"""Test suite for SarifReporter class."""
+import json
+
+from clint.report import SarifReporter
+
+
+class TestSarifReporter:  # pylint: disable=too-few-public-methods
+    """Tests for clint.report.SarifReporter class."""
+
+    def test_log(self, report):
+        """Test that every error is a result of its rule, at its record."""
+        log = json.loads(report(SarifReporter))
+        assert log["version"] == "2.1.0"
+        (run,) = log["runs"]
+        assert run["tool"]["driver"]["name"] == "clint"
+        assert run["tool"]["driver"]["rules"] == [{"id": "type_valid"}]
+        assert run["results"] == [
+            {
+                "ruleId": "type_valid",
+                "level": "error",
+                "message": {"text": "Type 'foo' is not valid."},
+                "locations": [{"logicalLocations": [{"fullyQualifiedName": "2"}]}],
+                "properties": {"index": 0, "span": [0, 3]},
+            }
+        ]
+        assert run["invocations"][0]["exitCode"] == 1
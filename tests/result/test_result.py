@@ -0,0 +1,98 @@
+"""Test suite for Result class."""
+import pickle
+
+import pytest
+
+from clint.result import NO_POSITION, FailFastException, Result
+
+
+class TestResultDict:  # pylint: disable=too-few-public-methods
+    """Tests for clint.result.Result to_dict and from_dict methods."""
+
+    def test_round_trip(self, result_with_error_action):
+        """Test that a result is the same after serialization."""
+        data = result_with_error_action.to_dict()
+        result = Result.from_dict(data)
+        assert result.operation == result_with_error_action.operation
+        assert result.return_code == result_with_error_action.return_code
+        assert result.actions == result_with_error_action.actions
+        assert list(result.diagnostics()) == list(
+            result_with_error_action.diagnostics()
+        )
+        assert result.to_dict() == data
+
+
+class TestResultAddAction:
+    """Tests for clint.result.Result.add_action method."""
+
+    def test_repeated_action(self, result_empty):
+        """Test that the same action can be registered many times."""
+        result_empty.add_action(action="error", message="first", is_error=True)
+        result_empty.add_action(action="error", message="second", is_error=True)
+        assert result_empty.count == 2
+        assert result_empty.return_code == 2
+        assert [d.message for d in result_empty.diagnostics()] == ["first", "second"]
+        assert result_empty.actions == {"error": "first"}
+
+    def test_lazy_message(self, result_empty):
+        """Test that messages are formatted with their arguments."""
+        result_empty.add_action(
+            action="error", message="Value '{0}' is {1}.", is_error=True, args=("a", 1)
+        )
+        diagnostic = next(result_empty.diagnostics())
+        assert diagnostic.template == "Value '{0}' is {1}."
+        assert diagnostic.message == "Value 'a' is 1."
+
+    def test_message_without_args(self, result_empty):
+        """Test that messages without arguments are not formatted."""
+        result_empty.add_action(action="error", message="Value '{}'.", is_error=True)
+        assert next(result_empty.diagnostics()).message == "Value '{}'."
+
+    def test_position(self, result_empty):
+        """Test that the index and span of the finding are kept."""
+        result_empty.add_action(
+            action="error", message="error", is_error=True, index=2, span=(3, 5)
+        )
+        diagnostic = next(result_empty.diagnostics())
+        assert diagnostic.index == 2
+        assert diagnostic.span == (3, 5)
+
+    def test_no_position(self, result_empty):
+        """Test that findings without position have the NO_POSITION values."""
+        result_empty.add_action(action="error", message="error", is_error=True)
+        diagnostic = next(result_empty.diagnostics())
+        assert diagnostic.index == NO_POSITION
+        assert diagnostic.span == (NO_POSITION, NO_POSITION)
+
+
+class TestResultPickle:  # pylint: disable=too-few-public-methods
+    """Tests for clint.result.Result pickling."""
+
+    def test_round_trip(self, result_with_error_action):
+        """Test that a result has the same diagnostics after pickling."""
+        result_with_error_action.add_action(
+            action="other", message="{0}", is_error=False, args=(1,), index=1
+        )
+        result = pickle.loads(pickle.dumps(result_with_error_action))
+        assert list(result.diagnostics()) == list(
+            result_with_error_action.diagnostics()
+        )
+        assert result.return_code == result_with_error_action.return_code
+
+
+class TestResultFailFast:
+    """Tests for clint.result.Result fail fast mode."""
+
+    def test_first_error(self):
+        """Test that the first error is registered before stopping."""
+        result = Result(operation="test", base_error_code=0, fail_fast=True)
+        with pytest.raises(FailFastException):
+            result.add_action(action="error", message="message", is_error=True)
+        assert result.actions == {"error": "message"}
+        assert result.return_code == 1
+
+    def test_non_error(self):
+        """Test that actions without errors do not stop."""
+        result = Result(operation="test", base_error_code=0, fail_fast=True)
+        result.add_action(action="no_error", message="message", is_error=False)
+        assert result.count == 1
@@ -0,0 +1,63 @@
+"""Test suite for Stats class."""
+import pickle
+
+from clint.result import Result, Stats, StepStats
+
+
+def get_stats() -> Stats:
+    """Get Stats instance with two steps."""
+    stats = Stats()
+    stats.add("parse.subject", seconds=0.25)
+    stats.add("subject.type_case", findings=1, seconds=0.75)
+    return stats
+
+
+class TestStatsAdd:
+    """Tests for clint.result.Stats add and merge methods."""
+
+    def test_add(self):
+        """Test that the calls of a step are added to its counters."""
+        stats = get_stats()
+        stats.add("parse.subject", seconds=0.25, calls=2)
+        assert stats["parse.subject"] == StepStats(calls=3, findings=0, seconds=0.5)
+        assert list(stats) == ["parse.subject", "subject.type_case"]
+        assert len(stats) == 2
+        assert stats.seconds == 1.25
+
+    def test_merge(self):
+        """Test that merged stats add their counters, keeping the new steps."""
+        other = get_stats()
+        other.add("footer.token_whitespace")
+        stats = get_stats().merge(other)
+        assert stats["subject.type_case"] == StepStats(2, 2, 1.5)
+        assert stats["footer.token_whitespace"] == StepStats(1, 0, 0.0)
+
+
+class TestStatsOutput:
+    """Tests for clint.result.Stats outputs."""
+
+    def test_round_trip(self):
+        """Test that stats are the same after serialization."""
+        data = get_stats().to_dict()
+        assert data["subject.type_case"] == {
+            "calls": 1,
+            "findings": 1,
+            "seconds": 0.75,
+        }
+        assert Stats.from_dict(data).to_dict() == data
+
+    def test_table(self):
+        """Test that the table shows the slowest steps first, with their share."""
+        lines = get_stats().table()
+        assert lines[0].split() == list(Stats.COLUMNS)
+        assert lines[1].split() == ["subject.type_case", "1", "1", "0.750000", "75.0%"]
+        assert lines[2].split() == ["parse.subject", "1", "0", "0.250000", "25.0%"]
+        assert len({len(line) for line in lines}) == 1
+
+    def test_pickled_result(self):
+        """Test that the stats of a result are kept between processes."""
+        result = Result(operation="test", base_error_code=0)
+        result.stats = get_stats()
+        assert pickle.loads(pickle.dumps(result)).stats.to_dict() == (
+            result.stats.to_dict()
+        )
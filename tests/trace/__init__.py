@@ -0,0 +1 @@
+"""Tests suite for trace classes."""
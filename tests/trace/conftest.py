@@ -0,0 +1,11 @@
+"""Configuration for trace tests."""
+import pytest
+
+from clint.trace import Tracer
+
+
+@pytest.fixture
+def tracer():
+    """Fixture to stop the tracer after a test."""
+    yield Tracer
+    Tracer.stop()
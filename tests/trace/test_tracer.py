@@ -0,0 +1,104 @@
+"""Test suite for Tracer class."""
+import json
+import os
+from functools import partial
+
+import pytest
+
+from clint import trace
+from clint.trace import Tracer
+from clint.validator import ParallelValidator, validate
+
+
+def spans(events):
+    """Get the category and name of every span of some events."""
+    return [(event["cat"], event["name"]) for event in events if event["ph"] == "X"]
+
+
+class TestTracerSpan:
+    """Tests for clint.trace.Tracer span methods."""
+
+    @pytest.mark.usefixtures("tracer")
+    def test_disabled(self):
+        """Test that nothing is recorded while the tracer is disabled."""
+        start = Tracer.clock()
+        assert Tracer.span("parse", "validator", start) >= start
+        with Tracer.trace("wait", "pool"):
+            pass
+        assert not Tracer.is_enabled()
+        assert not trace.is_enabled()
+        assert not Tracer.collect()
+
+    def test_span(self, tracer):
+        """Test that spans are complete events in microseconds."""
+        tracer.enable()
+        start = tracer.clock()
+        end = tracer.span("parse", "validator", start, findings=1)
+        metadata, event = tracer.collect()
+        assert metadata["ph"] == "M"
+        assert metadata["args"] == {"name": "clint"}
+        assert event["ph"] == "X"
+        assert event["ts"] == start * 1e6
+        assert event["dur"] == pytest.approx((end - start) * 1e6)
+        assert event["pid"] == os.getpid()
+        assert event["args"] == {"findings": 1}
+        assert not tracer.collect()
+
+    def test_iterate(self, tracer):
+        """Test that the read of every item is recorded, and the end of the items."""
+        tracer.enable()
+        with tracer.trace("read", "input"):
+            assert list(tracer.iterate("ab", "record", "input")) == ["a", "b"]
+        assert spans(tracer.collect()) == [("input", "record")] * 3 + [
+            ("input", "read")
+        ]
+
+
+class TestIsEnabled:  # pylint: disable=too-few-public-methods
+    """Tests for clint.trace.is_enabled function."""
+
+    def test_enabled(self, tracer):
+        """Test that the package knows when the tracer records spans."""
+        tracer.enable()
+        assert trace.is_enabled()
+        tracer.stop()
+        assert not trace.is_enabled()
+
+
+class TestTracerFile:
+    """Tests for clint.trace.Tracer file methods."""
+
+    def test_trace_file(self, tracer, tmp_path, mocker):
+        """Test that the file is a trace-event array, written in parts."""
+        mocker.patch.object(tracer, "FLUSH_SIZE", 2)
+        path = tmp_path / "trace.json"
+        tracer.start(str(path))
+        for _ in range(3):
+            tracer.span("parse", "validator", tracer.clock())
+        tracer.record([{"name": "chunk", "cat": "worker", "ph": "X", "pid": 1}])
+        tracer.stop()
+        events = json.loads(path.read_text(encoding="utf8"))
+        assert spans(events) == [("validator", "parse")] * 3 + [("worker", "chunk")]
+        assert not tracer.is_enabled()
+
+    def test_parallel(self, tracer, tmp_path, mocker):
+        """Test that the spans of the worker processes are written by this one."""
+        mocker.patch.object(ParallelValidator, "SERIAL_THRESHOLD", 20)
+        path = tmp_path / "trace.json"
+        tracer.start(str(path))
+        messages = ["feat: valid message", "foo: invalid type"] * 20
+        pool = ParallelValidator(
+            jobs=2, initializer=partial(tracer.enable, process_name="clint worker")
+        )
+        assert len(list(pool.map(validate, messages))) == 40
+        tracer.stop()
+        events = json.loads(path.read_text(encoding="utf8"))
+        workers = {event["pid"] for event in events} - {os.getpid()}
+        assert workers
+        assert spans(events).count(("validator", "parse")) == 40
+        assert ("pool", "wait") in spans(events)
+        assert all(
+            event["args"]["name"] == "clint worker"
+            for event in events
+            if event["ph"] == "M" and event["pid"] in workers
+        )
@@ -1,16 +1,41 @@
 """Configuration for validator tests."""
 import string
+import time
+from typing import Callable
 
 import pytest
 from faker import Faker
 from pytest_mock import MockerFixture
 
-from clint.validator import Commit, Footer, Paragraph, Subject
+from clint.validator import Commit, RuleCompiler, RuleRegistry, Subject
 
 faker = Faker()
 
 WHITESPACES = [w for w in string.whitespace if w != " "]
 
+ADVERSARIAL_SIZES = (20_000, 160_000)
+
+
+def best_time(function: Callable[[str], object], text: str, repeat: int = 3) -> float:
+    """Get the best elapsed time, in seconds, of calling a function with a text."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def assert_linear(function: Callable[[str], object], build: Callable[[int], str]):
+    """Assert that a function time grows linearly with adversarial input sizes."""
+    small, large = ADVERSARIAL_SIZES
+    ratio = large / small
+    small_time = best_time(function, build(small))
+    large_time = best_time(function, build(large))
+    # A quadratic matcher takes `ratio` times longer than a linear one here.
+    assert large_time < small_time * ratio * 4 + 0.01
+
+
 COMMITS_INFO = [
     {"msg": "", "paragraphs": 1},
     {"msg": faker.sentence(), "paragraphs": 1},
@@ -98,32 +123,31 @@ INVALID_DATA = {
 
 
 @pytest.fixture
-def subject() -> Subject:
-    """Fixture to create dummy subject."""
-    return Subject(c_type="", scope="", breaking="", separator="", description="")
-
-
-@pytest.fixture
-def footer() -> Footer:
-    """Fixture to create dummy footer."""
-    return Footer(token="", separator="", description="")
-
-
-@pytest.fixture
-def paragraph() -> Paragraph:
-    """Fixture to create dummy paragraph."""
-    return Paragraph(text="")
+def registry():
+    """Fixture to restore the registered rules after a test."""
+    rules = dict(RuleRegistry._rules)  # pylint: disable=protected-access
+    yield RuleRegistry
+    RuleRegistry._rules = rules  # pylint: disable=protected-access
+    RuleRegistry._changed()  # pylint: disable=protected-access
+    RuleRegistry.time(enabled=False)
 
 
 @pytest.fixture
-def commit() -> Commit:
-    """Fixture to create dummy commit."""
-    return Commit(text="")
+def compiler(registry, monkeypatch, tmp_path):
+    """Fixture to compile the rules in a clean memory and disk cache."""
+    # pylint: disable=redefined-outer-name,unused-argument
+    monkeypatch.setenv(RuleCompiler.DIRECTORY_VARIABLE, str(tmp_path))
+    monkeypatch.setattr(RuleCompiler, "_functions", {})
+    yield RuleCompiler
+    RuleCompiler._version = -1  # pylint: disable=protected-access
+    Commit._calls_version = -1  # pylint: disable=protected-access
 
 
 @pytest.fixture(scope="class")
 def mock_subject_validate(request: pytest.FixtureRequest, class_mocker: MockerFixture):
     """Fixture to patch clint.validator.subject.Subject.validate method."""
+    # Compiled rules do not call the validate methods of the elements.
+    class_mocker.patch("clint.validator.commit.Commit.compiled", return_value=None)
     request.cls.mock_subject_validate = class_mocker.patch(
         "clint.validator.subject.Subject.validate", return_value=True
     )
@@ -0,0 +1,276 @@
+"""Tests for clint.validator.batch functions."""
+# pylint: disable=too-few-public-methods
+import tracemalloc
+
+import pytest
+
+from clint.result import Result, Stats
+from clint.validator import (
+    OPERATION_BASE_ERROR_CODE,
+    BatchSummary,
+    Commit,
+    ParsedCommit,
+    ParseFailure,
+    RuleRegistry,
+    check,
+    parse,
+    parse_and_check,
+    validate,
+    validate_many,
+    validate_stream,
+)
+
+STREAM_MESSAGES = [
+    "feat(scope): description\n\nbody line\n\nRefs: #1\n\n",
+    "Foo:  bad\n\n\nline\nRefs: x",
+    "feat: description?\n\nbody",
+    "",
+]
+
+
+class TestParse:
+    """Tests for clint.validator.parse function."""
+
+    def test_parsed_commit(self, sentence):
+        """Test that a matching message is parsed into its elements."""
+        # pylint: disable=no-member
+        parsed = parse(f"feat(scope): {sentence[:-1]}\n\nbody")
+        assert isinstance(parsed, ParsedCommit)
+        assert parsed.subject.scope == "(scope)"
+        assert [paragraph.text for paragraph in parsed.paragraphs] == ["body"]
+
+    @pytest.mark.parametrize(
+        "message, reason",
+        [
+            ("feat: description?", "Message 'feat: description?' did not match"),
+            ("feat: " + "a" * 30, "Message is longer than 20 characters."),
+        ],
+    )
+    def test_parse_failure(self, mocker, message, reason):
+        """Test that failures are returned with their reason, not raised."""
+        mocker.patch.object(Commit, "MAX_LENGTH", 20)
+        parsed = parse(message)
+        assert isinstance(parsed, ParseFailure)
+        assert parsed.reason.startswith(reason)
+
+
+class TestCheck:
+    """Tests for clint.validator.check function."""
+
+    @pytest.mark.parametrize("message", STREAM_MESSAGES + [b"feat: caf\xe9"])
+    def test_same_as_validate(self, message):
+        """Test that results are the same as the ones of validate."""
+        assert check(message).to_dict() == validate(message=message).to_dict()
+
+    def test_no_exceptions(self, mocker):
+        """Test that messages that do not parse are checked without exceptions."""
+        for module in ("commit", "subject", "footer"):
+            mocker.patch(
+                f"clint.validator.{module}.GenerationException",
+                side_effect=AssertionError,
+            )
+        result = check("feat: description?\n\nbody\nRefs: 1")
+        assert list(result.actions) == ["generation"]
+        assert result.return_code == OPERATION_BASE_ERROR_CODE + 1
+
+
+class TestParseAndCheck:
+    """Tests for clint.validator.parse_and_check function."""
+
+    @pytest.mark.parametrize("message", STREAM_MESSAGES + [b"feat: caf\xe9"])
+    def test_same_as_parse_and_check(self, message):
+        """Test that the commit and the result are the ones of parse and check."""
+        parsed, result = parse_and_check(message)
+        text = message if isinstance(message, str) else message.decode(errors="replace")
+        assert isinstance(parsed, type(parse(text)))
+        assert result.to_dict() == check(message).to_dict()
+
+    def test_parsed_once(self, mocker):
+        """Test that the message is parsed only once."""
+        spy = mocker.spy(Commit, "parse")
+        parse_and_check("feat: description")
+        assert spy.call_count == 1
+
+
+class TestValidate:
+    """Tests for clint.validator.validate function."""
+
+    def test_valid_message(self, sentence):
+        """Test that a valid message returns a successful result."""
+        result = validate(message=f"feat: {sentence[:-1]}")
+        assert result.return_code == 0
+
+    def test_generation_error(self):
+        """Test that generation errors are registered in the result."""
+        result = validate(message="feat: description?")
+        assert list(result.actions) == ["generation"]
+        assert result.return_code == OPERATION_BASE_ERROR_CODE + 1
+
+    def test_fail_fast(self):
+        """Test that only the first error is registered in fail fast mode."""
+        result = validate(message="Foo:  bad", fail_fast=True)
+        assert list(result.actions) == ["type_case"]
+        assert result.return_code == 1
+
+    @pytest.mark.parametrize("kind", [bytes, bytearray, memoryview])
+    def test_bytes_message(self, kind):
+        """Test that valid UTF-8 bytes have the same result as the text."""
+        message = "feat(ñandú): añade más\n\nCuerpo.\n\nRefs: #1"
+        result = validate(message=kind(message.encode("utf8")))
+        assert result.to_dict() == validate(message=message).to_dict()
+
+    @pytest.mark.parametrize(
+        "message, position",
+        [(b"feat: caf\xe9 au lait", 9), (b"feat: valid\n\nCaf\xc3", 16)],
+    )
+    def test_invalid_utf8(self, message, position):
+        """Test that invalid UTF-8 bytes are registered with their position."""
+        diagnostics = validate(message=message).to_dict()["diagnostics"]
+        assert [diagnostic[:3] for diagnostic in diagnostics] == [
+            ["encoding_utf8", "Message is not valid UTF-8, at byte {0}.", [position]]
+        ]
+
+
+class TestValidateStream:
+    """Tests for clint.validator.validate_stream function."""
+
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    @pytest.mark.parametrize("size", [1, 3, 1024])
+    @pytest.mark.parametrize("message", STREAM_MESSAGES)
+    def test_same_result(self, message, size, fail_fast):
+        """Test that a message in chunks has the same result as the whole one."""
+        chunks = [message[i : i + size] for i in range(0, len(message), size)]
+        assert (
+            validate_stream(chunks, fail_fast=fail_fast).to_dict()
+            == validate(message=message, fail_fast=fail_fast).to_dict()
+        )
+
+    @pytest.mark.usefixtures("registry")
+    def test_message_rules(self):
+        """Test that rules of the whole message get every paragraph."""
+        RuleRegistry.enable("ticket_reference")
+        message = "feat: description\n\nbody\n\nRefs: 1"
+        assert list(validate_stream([message]).actions) == ["validation"]
+        assert list(validate_stream(["feat: description"]).actions) == [
+            "ticket_reference"
+        ]
+
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    def test_max_length(self, mocker, fail_fast):
+        """Test that the length of the message is checked after the first error."""
+        mocker.patch.object(Commit, "MAX_LENGTH", 20)
+        result = validate_stream(["Foo: bad\n\n", "body " * 4], fail_fast=fail_fast)
+        assert list(result.actions) == ["generation"]
+
+    def test_bounded_memory(self):
+        """Test that memory is bounded by the paragraphs for a 100 MB message."""
+        paragraph = ("line of a squashed commit " * 40 + "\n") * 1024
+        count = 100 * 1024 * 1024 // len(paragraph)
+
+        def chunks():
+            yield "feat: squash merge\n\n"
+            for _ in range(count):
+                yield paragraph
+                yield "\n"
+
+        tracemalloc.start()
+        try:
+            result = validate_stream(chunks())
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert list(result.actions) == ["validation"]
+        assert peak < 8 * 1024 * 1024
+
+
+@pytest.mark.usefixtures("registry")
+class TestStats:
+    """Tests for the stats of the validation functions."""
+
+    @staticmethod
+    def counters(result):
+        """Get the calls and findings of every step of a result."""
+        return {step: result.stats[step][:2] for step in result.stats}
+
+    def test_not_measured(self):
+        """Test that results keep no stats unless the rules are measured."""
+        assert check(STREAM_MESSAGES[1]).stats is None
+        assert validate_stream(STREAM_MESSAGES[1:2]).stats is None
+
+    def test_check(self):
+        """Test that the parsing and every rule are counted, with their findings."""
+        RuleRegistry.time()
+        result = check(STREAM_MESSAGES[1])
+        counters = self.counters(result)
+        assert list(counters)[:2] == ["parse.subject", "parse.footers"]
+        assert counters["parse.subject"] == (1, 0)
+        assert counters["parse.footers"] == (1, 0)
+        assert counters["subject.type_case"] == (1, 1)
+        assert counters["footer.token_whitespace"] == (1, 0)
+        assert sum(findings for _, findings in counters.values()) == result.count
+
+    def test_parse_failure(self):
+        """Test that messages that do not parse count their failure."""
+        RuleRegistry.time()
+        result = check(STREAM_MESSAGES[2])
+        assert self.counters(result) == {"parse.subject": (1, 1)}
+        result = validate_stream(STREAM_MESSAGES[2:3])
+        assert self.counters(result) == {"parse.subject": (1, 1)}
+
+    @pytest.mark.parametrize("message", STREAM_MESSAGES[:2])
+    def test_stream(self, message):
+        """Test that a message in chunks counts the same steps as the whole one."""
+        RuleRegistry.time()
+        assert self.counters(validate_stream([message])) == self.counters(
+            check(message)
+        )
+
+
+class TestValidateMany:
+    """Tests for clint.validator.validate_many function."""
+
+    def test_one_result_per_message(self, sentence):
+        """Test that every message has its own result, in order."""
+        messages = [f"feat: {sentence[:-1]}", "foo: bar", "feat: description?"]
+        results = list(validate_many(iter(messages)))
+        assert len(results) == len(messages)
+        assert [r.return_code for r in results] == [
+            validate(message=m).return_code for m in messages
+        ]
+
+
+class TestBatchSummary:
+    """Tests for clint.validator.BatchSummary class."""
+
+    @pytest.mark.parametrize("errors", [1, 300])
+    def test_return_code_in_range(self, errors):
+        """Test that the return code does not overflow for many errors."""
+        summary = BatchSummary()
+        for index in range(errors):
+            summary.add(
+                Result(operation="test", base_error_code=0).add_action(
+                    action=f"error_{index}", message="message", is_error=True
+                )
+            )
+        assert summary.failed == errors
+        assert summary.return_code == BatchSummary.FAILURE_CODE
+
+    def test_success(self):
+        """Test that a batch without errors is successful."""
+        summary = BatchSummary()
+        summary.add(Result(operation="test", base_error_code=0))
+        assert summary.total == 1
+        assert summary.return_code == BatchSummary.SUCCESS_CODE
+
+    def test_stats(self):
+        """Test that the stats of every result are merged."""
+        stats = Stats()
+        stats.add("subject.type_case", findings=1, seconds=0.5)
+        summary = BatchSummary()
+        summary.add(Result(operation="test", base_error_code=0))
+        assert summary.stats is None
+        for _ in range(2):
+            result = Result(operation="test", base_error_code=0)
+            result.stats = Stats().merge(stats)
+            summary.add(result)
+        assert summary.stats["subject.type_case"] == (2, 2, 1.0)
@@ -0,0 +1,125 @@
+"""Tests for clint.validator.ResultCache class."""
+import pickle
+
+import pytest
+
+from clint.validator import ResultCache, Subject, validate, validate_many
+
+MESSAGES = ["feat: valid message", "foo: invalid type", "feat: description?"]
+
+
+class TestResultCacheValidate:
+    """Tests for clint.validator.ResultCache.validate method."""
+
+    @pytest.mark.parametrize("message", MESSAGES)
+    def test_same_result(self, message):
+        """Test that memoized results have the same contents as new ones."""
+        cache = ResultCache()
+        first = cache.validate(message=message)
+        second = cache.validate(message=message)
+        assert first.to_dict() == validate(message=message).to_dict()
+        assert second.to_dict() == first.to_dict()
+        assert second is not first
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_copies(self):
+        """Test that changing a returned result does not change the cache."""
+        cache = ResultCache()
+        cache.validate(message=MESSAGES[1]).actions.clear()
+        assert cache.validate(message=MESSAGES[1]).actions
+
+    def test_fail_fast(self):
+        """Test that fail fast results are memoized apart from full ones."""
+        cache = ResultCache()
+        message = "Foo:  bad"
+        assert list(cache.validate(message=message, fail_fast=True).actions) == [
+            "type_case"
+        ]
+        assert list(cache.validate(message=message).actions) == [
+            "type_case",
+            "separator_invalid",
+        ]
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    def test_bytes(self):
+        """Test that raw messages are memoized apart from text ones."""
+        cache = ResultCache()
+        cache.validate(message=MESSAGES[1])
+        result = cache.validate(message=MESSAGES[1].encode("utf8"))
+        assert result.to_dict() == validate(message=MESSAGES[1]).to_dict()
+        assert (cache.hits, cache.misses) == (0, 2)
+        assert cache.get(MESSAGES[1].encode("utf8")) is not None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used results are evicted."""
+        cache = ResultCache(max_size=2)
+        for message in MESSAGES:
+            cache.validate(message=message)
+        assert cache.get(MESSAGES[0]) is None
+        assert cache.get(MESSAGES[2]) is not None
+
+    def test_rules_change(self, mocker):
+        """Test that results are not reused after a rules change."""
+        cache = ResultCache()
+        cache.validate(message="wip: message")
+        mocker.patch.object(
+            Subject, "VALID_COMMIT_TYPES", Subject.VALID_COMMIT_TYPES | {"wip"}
+        )
+        new_cache = ResultCache()
+        assert new_cache.get("wip: message") is None
+
+    def test_registry_change(self, registry):
+        """Test that results are not reused after a change in the registry."""
+        cache = ResultCache()
+        assert list(cache.validate(message="Foo: message").actions) == ["type_case"]
+        registry.disable("type_case")
+        assert cache.get("Foo: message") is None
+        assert list(cache.validate(message="Foo: message").actions) == ["validation"]
+        registry.enable("type_case")
+        assert list(cache.validate(message="Foo: message").actions) == ["type_case"]
+        assert (cache.hits, cache.misses) == (1, 3)
+
+    def test_no_stats(self, registry):
+        """Test that memoized results have no stats, as no rule runs."""
+        registry.time()
+        cache = ResultCache()
+        assert cache.validate(message=MESSAGES[1]).stats is not None
+        assert cache.validate(message=MESSAGES[1]).stats is None
+
+
+class TestResultCacheStore:
+    """Tests for clint.validator.ResultCache on-disk store."""
+
+    def test_shared_store(self, tmp_path):
+        """Test that results are shared between caches with the same store."""
+        path = str(tmp_path / "cache.db")
+        cache = ResultCache(path=path)
+        cache.validate(message=MESSAGES[1])
+        cache.close()
+        other = ResultCache(path=path)
+        result = other.get(MESSAGES[1])
+        other.close()
+        assert result.to_dict() == validate(message=MESSAGES[1]).to_dict()
+        assert other.hits == 1
+
+    def test_pickle(self, tmp_path):
+        """Test that pickled caches resolve to one instance per process."""
+        cache = ResultCache(max_size=10, path=str(tmp_path / "cache.db"))
+        first = pickle.loads(pickle.dumps(cache))
+        second = pickle.loads(pickle.dumps(cache))
+        assert first is second
+        assert (first.max_size, first.path) == (cache.max_size, cache.path)
+        first.close()
+
+
+class TestValidateManyCache:  # pylint: disable=too-few-public-methods
+    """Tests for clint.validator.validate_many function with cache."""
+
+    def test_repeated_messages(self):
+        """Test that repeated messages are validated once."""
+        cache = ResultCache()
+        results = list(validate_many(MESSAGES * 3, cache=cache))
+        assert [r.to_dict() for r in results] == [
+            validate(message=m).to_dict() for m in MESSAGES * 3
+        ]
+        assert (cache.hits, cache.misses) == (6, 3)
@@ -5,7 +5,13 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from clint.validator import Commit, Paragraph, Subject, ValidationException
+from clint.validator import (
+    Commit,
+    GenerationException,
+    Paragraph,
+    Subject,
+    ValidationException,
+)
 
 from .conftest import COMMITS_INFO
 
@@ -39,6 +45,65 @@ class TestCommitGenerate:
             assert isinstance(paragraph, Paragraph)
 
 
+class TestCommitMaxLength:
+    """Tests for clint.validator.Commit.MAX_LENGTH attribute."""
+
+    def test_longer_message(self, mocker):
+        """Test that a message longer than the maximum raises an exception."""
+        mocker.patch.object(Commit, "MAX_LENGTH", 20)
+        with pytest.raises(GenerationException):
+            Commit.generate(msg="feat: test\n\nlong body paragraph")
+
+    def test_longer_subject(self, mocker):
+        """Test that a subject longer than its maximum raises an exception."""
+        mocker.patch.object(Subject, "MAX_LENGTH", 10)
+        with pytest.raises(GenerationException):
+            Commit.generate(msg="feat: long description\n\nbody")
+
+    def test_shorter_message(self, mocker):
+        """Test that a message up to the maximum can be generated."""
+        mocker.patch.object(Commit, "MAX_LENGTH", 16)
+        mocker.patch.object(Subject, "MAX_LENGTH", 10)
+        commit = Commit.generate(msg="feat: test\n\nbody")
+        assert commit.subject.description == "test"
+
+
+class TestCommitDiagnostics:
+    """Tests for positions of clint.validator.Commit.validate findings."""
+
+    def test_paragraph_index(self):
+        """Test that paragraph findings carry the index of the paragraph."""
+        commit = Commit.generate(msg="feat: x\n\nbody\n\nbody\nRefs #1")
+        diagnostics = list(commit.validate().diagnostics())
+        assert [(d.action, d.index) for d in diagnostics] == [("paragraph_ispure", 2)]
+
+
+class TestCommitFailFast:
+    """Tests for clint.validator.Commit.validate method in fail fast mode."""
+
+    def test_first_error(self):
+        """Test that only the first error is registered."""
+        commit = Commit.generate(msg="Foo:  bad\n\nbody\n\nbody\nRefs #1")
+        result = commit.validate(fail_fast=True)
+        assert list(result.actions) == ["type_case"]
+        assert result.return_code == 1
+
+    def test_all_errors(self):
+        """Test that every error is registered without fail fast."""
+        commit = Commit.generate(msg="Foo:  bad\n\nbody\n\nbody\nRefs #1")
+        result = commit.validate()
+        assert list(result.actions) == [
+            "type_case",
+            "separator_invalid",
+            "paragraph_ispure",
+        ]
+
+    def test_compliant(self):
+        """Test that compliant messages get the same result."""
+        commit = Commit.generate(msg="feat: valid\n\nbody")
+        assert commit.validate(fail_fast=True).actions == commit.validate().actions
+
+
 @pytest.mark.usefixtures("mock_subject_validate", "mock_paragraph_validate")
 class TestCommitValidate:
     """Tests for clint.validator.Commit.validate method."""
@@ -48,26 +113,29 @@ class TestCommitValidate:
     mock_subject_validate = MagicMock
     mock_paragraph_validate = MagicMock
 
-    def test_valid_attributes(self, commit, paragraph, mock_clean_validations):
+    def test_valid_attributes(self, mock_clean_validations):
         """Test validation if all attribute validation passes."""
-        commit.paragraphs = (paragraph,)
+        commit = Commit(text="\n\nbody")
+        paragraph = commit.paragraphs[0]
         assert commit.validate()
         commit.subject.validate.assert_called_once()
         paragraph.validate.assert_called_once()
 
-    def test_invalid_subject(self, commit, paragraph, mock_clean_validations):
+    def test_invalid_subject(self, mock_clean_validations):
         """Test validation if subject validation fails."""
         self.mock_subject_validate.side_effect = ValidationException
-        commit.paragraphs = (paragraph,)
+        commit = Commit(text="\n\nbody")
+        paragraph = commit.paragraphs[0]
         with pytest.raises(ValidationException):
             assert commit.validate()
         commit.subject.validate.assert_called_once()
         paragraph.validate.assert_not_called()
 
-    def test_invalid_paragraph(self, commit, paragraph, mock_clean_validations):
+    def test_invalid_paragraph(self, mock_clean_validations):
         """Test validation if subject validation fails."""
         self.mock_paragraph_validate.side_effect = ValidationException
-        commit.paragraphs = (paragraph,)
+        commit = Commit(text="\n\nbody")
+        paragraph = commit.paragraphs[0]
         with pytest.raises(ValidationException):
             assert commit.validate()
         commit.subject.validate.assert_called_once()
@@ -0,0 +1,170 @@
+"""Tests for clint.validator.RuleCompiler class."""
+# pylint: disable=unused-argument
+import itertools
+import os
+
+import pytest
+
+from clint.result import Result
+from clint.validator import Commit, GenerationException, Rule
+
+from .conftest import INVALID_DATA, VALID_DATA
+
+SUBJECTS = [
+    f"{c_type}{scope}{breaking}{separator}description"
+    for c_type, scope, breaking, separator in itertools.product(
+        VALID_DATA["subject"]["types"][:2] + INVALID_DATA["subject"]["types"],
+        VALID_DATA["subject"]["scopes"][:2] + INVALID_DATA["subject"]["scopes"],
+        VALID_DATA["subject"]["breaking_changes"],
+        VALID_DATA["subject"]["separators"] + INVALID_DATA["subject"]["separators"],
+    )
+]
+
+BODIES = VALID_DATA["body"]["texts"] + INVALID_DATA["body"]["texts"]
+
+FOOTERS = [
+    f"{token}{separator}description"
+    for token, separator in itertools.product(
+        VALID_DATA["footer"]["tokens"] + INVALID_DATA["footer"]["tokens"],
+        VALID_DATA["footer"]["separators"] + INVALID_DATA["footer"]["separators"],
+    )
+]
+
+
+def commits():
+    """Get commits with every combination of valid and invalid elements."""
+    messages = [
+        *SUBJECTS,
+        *(f"feat: description\n\n{body}" for body in BODIES),
+        *(f"Feat:  description\n\nbody\n\n{footer}\nRefs #1" for footer in FOOTERS),
+    ]
+    for message in messages:
+        try:
+            yield Commit.generate(msg=message)
+        except GenerationException:
+            pass
+
+
+def results(compiler, monkeypatch, compiled: bool, fail_fast: bool = False):
+    """Get the results of validating every commit, with or without compiling."""
+    function = compiler.compile() if compiled else None
+    monkeypatch.setattr(compiler, "validator", lambda: function)
+    return [commit.validate(fail_fast=fail_fast).to_dict() for commit in commits()]
+
+
+class TestRuleCompilerEquivalence:
+    """Tests for the results of clint.validator.RuleCompiler functions."""
+
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    def test_builtins(self, compiler, monkeypatch, fail_fast):
+        """Test that compiled built-in rules get the same results."""
+        expected = results(compiler, monkeypatch, False, fail_fast)
+        assert len(expected) > 100
+        assert results(compiler, monkeypatch, True, fail_fast) == expected
+
+    def test_inlined(self, compiler, registry):
+        """Test that built-in and house rules are inlined, not called."""
+        registry.enable("ticket_reference")
+        registry.enable("subject_length")
+        _, bindings = compiler.generate()
+        assert all(kind != "check" for kind, _, _ in bindings)
+
+    def test_house_rules(self, compiler, registry, monkeypatch):
+        """Test that compiled house rules get the same results."""
+        registry.enable("ticket_reference")
+        registry.enable("subject_length")
+        registry.configure("subject_length", max_length=20)
+        expected = results(compiler, monkeypatch, False)
+        assert results(compiler, monkeypatch, True) == expected
+
+    def test_disabled(self, compiler, registry, monkeypatch):
+        """Test that disabled rules are not compiled."""
+        registry.disable("type_case")
+        registry.disable("paragraph_empty")
+        expected = results(compiler, monkeypatch, False)
+        assert results(compiler, monkeypatch, True) == expected
+
+    def test_not_inlinable(self, compiler, registry, monkeypatch):
+        """Test that checks that cannot be inlined are called."""
+        calls = []
+
+        def closure(footer, result, index, options):
+            calls.append(footer.token)
+            if footer.token == "Refs":
+                return
+            result.add_action(
+                action="footer_closure",
+                message="Footer '{0}'.",
+                is_error=True,
+                args=(footer.token,),
+                index=index,
+            )
+
+        registry.register(Rule("footer", "footer_closure", closure))
+        registry.register(Rule("message", "noop", lambda *args: calls.append(None)))
+        expected = results(compiler, monkeypatch, False)
+        expected_calls = len(calls)
+        assert results(compiler, monkeypatch, True) == expected
+        assert len(calls) == expected_calls * 2
+
+
+class TestRuleCompilerValidator:
+    """Tests for clint.validator.RuleCompiler.validator method."""
+
+    def test_threshold(self, compiler):
+        """Test that commits use the compiled rules once the threshold is reached."""
+        Commit.compiled()
+        for _ in range(Commit.COMPILE_THRESHOLD - 1):
+            assert Commit.compiled() is None
+        function = Commit.compiled()
+        assert function is compiler.validator()
+        assert Commit.compiled() is function
+
+    def test_registry_change(self, compiler, registry):
+        """Test that registry changes drop the compiled function."""
+        function = compiler.validator()
+        registry.disable("type_case")
+        assert compiler.validator() is not function
+        assert Commit.compiled() is None
+
+    def test_timed(self, compiler, registry):
+        """Test that measured rules are not compiled."""
+        registry.time()
+        assert compiler.validator() is None
+
+
+class TestRuleCompilerCache:
+    """Tests for clint.validator.RuleCompiler caches."""
+
+    def test_memory(self, compiler):
+        """Test that compiled functions are reused by rules digest."""
+        assert compiler.compile() is compiler.compile()
+
+    def test_disk(self, compiler, mocker, tmp_path):
+        """Test that compiled code is reused from disk by rules digest."""
+        compiler.compile()
+        assert len(os.listdir(tmp_path)) == 1
+        mocker.patch.object(compiler, "_functions", {})
+        generate = mocker.patch.object(compiler, "generate")
+        function = compiler.compile()
+        generate.assert_not_called()
+        result = Result(operation="test", base_error_code=0)
+        function(Commit.generate(msg="Feat: description"), result)
+        assert [diagnostic.action for diagnostic in result.diagnostics()] == [
+            "type_case"
+        ]
+
+    def test_corrupted(self, compiler, tmp_path):
+        """Test that corrupted files on disk are compiled again."""
+        compiler.compile()
+        for filename in os.listdir(tmp_path):
+            (tmp_path / filename).write_bytes(b"corrupted")
+        compiler._functions.clear()  # pylint: disable=protected-access
+        assert compiler.compile() is not None
+
+    def test_unwritable(self, compiler, monkeypatch, tmp_path):
+        """Test that rules are compiled even if the directory is not writable."""
+        path = tmp_path / "file"
+        path.write_text("")
+        monkeypatch.setenv(compiler.DIRECTORY_VARIABLE, str(path / "cache"))
+        assert compiler.compile() is not None
@@ -0,0 +1,80 @@
+"""Tests for clint.validator.rules_digest function."""
+from functools import partial
+
+from clint.validator import Commit, Rule, Subject, rules_digest
+
+PARTIAL_PLUGIN = """
+from functools import partial
+
+from clint.validator import Rule, RuleRegistry
+
+
+def type_in(types, subject, result, index, options):
+    if subject.type not in types:
+        result.add_action(action="type_in", message="Type not in.", is_error=True)
+
+
+RuleRegistry.register(Rule("subject", "type_in", partial(type_in, ("feat",))))
+"""
+
+
+class Check:  # pylint: disable=too-few-public-methods
+    """Callable check with a stable representation."""
+
+    def __init__(self, action: str):
+        self.action = action
+
+    def __repr__(self) -> str:
+        """Get the representation of the check, with its action."""
+        return f"Check({self.action!r})"
+
+    def __call__(self, subject, result, index, options):
+        """Register a finding for every subject."""
+        result.add_action(action=self.action, message="Found.", is_error=True)
+
+
+class TestRulesDigest:
+    """Tests for clint.validator.rules_digest function."""
+
+    def test_stable(self):
+        """Test that the digest does not change without rules changes."""
+        assert rules_digest() == rules_digest()
+
+    def test_valid_types(self, mocker):
+        """Test that the digest changes with the valid commit types."""
+        digest = rules_digest()
+        mocker.patch.object(
+            Subject, "VALID_COMMIT_TYPES", Subject.VALID_COMMIT_TYPES | {"wip"}
+        )
+        assert rules_digest() != digest
+
+    def test_validate_code(self, mocker):
+        """Test that the digest changes with the code of the rules."""
+        digest = rules_digest()
+        mocker.patch.object(Subject, "validate", lambda self, result: None)
+        assert rules_digest() != digest
+
+    def test_max_length(self, mocker):
+        """Test that the digest changes with the maximum subject length."""
+        digest = rules_digest()
+        mocker.patch.object(Subject, "MAX_LENGTH", 72)
+        assert rules_digest() != digest
+
+    def test_partial_plugin(self, registry, plugin):
+        """Test that plugin rules with partial checks are digested by arguments."""
+        registry.load_plugins([plugin(PARTIAL_PLUGIN)])
+        digest = rules_digest()
+        assert rules_digest() == digest
+        result = Commit.generate(msg="fix: description").validate()
+        assert list(result.actions) == ["type_in"]
+        rule = registry.snapshot()["subject.type_in"]
+        registry.register(rule._replace(check=partial(rule.check.func, ("fix",))))
+        assert rules_digest() != digest
+
+    def test_callable_check(self, registry):
+        """Test that callable objects are digested by class, code and representation."""
+        registry.register(Rule("subject", "found", Check("found")))
+        digest = rules_digest()
+        assert rules_digest() == digest
+        registry.register(Rule("subject", "found", Check("other")))
+        assert rules_digest() != digest
@@ -0,0 +1,66 @@
+"""Tests for clint.validator.Element class."""
+# pylint: disable=redefined-outer-name
+import pickle
+
+import pytest
+
+from clint.validator import Commit
+
+MESSAGE = "feat(scope)!: description\n\nbody\n\nRefs #123\nBREAKING CHANGE: change"
+
+
+@pytest.fixture
+def elements():
+    """Fixture to create every element of a parsed commit."""
+    commit = Commit.generate(msg=MESSAGE)
+    return [commit, commit.subject, *commit.paragraphs, *commit.paragraphs[1].footers]
+
+
+class TestElementImmutable:
+    """Tests for clint.validator.Element immutability."""
+
+    def test_set_attribute(self, elements):
+        """Test that attributes cannot be changed."""
+        for element in elements:
+            with pytest.raises(AttributeError):
+                element.description = ""
+
+    def test_delete_attribute(self, elements):
+        """Test that attributes cannot be deleted."""
+        for element in elements:
+            with pytest.raises(AttributeError):
+                del element.paragraphs
+
+    def test_no_dict(self, elements):
+        """Test that attributes are kept in slots."""
+        for element in elements:
+            assert not hasattr(element, "__dict__")
+
+
+class TestElementPickle:  # pylint: disable=too-few-public-methods
+    """Tests for clint.validator.Element pickling."""
+
+    def test_roundtrip(self):
+        """Test that a parsed commit keeps its attributes after pickling."""
+        commit = pickle.loads(pickle.dumps(Commit.generate(msg=MESSAGE)))
+        assert commit.subject.scope == "(scope)"
+        assert commit.paragraphs[0].text == "body"
+        assert [footer.token for footer in commit.paragraphs[1].footers] == [
+            "Refs",
+            "BREAKING CHANGE",
+        ]
+
+
+class TestElementInterned:  # pylint: disable=too-few-public-methods
+    """Tests for interned strings of clint.validator elements."""
+
+    def test_same_objects(self):
+        """Test that types, scopes and tokens of different commits are shared."""
+        first = Commit.generate(msg="".join(MESSAGE))
+        second = Commit.generate(msg="".join(list(MESSAGE)))
+        assert first.subject.type is second.subject.type
+        assert first.subject.scope is second.subject.scope
+        for footer, other in zip(
+            first.paragraphs[1].footers, second.paragraphs[1].footers
+        ):
+            assert footer.token is other.token
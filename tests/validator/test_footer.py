@@ -5,7 +5,7 @@ import pytest
 from clint.result import Result
 from clint.validator import Footer, GenerationException
 
-from .conftest import INVALID_DATA, VALID_DATA
+from .conftest import INVALID_DATA, VALID_DATA, assert_linear
 
 
 class TestFooterGenerate:
@@ -28,46 +28,135 @@ class TestFooterGenerate:
             Footer.generate(msg="")
 
 
+class TestFooterMatch:
+    """Tests for clint.validator.Footer.match method."""
+
+    def test_region_match(self, sentence):
+        """Test that a footer can be matched inside a region of a message."""
+        message = f"{sentence}\ntoken: {sentence}\n{sentence}"
+        start = message.index("token")
+        end = message.index("\n", start)
+        footer = Footer.match(message, start, end)
+        assert isinstance(footer, Footer)
+        assert footer.token == "token"
+        assert footer.description == sentence
+
+    def test_no_match(self):
+        """Test that a line that is not a footer does not raise an exception."""
+        assert Footer.match("") is None
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda size: "a" * size + " ",
+            lambda size: "a-" * (size // 2) + ":",
+            lambda size: "token:" + " " * size + "?",
+        ],
+    )
+    def test_linear_time(self, build):
+        """Test that adversarial footers are matched in linear time."""
+        assert_linear(Footer.match, build)
+
+    @pytest.mark.parametrize(
+        "template",
+        ["{0}oken: description", "to{0}en: description", "token:{0}description"]
+        + ["token{0}#description", "token: desc{0}ription"],
+    )
+    def test_ascii_pattern(self, template):
+        """Test that ASCII footers match the same groups with both patterns."""
+        for char in map(chr, range(128)):
+            message = template.format(char)
+            expected = Footer.PATTERN.match(message)
+            match = Footer.ASCII_PATTERN.match(message)
+            assert (match and match.groupdict()) == (
+                expected and expected.groupdict()
+            ), repr(char)
+
+    def test_unicode_pattern(self):
+        """Test that footers that are not ASCII match with the Unicode pattern."""
+        footer = Footer.match("Revisó: José Pérez")
+        assert (footer.token, footer.description) == ("Revisó", "José Pérez")
+
+
 class TestFooterValidate:
     """Tests for clint.validator.Footer.validate method."""
 
     @pytest.mark.parametrize("token", VALID_DATA["footer"]["tokens"])
     @pytest.mark.parametrize("separator", VALID_DATA["footer"]["separators"])
-    def test_valid_footer(self, token, separator, sentence, footer):
+    def test_valid_footer(self, token, separator, sentence):
         """Test that all correct messages can generate a new footer object."""
-        footer.token = token
-        footer.separator = separator
-        footer.description = sentence
+        footer = Footer(
+            token=token,
+            separator=separator,
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         footer.validate(result=result)
         assert result.return_code == 0
 
     @pytest.mark.parametrize("token", INVALID_DATA["footer"]["tokens"])
-    def test_invalid_token(self, token, sentence, footer):
+    def test_invalid_token(self, token, sentence):
         """Test that invalid token raises an exception."""
-        footer.token = token
-        footer.separator = VALID_DATA["footer"]["separators"][0]
-        footer.description = sentence
+        footer = Footer(
+            token=token,
+            separator=VALID_DATA["footer"]["separators"][0],
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         footer.validate(result=result)
         assert result.return_code == 1
 
     @pytest.mark.parametrize("separator", INVALID_DATA["footer"]["separators"])
-    def test_invalid_separator(self, separator, sentence, footer):
+    def test_invalid_separator(self, separator, sentence):
         """Test that invalid separator raises an exception."""
-        footer.token = VALID_DATA["footer"]["tokens"][0]
-        footer.separator = separator
-        footer.description = sentence
+        footer = Footer(
+            token=VALID_DATA["footer"]["tokens"][0],
+            separator=separator,
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         footer.validate(result=result)
         assert result.return_code == 1
 
     @pytest.mark.parametrize("description", INVALID_DATA["footer"]["descriptions"])
-    def test_invalid_description(self, description, footer):
+    def test_invalid_description(self, description):
         """Test that invalid separator raises an exception."""
-        footer.token = VALID_DATA["footer"]["tokens"][0]
-        footer.separator = VALID_DATA["footer"]["separators"][0]
-        footer.description = description
+        footer = Footer(
+            token=VALID_DATA["footer"]["tokens"][0],
+            separator=VALID_DATA["footer"]["separators"][0],
+            description=description,
+        )
         result = Result(operation="test", base_error_code=0)
         footer.validate(result=result)
         assert result.return_code == 1
+
+    def test_repeated_action(self, sentence):
+        """Test that every whitespace in the token is reported."""
+        footer = Footer(
+            token="bad token\twith tab", separator=": ", description=sentence
+        )
+        result = Result(operation="test", base_error_code=0)
+        footer.validate(result=result, index=2)
+        diagnostics = list(result.diagnostics())
+        assert [d.action for d in diagnostics] == ["token_whitespace"] * 2
+        assert {d.index for d in diagnostics} == {2}
+        assert {d.span for d in diagnostics} == {(0, 18)}
+        assert result.return_code == 2
+
+
+class TestFooterSpan:
+    """Tests for clint.validator.Footer.span method."""
+
+    def test_matched_footer(self):
+        """Test that spans are offsets in the paragraph of the footer."""
+        text = "body\nRefs #123"
+        footer = Footer.match(text, text.index("Refs"))
+        assert footer.span("token") == (5, 9)
+        assert footer.span("separator") == (9, 11)
+        assert footer.span("description") == (11, 14)
+
+    def test_empty_attribute(self):
+        """Test that empty attributes have empty spans."""
+        footer = Footer(token="", separator="", description="text")
+        assert footer.span("separator") == (0, 0)
+        assert footer.span("description") == (0, 4)
@@ -31,17 +31,17 @@ class TestParagraphValidate:
     """Tests for clint.validator.Paragraph.validate method."""
 
     @pytest.mark.parametrize("text", VALID_DATA["body"]["texts"])
-    def test_valid_paragraph(self, text, paragraph):
+    def test_valid_paragraph(self, text):
         """Test that all correct messages can generate a new paragraph object."""
-        paragraph.text = text
+        paragraph = Paragraph(text=text)
         result = Result(operation="test", base_error_code=0)
         paragraph.validate(result=result)
         assert result.return_code == 0
 
     @pytest.mark.parametrize("text", INVALID_DATA["body"]["texts"])
-    def test_invalid_text(self, text, paragraph):
+    def test_invalid_text(self, text):
         """Test that invalid text raises an exception."""
-        paragraph.text = text
+        paragraph = Paragraph(text=text)
         result = Result(operation="test", base_error_code=0)
         paragraph.validate(result=result)
         assert result.return_code == 1
@@ -0,0 +1,85 @@
+"""Tests for clint.validator.ParallelValidator class."""
+import multiprocessing
+
+import pytest
+
+from clint.validator import Commit, ParallelValidator, validate, validate_many
+
+MESSAGES = [
+    "feat: valid message",
+    "foo: invalid type",
+    "fix(scope)!: breaking change",
+    "feat: invalid description?",
+] * 50
+
+
+def dump(result):
+    """Get comparable values of a result."""
+    return result.return_code, result.actions
+
+
+@pytest.fixture(name="small_pool")
+def fixture_small_pool(mocker):
+    """Fixture to make the pool start with small inputs and chunks."""
+    mocker.patch.object(ParallelValidator, "SERIAL_THRESHOLD", 20)
+    mocker.patch.object(ParallelValidator, "MIN_CHUNK_SIZE", 3)
+    mocker.patch.object(ParallelValidator, "MAX_CHUNK_SIZE", 7)
+
+
+class TestParallelValidatorMap:
+    """Tests for clint.validator.ParallelValidator.map method."""
+
+    @pytest.mark.usefixtures("small_pool")
+    def test_ordered(self):
+        """Test that ordered results are the same as serial results."""
+        results = ParallelValidator(jobs=2).map(validate, iter(MESSAGES))
+        assert [dump(r) for r in results] == [dump(validate(m)) for m in MESSAGES]
+
+    @pytest.mark.usefixtures("small_pool")
+    def test_unordered(self):
+        """Test that unordered results contain every serial result."""
+        results = ParallelValidator(jobs=2, ordered=False).map(validate, MESSAGES)
+        assert sorted(dump(r)[0] for r in results) == sorted(
+            dump(validate(m))[0] for m in MESSAGES
+        )
+
+    def test_serial_fallback(self, mocker):
+        """Test that small inputs do not start the process pool."""
+        mock_executor = mocker.patch("concurrent.futures.ProcessPoolExecutor")
+        results = ParallelValidator(jobs=2).map(validate, MESSAGES[:10])
+        assert [dump(r) for r in results] == [dump(validate(m)) for m in MESSAGES[:10]]
+        assert not mock_executor.called
+
+    def test_all_cpus(self, mocker):
+        """Test that zero jobs means one job per CPU."""
+        mocker.patch("clint.validator.parallel.os.cpu_count", return_value=32)
+        assert ParallelValidator(jobs=0).jobs == 32
+
+
+@pytest.fixture(name="spawn")
+def fixture_spawn():
+    """Fixture to start worker processes without copying this process."""
+    method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method("spawn", force=True)
+    yield
+    multiprocessing.set_start_method(method, force=True)
+
+
+class TestValidateManyJobs:
+    """Tests for clint.validator.validate_many function with jobs."""
+
+    @pytest.mark.usefixtures("small_pool")
+    def test_parallel(self):
+        """Test that parallel validation keeps the input order."""
+        results = validate_many(MESSAGES, jobs=2)
+        assert [dump(r) for r in results] == [dump(validate(m)) for m in MESSAGES]
+
+    @pytest.mark.usefixtures("small_pool", "spawn")
+    def test_parent_rules(self, registry, monkeypatch):
+        """Test that spawned workers validate with the rules of this process."""
+        registry.configure("subject.type_valid", types=("foo",))
+        registry.configure("subject.subject_length", max_length=20)
+        registry.enable("subject.subject_length")
+        monkeypatch.setattr(Commit, "MAX_LENGTH", 24)
+        results = validate_many(MESSAGES, jobs=2)
+        assert [dump(r) for r in results] == [dump(validate(m)) for m in MESSAGES]
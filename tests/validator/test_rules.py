@@ -0,0 +1,170 @@
+"""Tests for clint.validator.RuleRegistry class."""
+# pylint: disable=unused-argument
+import pytest
+
+from clint.validator import Commit, Rule, RuleException, rules_digest
+
+GOOD_MESSAGE = "feat(scope): description\n\nbody\n\nRefs #123"
+BAD_MESSAGE = "Foo:  bad\n\nline\nRefs: x"
+
+
+def actions(message: str, fail_fast: bool = False):
+    """Get the actions of every diagnostic of a message validation."""
+    result = Commit.generate(msg=message).validate(fail_fast=fail_fast)
+    return [diagnostic.action for diagnostic in result.diagnostics()]
+
+
+class TestRuleRegistryBuiltins:
+    """Tests for the built-in rules of clint.validator.RuleRegistry."""
+
+    def test_targets(self, registry):
+        """Test that built-in rules are sorted by target."""
+        targets = [rule.target for rule in registry.rules()]
+        assert targets == sorted(
+            targets, key=["bytes", "subject", "paragraph", "footer", "message"].index
+        )
+
+    def test_order(self, registry):
+        """Test that built-in rules keep the order of the findings."""
+        assert actions(BAD_MESSAGE) == [
+            "type_case",
+            "separator_invalid",
+            "paragraph_ispure",
+        ]
+
+    def test_house_rules_disabled(self, registry):
+        """Test that house rules do not run by default."""
+        rules = {rule.name: rule for rule in registry.rules()}
+        assert not rules["subject.subject_length"].enabled
+        assert not rules["message.ticket_reference"].enabled
+        assert actions("feat: " + "a" * 100) == ["validation"]
+
+
+class TestRuleRegistryEnable:
+    """Tests for clint.validator.RuleRegistry enable and disable methods."""
+
+    def test_disable(self, registry):
+        """Test that disabled rules do not run."""
+        registry.disable("subject.type_case")
+        assert actions(BAD_MESSAGE) == ["separator_invalid", "paragraph_ispure"]
+
+    def test_disable_action(self, registry):
+        """Test that an action name disables the rules of every target."""
+        registry.disable("description_empty")
+        assert all(
+            not rule.enabled
+            for rule in registry.rules()
+            if rule.action == "description_empty"
+        )
+        assert actions("feat: \n\nRefs: ") == ["validation"]
+
+    def test_enable(self, registry):
+        """Test that enabled house rules run."""
+        registry.enable("ticket_reference")
+        assert actions(GOOD_MESSAGE) == ["validation"]
+        assert actions("feat: description\n\nCloses #123") == ["ticket_reference"]
+
+    def test_unknown(self, registry):
+        """Test that unknown rules are rejected."""
+        with pytest.raises(RuleException):
+            registry.disable("foo")
+
+
+class TestRuleRegistryRegister:
+    """Tests for clint.validator.RuleRegistry register methods."""
+
+    def test_decorator(self, registry):
+        """Test that decorated checks run with their options."""
+
+        @registry.rule(target="footer", action="token_case", options={"case": "lower"})
+        def token_case(footer, result, index, options):
+            if not getattr(footer.token, f"is{options['case']}")():
+                result.add_action(
+                    action="token_case",
+                    message="Token '{0}' is not {1}case.",
+                    is_error=True,
+                    args=(footer.token, options["case"]),
+                    index=index,
+                    span=footer.span("token"),
+                )
+
+        assert actions(GOOD_MESSAGE) == ["token_case"]
+        registry.configure("footer.token_case", case="title")
+        assert actions(GOOD_MESSAGE) == ["validation"]
+
+    def test_cost(self, registry):
+        """Test that cheaper rules of a target run first."""
+        calls = []
+        registry.register(
+            Rule("subject", "expensive", lambda *args: calls.append("e"), cost=5)
+        )
+        registry.register(
+            Rule("subject", "cheap", lambda *args: calls.append("c"), cost=0)
+        )
+        actions(GOOD_MESSAGE)
+        assert calls == ["c", "e"]
+
+    def test_fail_fast(self, registry):
+        """Test that message rules stop at the first error."""
+        registry.enable("ticket_reference")
+        registry.enable("subject_length")
+        registry.configure("subject_length", max_length=10)
+        assert actions("feat: description", fail_fast=True) == ["subject_length"]
+        assert actions("feat: description") == ["subject_length", "ticket_reference"]
+
+    def test_invalid_target(self, registry):
+        """Test that rules with unknown targets are rejected."""
+        with pytest.raises(RuleException):
+            registry.register(Rule("body", "foo", lambda *args: None))
+
+    def test_unregister(self, registry):
+        """Test that unregistered rules do not run."""
+        registry.unregister("type_case")
+        assert "type_case" not in actions(BAD_MESSAGE)
+
+    def test_digest(self, registry):
+        """Test that the rules digest changes with the rules configuration."""
+        digest = rules_digest()
+        registry.configure("subject_length", max_length=50)
+        assert rules_digest() != digest
+
+    def test_plugins(self, registry, monkeypatch):
+        """Test that plugin modules listed in the environment are imported."""
+        monkeypatch.setattr(registry, "_plugins_loaded", False)
+        monkeypatch.setenv(registry.PLUGINS_VARIABLE, "clint.not_a_plugin")
+        with pytest.raises(RuleException):
+            registry.rules()
+
+    def test_restore(self, registry):
+        """Test that rules registered after a snapshot are unregistered."""
+        snapshot = registry.snapshot()
+        registry.register(Rule("subject", "foo", lambda *args: None))
+        registry.restore(snapshot)
+        assert "subject.foo" not in [rule.name for rule in registry.rules()]
+
+    def test_plugins_reload(self, registry, plugin):
+        """Test that plugin rules are registered again when loaded again."""
+        name = plugin()
+        snapshot = registry.snapshot()
+        registry.load_plugins([name])
+        assert "no_wip" in actions("wip: description")
+        registry.restore(snapshot)
+        assert "no_wip" not in actions("wip: description")
+        registry.load_plugins([name])
+        assert "no_wip" in actions("wip: description")
+
+
+class TestRuleRegistryTime:  # pylint: disable=too-few-public-methods
+    """Tests for clint.validator.RuleRegistry time methods."""
+
+    def test_timings(self, registry):
+        """Test that every run rule is measured."""
+        registry.time()
+        actions(GOOD_MESSAGE)
+        timings = registry.timings()
+        assert timings["subject.type_empty"][0] == 1
+        assert timings["paragraph.paragraph_empty"][0] == 2
+        assert timings["footer.token_whitespace"][0] == 1
+        assert "message.ticket_reference" not in timings
+        registry.time(enabled=False)
+        assert registry.timings() == {}
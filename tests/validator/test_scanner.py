@@ -0,0 +1,72 @@
+"""Tests for clint.validator.scanner.Scanner class."""
+import pytest
+
+from clint.validator.scanner import Scanner
+
+from .conftest import COMMITS_INFO, VALID_DATA
+
+MESSAGES = [info["msg"] for info in COMMITS_INFO] + [
+    "\n",
+    "subject\n\n\nparagraph",
+    "subject\n\n\n\nparagraph\n\n",
+    "subject\n\nline-1\nline-2\n\nline-3",
+]
+
+
+class TestScannerParagraphs:  # pylint: disable=too-few-public-methods
+    """Tests for clint.validator.scanner.Scanner.paragraphs method."""
+
+    @pytest.mark.parametrize("msg", MESSAGES)
+    def test_same_as_split(self, msg):
+        """Test that paragraph spans are the same as splitting the message."""
+        paragraphs = [msg[start:end] for start, end in Scanner.paragraphs(msg)]
+        assert paragraphs == msg.rstrip("\n").split("\n\n")
+
+
+def chunked(msg, size):
+    """Get the chunks of a message, of the given size."""
+    return [msg[index : index + size] for index in range(0, len(msg), size)]
+
+
+class TestScannerStreamParagraphs:  # pylint: disable=too-few-public-methods
+    """Tests for clint.validator.scanner.Scanner.stream_paragraphs method."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 1024])
+    @pytest.mark.parametrize("msg", MESSAGES)
+    def test_same_as_paragraphs(self, msg, size):
+        """Test that paragraphs of any chunks are the ones of the message spans."""
+        paragraphs = [msg[start:end] for start, end in Scanner.paragraphs(msg)]
+        assert list(Scanner.stream_paragraphs(chunked(msg, size))) == paragraphs
+
+
+class TestScannerStripChunks:
+    """Tests for clint.validator.scanner.Scanner.strip_chunks method."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3])
+    @pytest.mark.parametrize("msg", [" \n feat: a \n\n b \t\n", "\n \n", "a"])
+    def test_same_as_strip(self, msg, size):
+        """Test that stripped chunks make the same message as stripping it."""
+        assert "".join(Scanner.strip_chunks(chunked(msg, size))) == msg.strip()
+
+    def test_trailing_chars(self):
+        """Test that only trailing characters are removed if not leading."""
+        chunks = Scanner.strip_chunks(["\nfeat: a\n", "\n", "\n"], "\n", False)
+        assert list(chunks) == ["\nfeat: a"]
+
+
+class TestScannerLines:
+    """Tests for clint.validator.scanner.Scanner.lines method."""
+
+    @pytest.mark.parametrize("text", VALID_DATA["body"]["texts"] + MESSAGES)
+    def test_same_as_split(self, text):
+        """Test that line spans are the same as splitting the text."""
+        lines = [text[start:end] for start, end in Scanner.lines(text)]
+        assert lines == text.split("\n")
+
+    def test_region(self):
+        """Test that only the lines inside the region are generated."""
+        text = "before\n\nline-1\nline-2\n\nafter"
+        start = text.index("line-1")
+        end = text.index("\n\nafter")
+        lines = [text[s:e] for s, e in Scanner.lines(text, start, end)]
+        assert lines == ["line-1", "line-2"]
@@ -3,9 +3,9 @@
 import pytest
 
 from clint.result import Result
-from clint.validator import Subject
+from clint.validator import GenerationException, Subject
 
-from .conftest import INVALID_DATA, VALID_DATA
+from .conftest import INVALID_DATA, VALID_DATA, assert_linear
 
 
 class TestSubjectGenerate:
@@ -35,6 +35,76 @@ class TestSubjectGenerate:
         assert subject.separator == ""
         assert subject.description == ""
 
+    def test_invalid_generation(self):
+        """Test that a non matching message raises an exception."""
+        with pytest.raises(GenerationException):
+            Subject.generate("feat: description?")
+
+
+class TestSubjectMatch:
+    """Tests for clint.validator.Subject.match method."""
+
+    def test_region_match(self, sentence):
+        """Test that a subject can be matched inside a region of a message."""
+        message = f"feat: {sentence}\n\n{sentence}"
+        subject = Subject.match(message, 0, message.index("\n"))
+        assert isinstance(subject, Subject)
+        assert subject.type == "feat"
+        assert subject.description == sentence
+
+    def test_no_match(self):
+        """Test that a non matching message does not raise an exception."""
+        assert Subject.match("feat: description?") is None
+
+    @pytest.mark.parametrize(
+        "build",
+        [
+            lambda size: "a" * size + "!?",
+            lambda size: "feat(" + "a" * size + "!",
+            lambda size: "feat:" + " " * size + "?",
+            lambda size: "feat: " + "a " * (size // 2) + "?",
+        ],
+    )
+    def test_linear_time(self, build):
+        """Test that adversarial subjects are matched in linear time."""
+        assert_linear(Subject.match, build)
+
+    @pytest.mark.parametrize(
+        "template",
+        ["{0}eat(scope)!: description", "feat(sc{0}pe): description"]
+        + ["feat:{0}description", "feat: desc{0}ription"],
+    )
+    def test_ascii_pattern(self, template):
+        """Test that ASCII subjects match the same groups with both patterns."""
+        for char in map(chr, range(128)):
+            message = template.format(char)
+            expected = Subject.PATTERN.match(message)
+            match = Subject.ASCII_PATTERN.match(message)
+            assert (match and match.groupdict()) == (
+                expected and expected.groupdict()
+            ), repr(char)
+
+    def test_unicode_pattern(self):
+        """Test that subjects that are not ASCII match with the Unicode pattern."""
+        subject = Subject.match("feat(ñandú): añade más cosas")
+        assert (subject.scope, subject.description) == ("(ñandú)", "añade más cosas")
+
+
+class TestSubjectMaxLength:
+    """Tests for clint.validator.Subject.MAX_LENGTH attribute."""
+
+    def test_longer_subject(self, mocker):
+        """Test that a subject longer than the maximum raises an exception."""
+        mocker.patch.object(Subject, "MAX_LENGTH", 10)
+        with pytest.raises(GenerationException):
+            Subject.generate("feat: long description")
+
+    def test_shorter_subject(self, mocker):
+        """Test that a subject up to the maximum can be generated."""
+        mocker.patch.object(Subject, "MAX_LENGTH", 10)
+        subject = Subject.generate("feat: test")
+        assert subject.description == "test"
+
 
 class TestSubjectValidate:
     """Tests for clint.validator.Subject.validate method."""
@@ -43,54 +113,95 @@ class TestSubjectValidate:
     @pytest.mark.parametrize("scope", VALID_DATA["subject"]["scopes"])
     @pytest.mark.parametrize("breaking", VALID_DATA["subject"]["breaking_changes"])
     @pytest.mark.parametrize("separator", VALID_DATA["subject"]["separators"])
-    def test_valid_subject(self, c_type, scope, breaking, separator, sentence, subject):
+    def test_valid_subject(self, c_type, scope, breaking, separator, sentence):
         """Test that all correct messages pass the validation."""
-        subject.type = c_type
-        subject.scope = scope
-        subject.breaking = breaking
-        subject.separator = separator
-        subject.description = sentence
+        subject = Subject(
+            c_type=c_type,
+            scope=scope,
+            breaking=breaking,
+            separator=separator,
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         subject.validate(result=result)
         assert result.return_code == 0
 
     @pytest.mark.parametrize("c_type", INVALID_DATA["subject"]["types"])
-    def test_invalid_type(self, c_type, sentence, subject):
+    def test_invalid_type(self, c_type, sentence):
         """Test that invalid type raises an exception."""
-        subject.type = c_type
-        subject.separator = VALID_DATA["subject"]["separators"][0]
-        subject.description = sentence
+        subject = Subject(
+            c_type=c_type,
+            scope="",
+            breaking="",
+            separator=VALID_DATA["subject"]["separators"][0],
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         subject.validate(result=result)
         assert result.return_code == 1
 
     @pytest.mark.parametrize("scope", INVALID_DATA["subject"]["scopes"])
-    def test_invalid_scope(self, scope, sentence, subject):
+    def test_invalid_scope(self, scope, sentence):
         """Test that invalid scope raises an exception."""
-        subject.type = VALID_DATA["subject"]["types"][0]
-        subject.scope = scope
-        subject.separator = VALID_DATA["subject"]["separators"][0]
-        subject.description = sentence
+        subject = Subject(
+            c_type=VALID_DATA["subject"]["types"][0],
+            scope=scope,
+            breaking="",
+            separator=VALID_DATA["subject"]["separators"][0],
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         subject.validate(result=result)
         assert result.return_code == 1
 
     @pytest.mark.parametrize("separator", INVALID_DATA["subject"]["separators"])
-    def test_invalid_separator(self, separator, sentence, subject):
+    def test_invalid_separator(self, separator, sentence):
         """Test that invalid separator raises an exception."""
-        subject.type = VALID_DATA["subject"]["types"][0]
-        subject.separator = separator
-        subject.description = sentence
+        subject = Subject(
+            c_type=VALID_DATA["subject"]["types"][0],
+            scope="",
+            breaking="",
+            separator=separator,
+            description=sentence,
+        )
         result = Result(operation="test", base_error_code=0)
         subject.validate(result=result)
         assert result.return_code == 1
 
     @pytest.mark.parametrize("description", INVALID_DATA["subject"]["descriptions"])
-    def test_invalid_description(self, description, subject):
+    def test_invalid_description(self, description):
         """Test that invalid description raises an exception."""
-        subject.type = VALID_DATA["subject"]["types"][0]
-        subject.separator = VALID_DATA["subject"]["separators"][0]
-        subject.description = description
+        subject = Subject(
+            c_type=VALID_DATA["subject"]["types"][0],
+            scope="",
+            breaking="",
+            separator=VALID_DATA["subject"]["separators"][0],
+            description=description,
+        )
         result = Result(operation="test", base_error_code=0)
         subject.validate(result=result)
         assert result.return_code == 1
+
+
+class TestSubjectSpan:
+    """Tests for clint.validator.Subject.span method."""
+
+    def test_full_subject(self):
+        """Test that spans are the columns of every attribute."""
+        subject = Subject.generate("feat(scope)!: description")
+        assert subject.span("type") == (0, 4)
+        assert subject.span("scope") == (4, 11)
+        assert subject.span("breaking") == (11, 12)
+        assert subject.span("separator") == (12, 14)
+        assert subject.span("description") == (14, 25)
+
+    def test_validation_span(self):
+        """Test that validation findings carry the span of the attribute."""
+        subject = Subject.generate("Feat: description")
+        result = Result(operation="test", base_error_code=0)
+        subject.validate(result=result)
+        diagnostic = next(result.diagnostics())
+        assert diagnostic.action == "type_case"
+        assert diagnostic.message == "Type 'Feat' is not lowercase."
+        assert diagnostic.index == 0
+        assert diagnostic.span == (0, 4)